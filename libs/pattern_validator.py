@@ -1,6 +1,7 @@
 import re
+import threading
 import time
-from typing import List, Dict, Optional, Tuple, Any
+from typing import List, Dict, Optional, Tuple, Any, Pattern, Match
 from datetime import datetime
 import logging
 from dataclasses import dataclass
@@ -97,15 +98,20 @@ class PatternValidator:
             if match:
                 result.success = True
                 result.matched_data = data
-                result.extracted_values = {
-                    'full_match': match.group(0),
-                    'groups': match.groups(),
-                    'groupdict': match.groupdict()
-                }
+                result.extracted_values = self._regex_match_values(match)
         except re.error as e:
             result.error_message = f"Invalid regex pattern: {e}"
         return result
     
+    @staticmethod
+    def _regex_match_values(match: Match) -> Dict[str, Any]:
+        """Values extracted by a regex match."""
+        return {
+            'full_match': match.group(0),
+            'groups': match.groups(),
+            'groupdict': match.groupdict()
+        }
+    
     def _validate_exact(self, data: str, pattern: str, result: ValidationResult) -> ValidationResult:
         """Validate exact match pattern."""
         if data.strip() == pattern.strip():
@@ -181,18 +187,22 @@ class PatternValidator:
         return results
     
     def wait_for_pattern_in_stream(self, uart_handler, pattern_config: Dict, 
-                                 timeout: float = 10.0) -> Optional[ValidationResult]:
+                                 timeout: float = 10.0,
+                                 stop_event: Optional[threading.Event] = None) -> Optional[ValidationResult]:
         """
         Wait for a pattern to appear in UART data stream.
         
         :param uart_handler: UARTHandler instance
         :param pattern_config: Pattern configuration dictionary
         :param timeout: Maximum time to wait
+        :param stop_event: Optional event that ends the wait early when set
         :return: ValidationResult if pattern found, None if timeout
         """
         start_time = time.time()
         
         while time.time() - start_time < timeout:
+            if stop_event is not None and stop_event.is_set():
+                return self._stopped_result(pattern_config.get('name', 'unknown'))
             data_entry = uart_handler.read_data(timeout=0.1)
             if data_entry:
                 result = self.validate_pattern(data_entry['data'], pattern_config)
@@ -208,6 +218,65 @@ class PatternValidator:
         )
         return timeout_result
     
+    def wait_for_regex_in_stream(self, uart_handler, pattern_name: str, regex: Pattern,
+                                 timeout: float = 10.0,
+                                 stop_event: Optional[threading.Event] = None) -> Optional[ValidationResult]:
+        """
+        Wait for a compiled regex to match a line in the UART data stream.
+        
+        Unlike wait_for_pattern_in_stream, lines that do not match are not
+        recorded in the validation history.
+        
+        :param uart_handler: UARTHandler instance
+        :param pattern_name: Pattern name for the result
+        :param regex: Compiled regex searched in each received line
+        :param timeout: Maximum time to wait
+        :param stop_event: Optional event that ends the wait early when set
+        :return: ValidationResult for the matching line, or a timeout or stopped result
+        """
+        search = regex.search
+        start_time = time.time()
+        
+        while time.time() - start_time < timeout:
+            if stop_event is not None and stop_event.is_set():
+                return self._stopped_result(pattern_name)
+            data_entry = uart_handler.read_data(timeout=0.1)
+            if data_entry:
+                data = data_entry['data']
+                match = search(data)
+                if match:
+                    result = ValidationResult(
+                        pattern_name=pattern_name,
+                        success=True,
+                        matched_data=data,
+                        match_time=datetime.now(),
+                        extracted_values=self._regex_match_values(match)
+                    )
+                    self.validation_history.append(result)
+                    return result
+        
+        # Timeout reached
+        return ValidationResult(
+            pattern_name=pattern_name,
+            success=False,
+            timeout_reached=True,
+            error_message=f"Pattern not found within {timeout} seconds"
+        )
+    
+    @staticmethod
+    def _stopped_result(pattern_name: str) -> ValidationResult:
+        """
+        Build the result of a wait ended by a stop request.
+        
+        :param pattern_name: Pattern name for the result
+        :return: Failed ValidationResult with a "Test stopped" error
+        """
+        return ValidationResult(
+            pattern_name=pattern_name,
+            success=False,
+            error_message="Test stopped"
+        )
+    
     def get_validation_summary(self) -> Dict:
         """
         Get summary of validation history.
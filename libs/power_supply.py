@@ -1,8 +1,12 @@
+import asyncio
 import serial
 import time
 import logging
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import partial
 
 # Configure logging for power supply operations
 def setup_power_supply_logging(log_level=logging.INFO, log_file=None):
@@ -50,7 +54,52 @@ except ImportError:
     PYVISA_AVAILABLE = False
     power_supply_logger.warning("PyVISA not available. GPIB support disabled.")
 
+class CycleResults(list):
+    """
+    List of per-cycle result dictionaries that keeps running totals as cycles are recorded.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.completed = 0
+        self.failed = 0
+        self.total_duration = 0.0
+
+    def record_success(self, cycle_result):
+        """
+        Append a successful cycle result and update the running totals.
+
+        :param cycle_result: Cycle result dictionary containing 'total_duration'
+        """
+        self.append(cycle_result)
+        self.completed += 1
+        self.total_duration += cycle_result['total_duration']
+
+    def record_error(self, cycle_result):
+        """
+        Append a failed cycle result and update the running totals.
+
+        :param cycle_result: Cycle result dictionary containing 'error'
+        """
+        self.append(cycle_result)
+        self.failed += 1
+
+    @property
+    def executed(self):
+        """Number of cycles executed, successful or not."""
+        return self.completed + self.failed
+
+    @property
+    def mean_duration(self):
+        """Mean duration in seconds of the successful cycles."""
+        return self.total_duration / self.completed if self.completed else 0.0
+
+
 class KeysightE3632A_RS232:
+    # SCPI setpoint command templates, formatted once per call with %
+    VOLT_COMMAND = "VOLT %s"
+    CURR_COMMAND = "CURR %s"
+
     def __init__(self, port, baud_rate=9600, timeout=1):
         """
         Initialize the RS-232 connection to the Keysight E3632A.
@@ -64,7 +113,7 @@ class KeysightE3632A_RS232:
         self.baud_rate = baud_rate
         self.timeout = timeout
         
-        self.logger.info(f"Initializing RS232 connection to {port} at {baud_rate} baud")
+        self.logger.info("Initializing RS232 connection to %s at %s baud", port, baud_rate)
         
         try:
             self.serial = serial.Serial(
@@ -75,10 +124,11 @@ class KeysightE3632A_RS232:
                 stopbits=serial.STOPBITS_ONE,
                 timeout=timeout,
             )
-            self.logger.info(f"Successfully connected to {port} at {baud_rate} baud")
+            self.connected = True
+            self.logger.info("Successfully connected to %s at %s baud", port, baud_rate)
             print(f"Connected to {port} at {baud_rate} baud.")
         except serial.SerialException as e:
-            self.logger.error(f"Failed to connect to {port}: {e}")
+            self.logger.error("Failed to connect to %s: %s", port, e)
             raise ConnectionError(f"Failed to connect to {port}: {e}")
 
     def send_command(self, command):
@@ -87,7 +137,7 @@ class KeysightE3632A_RS232:
 
         :param command: The SCPI command string to send (e.g., "VOLT 5").
         """
-        self.logger.debug(f"Sending SCPI command: {command}")
+        self.logger.debug("Sending SCPI command: %s", command)
         full_command = command + "\n"
         self.serial.write(full_command.encode('ascii'))
         time.sleep(0.1)  # Small delay to allow processing
@@ -99,7 +149,7 @@ class KeysightE3632A_RS232:
         :return: The response string.
         """
         response = self.serial.readline().decode('ascii').strip()
-        self.logger.debug(f"Received response: {response}")
+        self.logger.debug("Received response: %s", response)
         return response
 
     def set_voltage(self, voltage):
@@ -108,9 +158,9 @@ class KeysightE3632A_RS232:
 
         :param voltage: Voltage level to set (in volts).
         """
-        self.logger.info(f"Setting voltage to {voltage} V")
+        self.logger.info("Setting voltage to %s V", voltage)
         self._log_structured("voltage_set", voltage=voltage)
-        self.send_command(f"VOLT {voltage}")
+        self.send_command(self.VOLT_COMMAND % (voltage,))
         print(f"Voltage set to {voltage} V")
 
     def get_voltage(self):
@@ -123,7 +173,7 @@ class KeysightE3632A_RS232:
         self.send_command("VOLT?")
         voltage = self.read_response()
         voltage_float = float(voltage)
-        self.logger.info(f"Voltage setting: {voltage_float} V")
+        self.logger.info("Voltage setting: %s V", voltage_float)
         print(f"Set Voltage: {voltage} V")
         return voltage_float
 
@@ -137,7 +187,7 @@ class KeysightE3632A_RS232:
         self.send_command("MEAS:VOLT?")
         voltage = self.read_response()
         voltage_float = float(voltage)
-        self.logger.info(f"Measured voltage: {voltage_float} V")
+        self.logger.info("Measured voltage: %s V", voltage_float)
         self._log_structured("voltage_measured", voltage=voltage_float)
         print(f"Measured Voltage: {voltage} V")
         return voltage_float
@@ -148,9 +198,9 @@ class KeysightE3632A_RS232:
 
         :param current: Current limit to set (in amps).
         """
-        self.logger.info(f"Setting current limit to {current} A")
+        self.logger.info("Setting current limit to %s A", current)
         self._log_structured("current_set", current=current)
-        self.send_command(f"CURR {current}")
+        self.send_command(self.CURR_COMMAND % (current,))
         print(f"Current limit set to {current} A")
 
     def output_on(self):
@@ -180,7 +230,7 @@ class KeysightE3632A_RS232:
         self.logger.debug("Querying instrument identification")
         self.send_command("*IDN?")
         idn = self.read_response()
-        self.logger.info(f"Instrument identification: {idn}")
+        self.logger.info("Instrument identification: %s", idn)
         print(f"Instrument ID: {idn}")
         return idn
 
@@ -194,7 +244,7 @@ class KeysightE3632A_RS232:
             self.logger.info("Graceful shutdown completed successfully")
             print("\n🛑 Graceful shutdown completed - Power supply output turned OFF")
         except Exception as e:
-            self.logger.error(f"Error during graceful shutdown: {e}")
+            self.logger.error("Error during graceful shutdown: %s", e)
             print(f"\n⚠️ Error during graceful shutdown: {e}")
 
     def check_safety(self, max_voltage=5.5, max_current=0.6):
@@ -217,7 +267,7 @@ class KeysightE3632A_RS232:
         if off_time is None:
             off_time = on_time
 
-        self.logger.info(f"Starting toggle output: {cycles} cycles, ON={on_time}s, OFF={off_time}s")
+        self.logger.info("Starting toggle output: %s cycles, ON=%ss, OFF=%ss", cycles, on_time, off_time)
         print(f"Starting {cycles} toggle cycles: ON={on_time}s, OFF={off_time}s")
         print("Press Ctrl+C to stop toggle cycling gracefully")
 
@@ -235,7 +285,7 @@ class KeysightE3632A_RS232:
 
                     print(f"[Cycle {i + 1}] Completed successfully.\n")
                 except Exception as e:
-                    self.logger.error(f"Error in cycle {i + 1}: {e}")
+                    self.logger.error("Error in cycle %s: %s", i + 1, e)
                     print(f"[Cycle {i + 1}] Error: {e}")
                     self.reconnect()
         
@@ -249,7 +299,7 @@ class KeysightE3632A_RS232:
         """
         Attempt to reconnect to the power supply after an error.
         """
-        self.logger.info(f"Attempting to reconnect to {self.port}")
+        self.logger.info("Attempting to reconnect to %s", self.port)
         try:
             if hasattr(self, 'serial') and self.serial.is_open:
                 self.serial.close()
@@ -263,10 +313,11 @@ class KeysightE3632A_RS232:
                 stopbits=serial.STOPBITS_ONE,
                 timeout=self.timeout,
             )
-            self.logger.info(f"Successfully reconnected to {self.port}")
+            self.connected = True
+            self.logger.info("Successfully reconnected to %s", self.port)
             print(f"Reconnected to {self.port}")
         except Exception as e:
-            self.logger.error(f"Reconnection failed: {e}")
+            self.logger.error("Reconnection failed: %s", e)
             print(f"Reconnection failed: {e}")
             raise ConnectionError(f"Failed to reconnect: {e}")
 
@@ -304,7 +355,21 @@ class KeysightE3632A_RS232:
             time.sleep(0.1)
         sys.stdout.write("\r" + " " * 80 + "\r")  # clear line after done
 
-    def power_cycle(self, cycles=1, on_time=1.0, off_time=1.0, voltage=None, current=None, callback=None, show_progress=True):
+    def _wait_phase(self, duration, cancel=None):
+        """
+        Wait out an ON or OFF phase.
+
+        :param duration: Phase duration in seconds
+        :param cancel: Optional threading.Event that ends the wait early when set
+        :return: True if the phase ran its full duration, False if cancelled
+        """
+        if cancel is None:
+            time.sleep(duration)
+            return True
+        return not cancel.wait(duration)
+
+    def power_cycle(self, cycles=1, on_time=1.0, off_time=1.0, voltage=None, current=None, callback=None, show_progress=True,
+                    cancel=None):
         """
         Perform multiple power cycles (ON/OFF sequences).
         
@@ -315,18 +380,20 @@ class KeysightE3632A_RS232:
         :param current: Current limit to set before cycling (if None, uses current setting)
         :param callback: Optional callback function called after each cycle with cycle number
         :param show_progress: Show progress bars for timing (default: True)
-        :return: List of cycle results with timestamps and measurements
+        :param cancel: Optional threading.Event; once set, cycling stops at the next
+                       phase boundary without sending further commands
+        :return: CycleResults list of cycle results with timestamps and measurements
         """
-        cycle_results = []
+        cycle_results = CycleResults()
         
-        self.logger.info(f"Starting power cycling: {cycles} cycles, ON={on_time}s, OFF={off_time}s, voltage={voltage}V, current={current}A")
+        self.logger.info("Starting power cycling: %s cycles, ON=%ss, OFF=%ss, voltage=%sV, current=%sA", cycles, on_time, off_time, voltage, current)
         
         # Set voltage and current if specified
         if voltage is not None:
-            self.logger.info(f"Setting voltage to {voltage}V before cycling")
+            self.logger.info("Setting voltage to %sV before cycling", voltage)
             self.set_voltage(voltage)
         if current is not None:
-            self.logger.info(f"Setting current limit to {current}A before cycling")
+            self.logger.info("Setting current limit to %sA before cycling", current)
             self.set_current(current)
         
         print(f"Starting {cycles} power cycle(s): ON={on_time}s, OFF={off_time}s")
@@ -334,8 +401,10 @@ class KeysightE3632A_RS232:
         
         try:
             for cycle_num in range(1, cycles + 1):
+                if cancel is not None and cancel.is_set():
+                    break
                 cycle_start_time = time.time()
-                self.logger.info(f"Starting cycle {cycle_num}/{cycles}")
+                self.logger.info("Starting cycle %s/%s", cycle_num, cycles)
                 
                 cycle_result = {
                     'cycle': cycle_num,
@@ -365,8 +434,10 @@ class KeysightE3632A_RS232:
                     # Wait for ON time with progress bar
                     if show_progress and on_time > 0.1:
                         self._show_progress(on_time, f"Cycle {cycle_num}/{cycles} - Power ON | Power OFF in {on_time:.1f}s")
-                    else:
-                        time.sleep(on_time)
+                    elif not self._wait_phase(on_time, cancel):
+                        break
+                    if cancel is not None and cancel.is_set():
+                        break
                 
                     # Turn output OFF
                     self.output_off()
@@ -376,27 +447,27 @@ class KeysightE3632A_RS232:
                     if show_progress and off_time > 0.1:
                         next_state = f"Power ON in {off_time:.1f}s" if cycle_num < cycles else "Cycle complete"
                         self._show_progress(off_time, f"Cycle {cycle_num}/{cycles} - Power OFF | {next_state}")
-                    else:
-                        time.sleep(off_time)
+                    elif not self._wait_phase(off_time, cancel):
+                        break
                     
                     cycle_end_time = time.time()
                     cycle_result['end_time'] = cycle_end_time
                     cycle_result['total_duration'] = cycle_end_time - cycle_start_time
                     
-                    cycle_results.append(cycle_result)
-                    self.logger.info(f"Cycle {cycle_num}/{cycles} completed successfully in {cycle_result['total_duration']:.2f}s")
+                    cycle_results.record_success(cycle_result)
+                    self.logger.info("Cycle %s/%s completed successfully in %.2fs", cycle_num, cycles, cycle_result['total_duration'])
                     print(f"Cycle {cycle_num}/{cycles} completed in {cycle_result['total_duration']:.2f}s")
                     
                     # Call callback if provided
                     if callback:
-                        self.logger.debug(f"Calling callback for cycle {cycle_num}")
+                        self.logger.debug("Calling callback for cycle %s", cycle_num)
                         callback(cycle_num, cycle_result)
                         
                 except Exception as e:
-                    self.logger.error(f"Error during cycle {cycle_num}: {e}")
+                    self.logger.error("Error during cycle %s: %s", cycle_num, e)
                     print(f"Error during cycle {cycle_num}: {e}")
                     cycle_result['error'] = str(e)
-                    cycle_results.append(cycle_result)
+                    cycle_results.record_error(cycle_result)
                     # Continue with next cycle unless critical error
                     continue
         
@@ -407,14 +478,27 @@ class KeysightE3632A_RS232:
             cycle_results.append({
                 'cycle': 'INTERRUPTED',
                 'interrupted': True,
-                'completed_cycles': len(cycle_results),
+                'completed_cycles': cycle_results.executed,
                 'total_requested': cycles,
                 'interrupt_time': time.time()
             })
             return cycle_results
         
-        self.logger.info(f"Power cycling completed. {len(cycle_results)} cycles executed.")
-        print(f"Power cycling completed. {len(cycle_results)} cycles executed.")
+        if cancel is not None and cancel.is_set():
+            self.logger.warning("Power cycling cancelled after %s of %s cycles", cycle_results.executed, cycles)
+            cycle_results.append({
+                'cycle': 'CANCELLED',
+                'cancelled': True,
+                'completed_cycles': cycle_results.executed,
+                'total_requested': cycles,
+                'cancel_time': time.time()
+            })
+            return cycle_results
+        
+        self.logger.info("Power cycling completed. %s cycles executed (%s ok, %s failed, mean %.2fs).",
+                         cycle_results.executed, cycle_results.completed, cycle_results.failed,
+                         cycle_results.mean_duration)
+        print(f"Power cycling completed. {cycle_results.executed} cycles executed.")
         return cycle_results
 
     def power_cycle_with_ramp(self, cycles=1, on_time=1.0, off_time=1.0, voltage_start=0.0, voltage_end=5.0, 
@@ -431,15 +515,15 @@ class KeysightE3632A_RS232:
         :param current: Current limit to set before cycling
         :param callback: Optional callback function called after each cycle
         :param show_progress: Show progress bars for timing (default: True)
-        :return: List of cycle results with ramp measurements
+        :return: CycleResults list of cycle results with ramp measurements
         """
-        cycle_results = []
+        cycle_results = CycleResults()
         
-        self.logger.info(f"Starting voltage ramp cycling: {cycles} cycles, ON={on_time}s, OFF={off_time}s, ramp={voltage_start}V→{voltage_end}V, steps={voltage_steps}, current={current}A")
+        self.logger.info("Starting voltage ramp cycling: %s cycles, ON=%ss, OFF=%ss, ramp=%sV→%sV, steps=%s, current=%sA", cycles, on_time, off_time, voltage_start, voltage_end, voltage_steps, current)
         
         # Set current if specified
         if current is not None:
-            self.logger.info(f"Setting current limit to {current}A before ramp cycling")
+            self.logger.info("Setting current limit to %sA before ramp cycling", current)
             self.set_current(current)
         
         print(f"Starting {cycles} power cycle(s) with voltage ramp: {voltage_start}V to {voltage_end}V")
@@ -448,7 +532,7 @@ class KeysightE3632A_RS232:
         try:
             for cycle_num in range(1, cycles + 1):
                 cycle_start_time = time.time()
-                self.logger.info(f"Starting ramp cycle {cycle_num}/{cycles}")
+                self.logger.info("Starting ramp cycle %s/%s", cycle_num, cycles)
                 
                 cycle_result = {
                     'cycle': cycle_num,
@@ -502,20 +586,20 @@ class KeysightE3632A_RS232:
                     cycle_result['end_time'] = cycle_end_time
                     cycle_result['total_duration'] = cycle_end_time - cycle_start_time
                     
-                    cycle_results.append(cycle_result)
-                    self.logger.info(f"Ramp cycle {cycle_num}/{cycles} completed successfully in {cycle_result['total_duration']:.2f}s")
+                    cycle_results.record_success(cycle_result)
+                    self.logger.info("Ramp cycle %s/%s completed successfully in %.2fs", cycle_num, cycles, cycle_result['total_duration'])
                     print(f"Ramp cycle {cycle_num}/{cycles} completed in {cycle_result['total_duration']:.2f}s")
                     
                     # Call callback if provided
                     if callback:
-                        self.logger.debug(f"Calling callback for ramp cycle {cycle_num}")
+                        self.logger.debug("Calling callback for ramp cycle %s", cycle_num)
                         callback(cycle_num, cycle_result)
                         
                 except Exception as e:
-                    self.logger.error(f"Error during ramp cycle {cycle_num}: {e}")
+                    self.logger.error("Error during ramp cycle %s: %s", cycle_num, e)
                     print(f"Error during ramp cycle {cycle_num}: {e}")
                     cycle_result['error'] = str(e)
-                    cycle_results.append(cycle_result)
+                    cycle_results.record_error(cycle_result)
                     continue
         
         except KeyboardInterrupt:
@@ -525,24 +609,35 @@ class KeysightE3632A_RS232:
             cycle_results.append({
                 'cycle': 'INTERRUPTED',
                 'interrupted': True,
-                'completed_cycles': len(cycle_results),
+                'completed_cycles': cycle_results.executed,
                 'total_requested': cycles,
                 'interrupt_time': time.time()
             })
             return cycle_results
         
-        self.logger.info(f"Voltage ramp cycling completed. {len(cycle_results)} cycles executed.")
-        print(f"Voltage ramp cycling completed. {len(cycle_results)} cycles executed.")
+        self.logger.info("Voltage ramp cycling completed. %s cycles executed (%s ok, %s failed, mean %.2fs).",
+                         cycle_results.executed, cycle_results.completed, cycle_results.failed,
+                         cycle_results.mean_duration)
+        print(f"Voltage ramp cycling completed. {cycle_results.executed} cycles executed.")
         return cycle_results
 
+    def is_open(self):
+        """
+        Check whether the serial port is still open for commands.
+
+        :return: True if connected and the port is open
+        """
+        return bool(getattr(self, 'connected', False) and self.serial.is_open)
+
     def close(self):
         """
         Close the RS-232 connection.
         """
-        self.logger.info(f"Closing RS232 connection to {self.port}")
+        self.logger.info("Closing RS232 connection to %s", self.port)
+        self.connected = False
         if self.serial.is_open:
             self.serial.close()
-            self.logger.info(f"RS232 connection to {self.port} closed successfully")
+            self.logger.info("RS232 connection to %s closed successfully", self.port)
             print("Connection closed.")
 
 
@@ -550,6 +645,10 @@ class KeysightE3632A_GPIB:
     """
     GPIB interface for Keysight E3632A power supply.
     """
+
+    # SCPI setpoint command templates, formatted once per call with %
+    VOLT_COMMAND = "VOLT %s"
+    CURR_COMMAND = "CURR %s"
     
     def __init__(self, resource_name, timeout=10000):
         """
@@ -562,7 +661,7 @@ class KeysightE3632A_GPIB:
         self.resource_name = resource_name
         self.timeout = timeout
         
-        self.logger.info(f"Initializing GPIB connection to {resource_name}")
+        self.logger.info("Initializing GPIB connection to %s", resource_name)
         
         if not PYVISA_AVAILABLE:
             self.logger.error("PyVISA is required for GPIB communication")
@@ -572,10 +671,11 @@ class KeysightE3632A_GPIB:
             self.rm = pyvisa.ResourceManager()
             self.instrument = self.rm.open_resource(resource_name)
             self.instrument.timeout = timeout
-            self.logger.info(f"Successfully connected to {resource_name} via GPIB")
+            self.connected = True
+            self.logger.info("Successfully connected to %s via GPIB", resource_name)
             print(f"Connected to {resource_name} via GPIB")
         except Exception as e:
-            self.logger.error(f"Failed to connect to {resource_name}: {e}")
+            self.logger.error("Failed to connect to %s: %s", resource_name, e)
             raise ConnectionError(f"Failed to connect to {resource_name}: {e}")
     
     def send_command(self, command):
@@ -584,7 +684,7 @@ class KeysightE3632A_GPIB:
         
         :param command: The SCPI command string to send
         """
-        self.logger.debug(f"Sending SCPI command: {command}")
+        self.logger.debug("Sending SCPI command: %s", command)
         self.instrument.write(command)
         time.sleep(0.1)  # Small delay to allow processing
     
@@ -595,7 +695,7 @@ class KeysightE3632A_GPIB:
         :return: The response string
         """
         response = self.instrument.read().strip()
-        self.logger.debug(f"Received response: {response}")
+        self.logger.debug("Received response: %s", response)
         return response
     
     def set_voltage(self, voltage):
@@ -604,8 +704,8 @@ class KeysightE3632A_GPIB:
         
         :param voltage: Voltage level to set (in volts)
         """
-        self.logger.info(f"Setting voltage to {voltage} V")
-        self.send_command(f"VOLT {voltage}")
+        self.logger.info("Setting voltage to %s V", voltage)
+        self.send_command(self.VOLT_COMMAND % (voltage,))
         print(f"Voltage set to {voltage} V")
     
     def get_voltage(self):
@@ -617,7 +717,7 @@ class KeysightE3632A_GPIB:
         self.logger.debug("Querying voltage setting")
         voltage = self.instrument.query("VOLT?")
         voltage_float = float(voltage)
-        self.logger.info(f"Voltage setting: {voltage_float} V")
+        self.logger.info("Voltage setting: %s V", voltage_float)
         print(f"Set Voltage: {voltage} V")
         return voltage_float
     
@@ -630,7 +730,7 @@ class KeysightE3632A_GPIB:
         self.logger.debug("Measuring output voltage")
         voltage = self.instrument.query("MEAS:VOLT?")
         voltage_float = float(voltage)
-        self.logger.info(f"Measured voltage: {voltage_float} V")
+        self.logger.info("Measured voltage: %s V", voltage_float)
         print(f"Measured Voltage: {voltage} V")
         return voltage_float
     
@@ -640,8 +740,8 @@ class KeysightE3632A_GPIB:
         
         :param current: Current limit to set (in amps)
         """
-        self.logger.info(f"Setting current limit to {current} A")
-        self.send_command(f"CURR {current}")
+        self.logger.info("Setting current limit to %s A", current)
+        self.send_command(self.CURR_COMMAND % (current,))
         print(f"Current limit set to {current} A")
     
     def output_on(self):
@@ -668,7 +768,7 @@ class KeysightE3632A_GPIB:
         """
         self.logger.debug("Querying instrument identification")
         idn = self.instrument.query("*IDN?")
-        self.logger.info(f"Instrument identification: {idn}")
+        self.logger.info("Instrument identification: %s", idn)
         print(f"Instrument ID: {idn}")
         return idn
     
@@ -682,14 +782,14 @@ class KeysightE3632A_GPIB:
             self.logger.info("Graceful shutdown completed successfully")
             print("\n🛑 Graceful shutdown completed - Power supply output turned OFF")
         except Exception as e:
-            self.logger.error(f"Error during graceful shutdown: {e}")
+            self.logger.error("Error during graceful shutdown: %s", e)
             print(f"\n⚠️ Error during graceful shutdown: {e}")
 
     def reconnect(self):
         """
         Attempt to reconnect to the power supply after an error.
         """
-        self.logger.info(f"Attempting to reconnect to {self.resource_name}")
+        self.logger.info("Attempting to reconnect to %s", self.resource_name)
         try:
             if hasattr(self, 'instrument'):
                 self.instrument.close()
@@ -700,10 +800,11 @@ class KeysightE3632A_GPIB:
             self.rm = pyvisa.ResourceManager()
             self.instrument = self.rm.open_resource(self.resource_name)
             self.instrument.timeout = self.timeout
-            self.logger.info(f"Successfully reconnected to {self.resource_name}")
+            self.connected = True
+            self.logger.info("Successfully reconnected to %s", self.resource_name)
             print(f"Reconnected to {self.resource_name}")
         except Exception as e:
-            self.logger.error(f"Reconnection failed: {e}")
+            self.logger.error("Reconnection failed: %s", e)
             print(f"Reconnection failed: {e}")
             raise ConnectionError(f"Failed to reconnect: {e}")
     
@@ -725,7 +826,21 @@ class KeysightE3632A_GPIB:
             time.sleep(0.1)
         sys.stdout.write("\r" + " " * 80 + "\r")  # clear line after done
     
-    def power_cycle(self, cycles=1, on_time=1.0, off_time=1.0, voltage=None, current=None, callback=None, show_progress=True):
+    def _wait_phase(self, duration, cancel=None):
+        """
+        Wait out an ON or OFF phase.
+
+        :param duration: Phase duration in seconds
+        :param cancel: Optional threading.Event that ends the wait early when set
+        :return: True if the phase ran its full duration, False if cancelled
+        """
+        if cancel is None:
+            time.sleep(duration)
+            return True
+        return not cancel.wait(duration)
+
+    def power_cycle(self, cycles=1, on_time=1.0, off_time=1.0, voltage=None, current=None, callback=None, show_progress=True,
+                    cancel=None):
         """
         Perform multiple power cycles (ON/OFF sequences).
         
@@ -736,18 +851,20 @@ class KeysightE3632A_GPIB:
         :param current: Current limit to set before cycling (if None, uses current setting)
         :param callback: Optional callback function called after each cycle with cycle number
         :param show_progress: Show progress bars for timing (default: True)
-        :return: List of cycle results with timestamps and measurements
+        :param cancel: Optional threading.Event; once set, cycling stops at the next
+                       phase boundary without sending further commands
+        :return: CycleResults list of cycle results with timestamps and measurements
         """
-        cycle_results = []
+        cycle_results = CycleResults()
         
-        self.logger.info(f"Starting power cycling: {cycles} cycles, ON={on_time}s, OFF={off_time}s, voltage={voltage}V, current={current}A")
+        self.logger.info("Starting power cycling: %s cycles, ON=%ss, OFF=%ss, voltage=%sV, current=%sA", cycles, on_time, off_time, voltage, current)
         
         # Set voltage and current if specified
         if voltage is not None:
-            self.logger.info(f"Setting voltage to {voltage}V before cycling")
+            self.logger.info("Setting voltage to %sV before cycling", voltage)
             self.set_voltage(voltage)
         if current is not None:
-            self.logger.info(f"Setting current limit to {current}A before cycling")
+            self.logger.info("Setting current limit to %sA before cycling", current)
             self.set_current(current)
         
         print(f"Starting {cycles} power cycle(s): ON={on_time}s, OFF={off_time}s")
@@ -755,8 +872,10 @@ class KeysightE3632A_GPIB:
         
         try:
             for cycle_num in range(1, cycles + 1):
+                if cancel is not None and cancel.is_set():
+                    break
                 cycle_start_time = time.time()
-                self.logger.info(f"Starting cycle {cycle_num}/{cycles}")
+                self.logger.info("Starting cycle %s/%s", cycle_num, cycles)
                 
                 cycle_result = {
                     'cycle': cycle_num,
@@ -786,8 +905,10 @@ class KeysightE3632A_GPIB:
                     # Wait for ON time with progress bar
                     if show_progress and on_time > 0.1:
                         self._show_progress(on_time, f"Cycle {cycle_num}/{cycles} - Power ON | Power OFF in {on_time:.1f}s")
-                    else:
-                        time.sleep(on_time)
+                    elif not self._wait_phase(on_time, cancel):
+                        break
+                    if cancel is not None and cancel.is_set():
+                        break
                 
                     # Turn output OFF
                     self.output_off()
@@ -797,27 +918,27 @@ class KeysightE3632A_GPIB:
                     if show_progress and off_time > 0.1:
                         next_state = f"Power ON in {off_time:.1f}s" if cycle_num < cycles else "Cycle complete"
                         self._show_progress(off_time, f"Cycle {cycle_num}/{cycles} - Power OFF | {next_state}")
-                    else:
-                        time.sleep(off_time)
+                    elif not self._wait_phase(off_time, cancel):
+                        break
                     
                     cycle_end_time = time.time()
                     cycle_result['end_time'] = cycle_end_time
                     cycle_result['total_duration'] = cycle_end_time - cycle_start_time
                     
-                    cycle_results.append(cycle_result)
-                    self.logger.info(f"Cycle {cycle_num}/{cycles} completed successfully in {cycle_result['total_duration']:.2f}s")
+                    cycle_results.record_success(cycle_result)
+                    self.logger.info("Cycle %s/%s completed successfully in %.2fs", cycle_num, cycles, cycle_result['total_duration'])
                     print(f"Cycle {cycle_num}/{cycles} completed in {cycle_result['total_duration']:.2f}s")
                     
                     # Call callback if provided
                     if callback:
-                        self.logger.debug(f"Calling callback for cycle {cycle_num}")
+                        self.logger.debug("Calling callback for cycle %s", cycle_num)
                         callback(cycle_num, cycle_result)
                         
                 except Exception as e:
-                    self.logger.error(f"Error during cycle {cycle_num}: {e}")
+                    self.logger.error("Error during cycle %s: %s", cycle_num, e)
                     print(f"Error during cycle {cycle_num}: {e}")
                     cycle_result['error'] = str(e)
-                    cycle_results.append(cycle_result)
+                    cycle_results.record_error(cycle_result)
                     # Continue with next cycle unless critical error
                     continue
         
@@ -828,14 +949,27 @@ class KeysightE3632A_GPIB:
             cycle_results.append({
                 'cycle': 'INTERRUPTED',
                 'interrupted': True,
-                'completed_cycles': len(cycle_results),
+                'completed_cycles': cycle_results.executed,
                 'total_requested': cycles,
                 'interrupt_time': time.time()
             })
             return cycle_results
         
-        self.logger.info(f"Power cycling completed. {len(cycle_results)} cycles executed.")
-        print(f"Power cycling completed. {len(cycle_results)} cycles executed.")
+        if cancel is not None and cancel.is_set():
+            self.logger.warning("Power cycling cancelled after %s of %s cycles", cycle_results.executed, cycles)
+            cycle_results.append({
+                'cycle': 'CANCELLED',
+                'cancelled': True,
+                'completed_cycles': cycle_results.executed,
+                'total_requested': cycles,
+                'cancel_time': time.time()
+            })
+            return cycle_results
+        
+        self.logger.info("Power cycling completed. %s cycles executed (%s ok, %s failed, mean %.2fs).",
+                         cycle_results.executed, cycle_results.completed, cycle_results.failed,
+                         cycle_results.mean_duration)
+        print(f"Power cycling completed. {cycle_results.executed} cycles executed.")
         return cycle_results
 
     def power_cycle_with_ramp(self, cycles=1, on_time=1.0, off_time=1.0, voltage_start=0.0, voltage_end=5.0, 
@@ -852,15 +986,15 @@ class KeysightE3632A_GPIB:
         :param current: Current limit to set before cycling
         :param callback: Optional callback function called after each cycle
         :param show_progress: Show progress bars for timing (default: True)
-        :return: List of cycle results with ramp measurements
+        :return: CycleResults list of cycle results with ramp measurements
         """
-        cycle_results = []
+        cycle_results = CycleResults()
         
-        self.logger.info(f"Starting voltage ramp cycling: {cycles} cycles, ON={on_time}s, OFF={off_time}s, ramp={voltage_start}V→{voltage_end}V, steps={voltage_steps}, current={current}A")
+        self.logger.info("Starting voltage ramp cycling: %s cycles, ON=%ss, OFF=%ss, ramp=%sV→%sV, steps=%s, current=%sA", cycles, on_time, off_time, voltage_start, voltage_end, voltage_steps, current)
         
         # Set current if specified
         if current is not None:
-            self.logger.info(f"Setting current limit to {current}A before ramp cycling")
+            self.logger.info("Setting current limit to %sA before ramp cycling", current)
             self.set_current(current)
         
         print(f"Starting {cycles} power cycle(s) with voltage ramp: {voltage_start}V to {voltage_end}V")
@@ -869,7 +1003,7 @@ class KeysightE3632A_GPIB:
         try:
             for cycle_num in range(1, cycles + 1):
                 cycle_start_time = time.time()
-                self.logger.info(f"Starting ramp cycle {cycle_num}/{cycles}")
+                self.logger.info("Starting ramp cycle %s/%s", cycle_num, cycles)
                 
                 cycle_result = {
                     'cycle': cycle_num,
@@ -923,20 +1057,20 @@ class KeysightE3632A_GPIB:
                     cycle_result['end_time'] = cycle_end_time
                     cycle_result['total_duration'] = cycle_end_time - cycle_start_time
                     
-                    cycle_results.append(cycle_result)
-                    self.logger.info(f"Ramp cycle {cycle_num}/{cycles} completed successfully in {cycle_result['total_duration']:.2f}s")
+                    cycle_results.record_success(cycle_result)
+                    self.logger.info("Ramp cycle %s/%s completed successfully in %.2fs", cycle_num, cycles, cycle_result['total_duration'])
                     print(f"Ramp cycle {cycle_num}/{cycles} completed in {cycle_result['total_duration']:.2f}s")
                     
                     # Call callback if provided
                     if callback:
-                        self.logger.debug(f"Calling callback for ramp cycle {cycle_num}")
+                        self.logger.debug("Calling callback for ramp cycle %s", cycle_num)
                         callback(cycle_num, cycle_result)
                         
                 except Exception as e:
-                    self.logger.error(f"Error during ramp cycle {cycle_num}: {e}")
+                    self.logger.error("Error during ramp cycle %s: %s", cycle_num, e)
                     print(f"Error during ramp cycle {cycle_num}: {e}")
                     cycle_result['error'] = str(e)
-                    cycle_results.append(cycle_result)
+                    cycle_results.record_error(cycle_result)
                     continue
         
         except KeyboardInterrupt:
@@ -946,38 +1080,88 @@ class KeysightE3632A_GPIB:
             cycle_results.append({
                 'cycle': 'INTERRUPTED',
                 'interrupted': True,
-                'completed_cycles': len(cycle_results),
+                'completed_cycles': cycle_results.executed,
                 'total_requested': cycles,
                 'interrupt_time': time.time()
             })
             return cycle_results
         
-        self.logger.info(f"Voltage ramp cycling completed. {len(cycle_results)} cycles executed.")
-        print(f"Voltage ramp cycling completed. {len(cycle_results)} cycles executed.")
+        self.logger.info("Voltage ramp cycling completed. %s cycles executed (%s ok, %s failed, mean %.2fs).",
+                         cycle_results.executed, cycle_results.completed, cycle_results.failed,
+                         cycle_results.mean_duration)
+        print(f"Voltage ramp cycling completed. {cycle_results.executed} cycles executed.")
         return cycle_results
 
+    def is_open(self):
+        """
+        Check whether the VISA session is still open for commands.
+
+        :return: True if connected and the instrument session is valid
+        """
+        if not getattr(self, 'connected', False):
+            return False
+        try:
+            # PyVISA raises InvalidSession once the resource has been closed
+            return self.instrument.session is not None
+        except Exception:
+            return False
+
     def close(self):
         """
         Close the GPIB connection.
         """
-        self.logger.info(f"Closing GPIB connection to {self.resource_name}")
+        self.logger.info("Closing GPIB connection to %s", self.resource_name)
+        self.connected = False
         if hasattr(self, 'instrument'):
             self.instrument.close()
             self.logger.debug("GPIB instrument connection closed")
         if hasattr(self, 'rm'):
             self.rm.close()
             self.logger.debug("GPIB resource manager closed")
-        self.logger.info(f"GPIB connection to {self.resource_name} closed successfully")
+        self.logger.info("GPIB connection to %s closed successfully", self.resource_name)
         print("GPIB connection closed.")
 
 
 class PowerSupplyFactory:
     """
     Factory class to create power supply instances based on configuration.
+
+    Instances are cached by configuration, so repeated requests for the same
+    supply return the already open connection while it is still open.
     """
-    
+
+    # Connection builders keyed by the config field that selects them, in priority order
+    _BUILDERS = {
+        'resource': ('GPIB', lambda config: KeysightE3632A_GPIB(
+            resource_name=config['resource'],
+            timeout=config.get('timeout', 10000)
+        )),
+        'port': ('RS232', lambda config: KeysightE3632A_RS232(
+            port=config['port'],
+            baud_rate=config.get('baud_rate', 9600),
+            timeout=config.get('timeout', 1)
+        )),
+    }
+    _instances = {}
+    _lock = threading.Lock()
+
     @staticmethod
-    def create_power_supply(config):
+    def _cache_key(config):
+        """
+        Build a hashable cache key from a configuration dictionary.
+
+        :param config: Power supply configuration dictionary
+        :return: Hashable key, or None if the configuration contains unhashable values
+        """
+        try:
+            key = tuple(sorted(config.items()))
+            hash(key)
+            return key
+        except TypeError:
+            return None
+
+    @classmethod
+    def create_power_supply(cls, config):
         """
         Create a power supply instance based on configuration.
         
@@ -985,26 +1169,170 @@ class PowerSupplyFactory:
         :return: Power supply instance
         """
         logger = logging.getLogger('power_supply.factory')
-        logger.info(f"Creating power supply with config: {config}")
-        
-        if 'resource' in config:
-            # GPIB connection
-            logger.info(f"Creating GPIB power supply: {config['resource']}")
-            return KeysightE3632A_GPIB(
-                resource_name=config['resource'],
-                timeout=config.get('timeout', 10000)
-            )
-        elif 'port' in config:
-            # RS232 connection
-            logger.info(f"Creating RS232 power supply: {config['port']}")
-            return KeysightE3632A_RS232(
-                port=config['port'],
-                baud_rate=config.get('baud_rate', 9600),
-                timeout=config.get('timeout', 1)
-            )
-        else:
-            logger.error("Power supply configuration must include either 'resource' (GPIB) or 'port' (RS232)")
-            raise ValueError("Power supply configuration must include either 'resource' (GPIB) or 'port' (RS232)")
+        key = cls._cache_key(config)
+
+        if key is not None:
+            with cls._lock:
+                cached = cls._instances.get(key)
+                if cached is not None:
+                    if cached.is_open():
+                        logger.debug("Reusing open power supply for config: %s", config)
+                        return cached
+                    # Closed or dropped connection: build a new one below
+                    del cls._instances[key]
+
+        for field, (interface, build) in cls._BUILDERS.items():
+            if field in config:
+                logger.info("Creating %s power supply: %s", interface, config[field])
+                # Opened outside the lock, so a slow connection does not hold up other supplies
+                psu = build(config)
+                if key is None:
+                    return psu
+
+                with cls._lock:
+                    cached = cls._instances.get(key)
+                    if cached is not None and cached.is_open():
+                        # Another caller opened the same supply meanwhile; keep theirs
+                        logger.debug("Discarding duplicate power supply for config: %s", config)
+                        psu.close()
+                        return cached
+                    cls._instances[key] = psu
+                return psu
+
+        logger.error("Power supply configuration must include either 'resource' (GPIB) or 'port' (RS232)")
+        raise ValueError("Power supply configuration must include either 'resource' (GPIB) or 'port' (RS232)")
+
+    @classmethod
+    def clear_cache(cls, close=True):
+        """
+        Forget all cached power supply instances.
+
+        :param close: Close the cached instances' connections (default: True);
+                      pass False only if the caller closes them itself
+        """
+        logger = logging.getLogger('power_supply.factory')
+        with cls._lock:
+            instances = list(cls._instances.values())
+            cls._instances.clear()
+
+        if close:
+            for psu in instances:
+                try:
+                    psu.close()
+                except Exception as e:
+                    logger.error("Failed to close cached power supply %s: %s", psu, e)
+
+
+def power_cycle_fleet(psus, max_workers=None, **kwargs):
+    """
+    Power cycle several power supplies concurrently, one worker thread per device.
+
+    Each supply must own its own connection (serial port or VISA session); the
+    bus I/O releases the GIL so independent buses cycle in parallel.
+
+    :param psus: Iterable of power supply instances
+    :param max_workers: Maximum number of worker threads (default: one per power supply)
+    :param kwargs: Keyword arguments passed to each power_cycle() call
+    :return: Dictionary mapping each power supply instance to its cycle results
+    """
+    logger = logging.getLogger('power_supply.fleet')
+    psus = list(psus)
+    if not psus:
+        return {}
+
+    # Concurrent progress bars would interleave on the console
+    kwargs.setdefault('show_progress', False)
+
+    logger.info("Starting fleet power cycling on %d power supplies", len(psus))
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers or len(psus)) as executor:
+        futures = {executor.submit(psu.power_cycle, **kwargs): psu for psu in psus}
+        for future in as_completed(futures):
+            psu = futures[future]
+            try:
+                results[psu] = future.result()
+            except Exception as e:
+                logger.error("Fleet power cycling failed for %s: %s", psu, e)
+                results[psu] = [{'cycle': 'FAILED', 'error': str(e)}]
+
+    logger.info("Fleet power cycling completed on %d power supplies", len(results))
+    return results
+
+
+# Per-cycle allowance (s) on top of ON/OFF time for SCPI command delays and measurements
+FLEET_CYCLE_SLACK = 2.0
+
+# Time (s) a cancelled fleet worker gets to reach a phase boundary and stop
+FLEET_STOP_GRACE = 5.0
+
+
+async def power_cycle_fleet_async(psus, budget=None, **kwargs):
+    """
+    Power cycle several power supplies concurrently under a wall-clock budget.
+
+    Each supply's power_cycle() runs in a worker thread. A supply that does not
+    finish within the budget is treated as hung: its worker is cancelled at the
+    next phase boundary, its result is marked TIMEOUT, and once the worker has
+    stopped its connection is reset so the stalled session does not hold the bus.
+    A worker still blocked in bus I/O after FLEET_STOP_GRACE keeps its session,
+    which is then not reset underneath it.
+
+    :param psus: Iterable of power supply instances
+    :param budget: Wall-clock budget in seconds per supply (default: derived from
+                   cycles, on_time, off_time and FLEET_CYCLE_SLACK)
+    :param kwargs: Keyword arguments passed to each power_cycle() call
+    :return: Dictionary mapping each power supply instance to its cycle results
+    """
+    logger = logging.getLogger('power_supply.fleet')
+    psus = list(psus)
+    if not psus:
+        return {}
+
+    kwargs.setdefault('show_progress', False)
+    if budget is None:
+        budget = kwargs.get('cycles', 1) * (
+            kwargs.get('on_time', 1.0) + kwargs.get('off_time', 1.0) + FLEET_CYCLE_SLACK
+        )
+
+    loop = asyncio.get_running_loop()
+    # Not used as a context manager: a hung worker must not block the return
+    executor = ThreadPoolExecutor(max_workers=len(psus))
+
+    async def run_one(psu):
+        cancel = threading.Event()
+        worker = loop.run_in_executor(executor, partial(psu.power_cycle, cancel=cancel, **kwargs))
+        try:
+            # Shielded: on timeout the worker is stopped through cancel, not abandoned
+            return await asyncio.wait_for(asyncio.shield(worker), timeout=budget)
+        except asyncio.TimeoutError:
+            logger.error("Power cycling on %s exceeded %.1fs budget - cancelling", psu, budget)
+            cancel.set()
+            try:
+                await asyncio.wait_for(asyncio.shield(worker), timeout=FLEET_STOP_GRACE)
+            except asyncio.TimeoutError:
+                logger.error("Power cycling on %s did not stop within %.1fs - session not reset",
+                             psu, FLEET_STOP_GRACE)
+            except Exception as e:
+                logger.debug("Cancelled power cycling on %s ended with: %s", psu, e)
+
+            if worker.done():
+                # The worker no longer uses the session, so it can be replaced
+                try:
+                    await loop.run_in_executor(None, psu.reconnect)
+                except Exception as e:
+                    logger.error("Session reset failed for %s: %s", psu, e)
+            return [{'cycle': 'TIMEOUT', 'error': f"Exceeded {budget:.1f}s budget"}]
+        except Exception as e:
+            logger.error("Fleet power cycling failed for %s: %s", psu, e)
+            return [{'cycle': 'FAILED', 'error': str(e)}]
+
+    logger.info("Starting async fleet power cycling on %d power supplies (budget %.1fs)", len(psus), budget)
+    try:
+        outcomes = await asyncio.gather(*(run_one(psu) for psu in psus))
+    finally:
+        executor.shutdown(wait=False)
+
+    return dict(zip(psus, outcomes))
 
 
 # Example usage
@@ -1087,24 +1415,23 @@ if __name__ == "__main__":
             show_progress=True
         )
         
-        # Print summary of all cycles
-        print(f"\n=== Power Cycling Summary ===")
-        print(f"Standard cycles completed: {len(results)}")
-        for result in results:
-            if 'error' not in result:
-                print(f"Cycle {result['cycle']}: {result['total_duration']:.2f}s "
-                      f"(ON: {result['on_time']}s, OFF: {result['off_time']}s)")
-            else:
-                print(f"Cycle {result['cycle']}: ERROR - {result['error']}")
-        
-        print(f"\nRamp cycles completed: {len(ramp_results)}")
-        for result in ramp_results:
-            if 'error' not in result:
-                print(f"Ramp Cycle {result['cycle']}: {result['total_duration']:.2f}s "
-                      f"({result['voltage_start']}V to {result['voltage_end']}V, "
-                      f"{result['voltage_steps']} steps)")
-            else:
-                print(f"Ramp Cycle {result['cycle']}: ERROR - {result['error']}")
+        # Print summary of all cycles (one write instead of one print per cycle)
+        lines = ["", "=== Power Cycling Summary ===", f"Standard cycles completed: {len(results)}"]
+        lines.extend(
+            f"Cycle {result['cycle']}: {result['total_duration']:.2f}s "
+            f"(ON: {result['on_time']}s, OFF: {result['off_time']}s)"
+            if 'error' not in result else f"Cycle {result['cycle']}: ERROR - {result['error']}"
+            for result in results
+        )
+        lines.append(f"\nRamp cycles completed: {len(ramp_results)}")
+        lines.extend(
+            f"Ramp Cycle {result['cycle']}: {result['total_duration']:.2f}s "
+            f"({result['voltage_start']}V to {result['voltage_end']}V, "
+            f"{result['voltage_steps']} steps)"
+            if 'error' not in result else f"Ramp Cycle {result['cycle']}: ERROR - {result['error']}"
+            for result in ramp_results
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
         
     except KeyboardInterrupt:
         example_logger.warning("Example interrupted by user (Ctrl+C)")
@@ -1,11 +1,30 @@
 import json
 import csv
 import os
-from datetime import datetime
+import dataclasses
+from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 import logging
 
+# Optional fast JSON serializer for JSON reports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def report_json_default(obj: Any) -> Any:
+    """Convert report values JSON has no type for: times, durations and dataclass results."""
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if isinstance(obj, timedelta):
+        return str(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 
 class ReportGenerator:
     """
@@ -236,11 +255,8 @@ class ReportGenerator:
                 'configuration': self.config
             }
             
-            # Convert datetime objects to strings
-            json_data = self._serialize_datetime(json_data)
-            
-            with open(filepath, 'w', encoding='utf-8') as jsonfile:
-                json.dump(json_data, jsonfile, indent=2, ensure_ascii=False)
+            with open(filepath, 'wb') as jsonfile:
+                jsonfile.write(self._dump_json_report(json_data))
             
             self.logger.info(f"JSON report generated: {filepath}")
             return str(filepath)
@@ -556,16 +572,24 @@ class ReportGenerator:
         
         return stats
     
-    def _serialize_datetime(self, obj):
-        """Recursively serialize datetime objects to strings."""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, dict):
-            return {key: self._serialize_datetime(value) for key, value in obj.items()}
-        elif isinstance(obj, list):
-            return [self._serialize_datetime(item) for item in obj]
-        else:
-            return obj
+    def _dump_json_report(self, json_data: Dict) -> bytes:
+        """
+        Serialize JSON report data as indented UTF-8 JSON.
+        
+        Uses orjson when it is installed, which writes datetimes in ISO format
+        itself, and falls back to the json module for data orjson rejects.
+        
+        :param json_data: Report data
+        :return: Encoded JSON document
+        """
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.dumps(json_data, default=report_json_default,
+                                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+            except TypeError:
+                pass
+        return json.dumps(json_data, indent=2, ensure_ascii=False,
+                          default=report_json_default).encode('utf-8')
 
 
 # Example usage
@@ -18,12 +18,411 @@ import serial
 import json
 import csv
 import re
+import sys
 import time
 import os
 import logging
+import mmap
+import bisect
+import functools
+import operator
+import queue
+import select
+import threading
+from collections.abc import Sequence
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Callable, Iterable, Iterator, NamedTuple, Optional, Union
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+# NumPy backs the columnar parse_log_file_arrays output
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Optional linear-time regex engine for parser patterns (google-re2)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
+# Optional fast JSON serializer for saved results
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Write buffer for serial log files; lines are flushed in batches rather than per line
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Log timestamp formats that datetime.isoformat produces directly, as (sep, timespec);
+# isoformat avoids interpreting the format string on every line like strftime does
+ISO_TIMESTAMP_FORMATS = {
+    '%Y-%m-%d %H:%M:%S.%f': (' ', 'microseconds'),
+    '%Y-%m-%d %H:%M:%S': (' ', 'seconds'),
+    '%Y-%m-%dT%H:%M:%S.%f': ('T', 'microseconds'),
+    '%Y-%m-%dT%H:%M:%S': ('T', 'seconds'),
+}
+
+# Fields of a parsed data entry; all but parsed_data are stored as plain columns
+PARSED_FIELDS = ('timestamp', 'pattern_name', 'pattern_type', 'raw_data', 'parsed_data')
+ENTRY_FIELDS = PARSED_FIELDS[:-1]
+
+# Receive buffer requested from the serial driver where supported (Windows)
+SERIAL_RX_BUFFER_SIZE = 1 << 20
+
+# How long the logging loop waits on the reader queue before re-checking for interrupts
+READER_QUEUE_WAIT_S = 0.5
+
+# Pause between empty reads of a port opened with a zero (non-blocking) timeout
+SERIAL_POLL_WAIT_S = 0.01
+
+# Largest single read from the serial port's file descriptor
+SERIAL_READ_SIZE = 64 * 1024
+
+# Most log records the background writer hands to one writelines call
+LOG_WRITE_BATCH = 256
+
+# Complete lines, newline included, in a block of received bytes
+SERIAL_LINE = re.compile(rb'[^\n]*\n')
+
+# Exclude patterns known to match every whitespace-only line, checked without the regex engine
+BLANK_LINE_PATTERNS = {r'^\s*$'}
+
+# ASCII control characters that str regexes treat as whitespace but bytes regexes do not
+ASCII_INFO_SEPARATORS = re.compile(rb'[\x1c-\x1f]')
+
+# Numbered backreferences and conditionals change meaning once a pattern is
+# embedded in a larger regex
+NUMBERED_BACKREF = re.compile(r'\\[1-9]|\(\?\([1-9]')
+
+
+def is_start_anchored(regex: re.Pattern) -> bool:
+    """
+    Check whether a compiled pattern can only match at the start of the string.
+    
+    Args:
+        regex: Compiled regex pattern
+        
+    Returns:
+        bool: True if the pattern begins with ^ or \\A outside any alternation
+    """
+    if regex.flags & re.MULTILINE:
+        return False
+    try:
+        parsed = sre_parse.parse(regex.pattern, regex.flags)
+    except Exception:
+        return False
+    if not len(parsed):
+        return False
+    op, arg = parsed[0]
+    return op == sre_parse.AT and arg in (sre_parse.AT_BEGINNING, sre_parse.AT_BEGINNING_STRING)
+
+
+def dump_json_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object as indented JSON bytes.
+    
+    Uses orjson when it is installed and falls back to the json module for
+    objects orjson rejects (non-string keys, integers beyond 64 bits).
+    
+    Args:
+        obj: JSON-serializable object
+        
+    Returns:
+        bytes: UTF-8 encoded JSON document
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+        except TypeError:
+            pass
+    return json.dumps(obj, indent=2).encode('utf-8')
+
+
+def _child_patterns(av):
+    """Yield the subpatterns nested in a parsed regex node's arguments."""
+    if isinstance(av, sre_parse.SubPattern):
+        yield av
+    elif isinstance(av, (tuple, list)):
+        for item in av:
+            yield from _child_patterns(item)
+
+
+def _has_unbounded_repeat(subpattern) -> bool:
+    """Check whether a parsed regex contains a backtracking *, + or {n,} repeat."""
+    for op, av in subpattern:
+        if op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[1] == sre_parse.MAXREPEAT:
+            return True
+        if any(_has_unbounded_repeat(child) for child in _child_patterns(av)):
+            return True
+    return False
+
+
+def _has_nested_repeat(subpattern) -> bool:
+    """Check whether a parsed regex repeats a subpattern that itself repeats without bound."""
+    for op, av in subpattern:
+        if (op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[1] == sre_parse.MAXREPEAT
+                and _has_unbounded_repeat(av[2])):
+            return True
+        if any(_has_nested_repeat(child) for child in _child_patterns(av)):
+            return True
+    return False
+
+
+def pattern_hazards(regex: re.Pattern) -> List[str]:
+    """
+    Find constructs that make a pattern slow on lines it does not match.
+    
+    Args:
+        regex: Compiled regex pattern
+        
+    Returns:
+        List[str]: Descriptions of the problems found, empty if none
+    """
+    try:
+        parsed = sre_parse.parse(regex.pattern, regex.flags)
+    except Exception:
+        return []
+    
+    hazards = []
+    if len(parsed) and not is_start_anchored(regex):
+        op, av = parsed[0]
+        if (op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] == 0
+                and av[1] == sre_parse.MAXREPEAT and list(av[2]) == [(sre_parse.ANY, None)]):
+            hazards.append("starts with an unanchored '.*', which is retried from every position; "
+                           "drop it or anchor the pattern with '^'")
+    if _has_nested_repeat(parsed):
+        hazards.append("nests unbounded quantifiers, which can backtrack exponentially on lines "
+                       "that do not match")
+    return hazards
+
+
+def build_extractor(extract_groups: List[int], labels: List[str], pattern_type: str,
+                    group_count: int) -> tuple:
+    """
+    Resolve a pattern's group extraction settings once.
+    
+    Args:
+        extract_groups: Group numbers to extract
+        labels: Labels for the extracted groups, by position
+        pattern_type: Pattern type; 'float' and 'int' values are converted
+        group_count: Number of groups in the compiled regex
+        
+    Returns:
+        tuple: (group numbers, keys, converter or None), with one key per group number
+    """
+    extracted = [(group_index, labels[i] if i < len(labels) else f'group_{group_index}')
+                 for i, group_index in enumerate(extract_groups)
+                 if group_index <= group_count]
+    group_numbers = tuple(group_index for group_index, _ in extracted)
+    keys = tuple(key for _, key in extracted)
+    return group_numbers, keys, {'float': float, 'int': int}.get(pattern_type)
+
+
+def make_parsed_data_reader(group_numbers: tuple, keys: tuple,
+                            convert: Optional[Callable]) -> Callable[[re.Match], Dict[str, Any]]:
+    """
+    Specialize reading a pattern's parsed data out of a match.
+    
+    The group count and conversion are fixed per pattern, so the reader is chosen
+    once instead of branching on them for every matched line.
+    
+    Args:
+        group_numbers: Numbers of the extracted groups within the match
+        keys: Parsed data key of each extracted group
+        convert: Value converter, or None to keep the matched strings
+        
+    Returns:
+        Callable: Function building the parsed data dict from a match
+    """
+    if not group_numbers:
+        return lambda match: {}
+    
+    if len(group_numbers) == 1:
+        number, key = group_numbers[0], keys[0]
+        if convert is None:
+            return lambda match: {key: match.group(number)}
+        
+        def read_one(match):
+            value = match.group(number)
+            try:
+                value = convert(value)
+            except ValueError:
+                pass
+            return {key: value}
+        return read_one
+    
+    # Fetch all extracted groups in one call; a fused match carries every
+    # pattern's groups, so groups() would copy far more than needed
+    if convert is None:
+        return lambda match: dict(zip(keys, match.group(*group_numbers)))
+    
+    def read_many(match):
+        parsed_data = {}
+        for key, value in zip(keys, match.group(*group_numbers)):
+            try:
+                value = convert(value)
+            except ValueError:
+                pass
+            parsed_data[key] = value
+        return parsed_data
+    return read_many
+
+
+class CompiledPattern(NamedTuple):
+    """Parser pattern with its configuration resolved at compile time."""
+    name: str
+    description: str
+    type: str
+    regex: re.Pattern
+    extract_groups: List[int]
+    labels: List[str]
+    is_float: bool
+    is_int: bool
+    group_count: int
+    extractor: tuple
+    anchored: bool
+    find: Callable[[str], Optional[re.Match]]
+
+
+class ParsedColumns:
+    """
+    Columnar store of parsed data entries.
+    
+    The entry fields are kept as one list each. Extracted values are kept in one
+    column per label, holding the row numbers and values of the entries that have
+    that label, so a label's readings can be used without walking every entry.
+    """
+    
+    def __init__(self):
+        self.fields = {field: [] for field in ENTRY_FIELDS}
+        # Per row, the labels extracted for it (one tuple shared by a pattern's rows)
+        self.keys = []
+        # label -> (row numbers, values)
+        self.values = {}
+    
+    def __len__(self) -> int:
+        return len(self.keys)
+    
+    def append(self, timestamp: str, pattern_name: str, pattern_type: str, raw_data: str,
+               parsed_data: Dict[str, Any], keys: tuple):
+        """
+        Append one parsed data entry.
+        
+        Args:
+            timestamp: ISO formatted timestamp
+            pattern_name: Name of the matching pattern
+            pattern_type: Type of the matching pattern
+            raw_data: Stripped raw line
+            parsed_data: Extracted values by label
+            keys: Labels of parsed_data, in order
+        """
+        row = len(self.keys)
+        fields = self.fields
+        fields['timestamp'].append(timestamp)
+        fields['pattern_name'].append(pattern_name)
+        fields['pattern_type'].append(pattern_type)
+        fields['raw_data'].append(raw_data)
+        self.keys.append(keys)
+        
+        values = self.values
+        for key, value in parsed_data.items():
+            column = values.get(key)
+            if column is None:
+                column = values[key] = ([], [])
+            column[0].append(row)
+            column[1].append(value)
+    
+    def column(self, label: str) -> tuple:
+        """
+        Get the values extracted for one label.
+        
+        Args:
+            label: Extracted value label
+            
+        Returns:
+            tuple: (row numbers, values), both empty if the label never occurred
+        """
+        return self.values.get(label, ([], []))
+    
+    def record(self, index: int) -> Dict[str, Any]:
+        """
+        Build the parsed data entry for one row.
+        
+        Args:
+            index: Row number; negative numbers count from the end
+            
+        Returns:
+            Dict[str, Any]: Parsed data entry
+        """
+        if index < 0:
+            index += len(self.keys)
+        entry = {field: column[index] for field, column in self.fields.items()}
+        parsed_data = {}
+        for key in self.keys[index]:
+            rows, values = self.values[key]
+            parsed_data[key] = values[bisect.bisect_left(rows, index)]
+        entry['parsed_data'] = parsed_data
+        return entry
+    
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over the stored entries in order.
+        
+        Yields:
+            Dict[str, Any]: Parsed data entry
+        """
+        # Rows are appended in order, so each label's next value belongs to the
+        # next row that lists the label
+        next_value = {key: iter(values).__next__ for key, (_, values) in self.values.items()}
+        fields = self.fields
+        for row in zip(*(fields[field] for field in ENTRY_FIELDS), self.keys):
+            entry = dict(zip(PARSED_FIELDS, row))
+            entry['parsed_data'] = {key: next_value[key]() for key in row[-1]}
+            yield entry
+    
+    def to_records(self) -> List[Dict[str, Any]]:
+        """
+        Build the list of parsed data entries.
+        
+        Returns:
+            List[Dict[str, Any]]: Parsed data entries
+        """
+        return list(self.iter_records())
+
+
+class ParsedDataView(Sequence):
+    """
+    Read-only sequence of parsed data entries backed by SerialLogger's columns.
+    
+    Entries are built as dicts when accessed. The view is live: it grows as the
+    logger keeps parsing.
+    """
+    
+    def __init__(self, columns: ParsedColumns):
+        self._columns = columns
+    
+    def __len__(self) -> int:
+        return len(self._columns)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if not -len(self) <= index < len(self):
+            raise IndexError("parsed data index out of range")
+        return self._columns.record(index)
+    
+    def __iter__(self):
+        return self._columns.iter_records()
 
 
 class SerialLogger:
@@ -34,6 +433,17 @@ class SerialLogger:
     real-time data parsing based on configuration patterns.
     """
     
+    # Fixed attribute layout: the per-line path reads these on every line
+    __slots__ = (
+        'config', 'parse_data', 'serial_conn', 'log_file', 'log_file_path',
+        'parsed_columns', 'running', 'flush_interval', 'strict_durability',
+        '_last_flush', '_ts_fmt', '_ts_iso', 'console_output', '_print_every_n',
+        '_console_count', '_echo_all', '_line_parser', 'logger', '_min_length',
+        '_max_length', '_excludes_blank', '_exclude_res', '_include_res',
+        '_exclude_bytes_res', '_include_bytes_res', '_bytes_filters', 'data_parser',
+        '_write_q', '_writer_thread', '_clock_second', '_clock_text',
+    )
+    
     def __init__(self, config: Dict[str, Any], parse_data: bool = False):
         """
         Initialize serial logger.
@@ -47,12 +457,50 @@ class SerialLogger:
         self.serial_conn = None
         self.log_file = None
         self.log_file_path = None
-        self.parsed_data = []
+        # Background log writer, only running while start_logging reads the port
+        self._write_q = None
+        self._writer_thread = None
+        # Parsed entries are kept column by column rather than one dict per entry
+        self.parsed_columns = ParsedColumns()
         self.running = False
         
+        # Log file durability: 'batched' flushes at most every flush_interval_s,
+        # 'strict' flushes after every line
+        logging_config = config.get('logging', {})
+        self.flush_interval = logging_config.get('flush_interval_s', 1.0)
+        self.strict_durability = logging_config.get('durability', 'batched') == 'strict'
+        self._last_flush = 0.0
+        self._ts_fmt = logging_config.get('timestamp_format', '%Y-%m-%d %H:%M:%S.%f')
+        self._ts_iso = ISO_TIMESTAMP_FORMATS.get(self._ts_fmt)
+        # Second of the last received line and its formatted date and time
+        self._clock_second = None
+        self._clock_text = None
+        
+        # Console echo of received lines: 'all', 'sampled' (1 in console_sample_every) or 'none'
+        self.console_output = logging_config.get('console_output', 'all')
+        self._print_every_n = max(1, int(logging_config.get('console_sample_every', 10)))
+        self._console_count = 0
+        self._echo_all = True
+        self._line_parser = None
+        
         # Setup logging
         self.logger = logging.getLogger(__name__)
         
+        # Resolve filters once; filter_data runs for every received line
+        filters = config.get('filters', {})
+        self._min_length = filters.get('min_data_length', 0)
+        self._max_length = filters.get('max_data_length', float('inf'))
+        exclude_res = self._compile_filter_patterns(filters.get('exclude_patterns', []))
+        include_res = self._compile_filter_patterns(filters.get('include_patterns', []))
+        self._excludes_blank = any(p.pattern in BLANK_LINE_PATTERNS for p in exclude_res)
+        self._exclude_res = self._union_filter_patterns(exclude_res)
+        self._include_res = self._union_filter_patterns(include_res)
+        
+        # Byte-level copies let ASCII lines be filtered before they are decoded
+        self._exclude_bytes_res = self._bytes_filter_patterns(self._exclude_res)
+        self._include_bytes_res = self._bytes_filter_patterns(self._include_res)
+        self._bytes_filters = self._exclude_bytes_res is not None and self._include_bytes_res is not None
+        
         # Initialize data parser if enabled
         if parse_data:
             self.data_parser = SerialDataParser(config)
@@ -78,6 +526,10 @@ class SerialLogger:
                 bytesize=serial_config.get('bytesize', 8)
             )
             
+            # Only some platforms let the driver buffer be resized
+            if hasattr(self.serial_conn, 'set_buffer_size'):
+                self.serial_conn.set_buffer_size(rx_size=SERIAL_RX_BUFFER_SIZE)
+            
             self.logger.info(f"Connected to serial port {serial_config['port']} at {serial_config['baud']} baud")
             return True
             
@@ -119,8 +571,9 @@ class SerialLogger:
             log_filename = f"serial_log_{timestamp}.txt"
             self.log_file_path = log_dir / log_filename
             
-            # Open log file
-            self.log_file = open(self.log_file_path, 'w', encoding='utf-8')
+            # Open log file in binary mode; each record is encoded once and written in one call
+            self.log_file = open(self.log_file_path, 'wb', buffering=LOG_BUFFER_SIZE)
+            self._last_flush = time.monotonic()
             
             self.logger.info(f"Log file created: {self.log_file_path}")
             return True
@@ -131,16 +584,18 @@ class SerialLogger:
     
     def close_log_file(self):
         """Close log file."""
+        self._stop_writer()
         if self.log_file:
+            self.log_file.flush()
             self.log_file.close()
             self.log_file = None
     
-    def write_to_log(self, data: str, timestamp: Optional[datetime] = None):
+    def write_to_log(self, data: Union[str, bytes], timestamp: Optional[datetime] = None):
         """
         Write data to log file.
         
         Args:
-            data: Data to write
+            data: Data to write, as text or as UTF-8 encoded bytes
             timestamp: Optional timestamp (uses current time if None)
         """
         if not self.log_file:
@@ -149,47 +604,265 @@ class SerialLogger:
         if timestamp is None:
             timestamp = datetime.now()
         
-        timestamp_str = timestamp.strftime(self.config['logging']['timestamp_format'])
-        log_entry = f"{timestamp_str},{data.strip()}\n"
+        if self._ts_iso is not None and timestamp.tzinfo is None:
+            formatted = timestamp.isoformat(*self._ts_iso)
+        else:
+            formatted = timestamp.strftime(self._ts_fmt)
         
-        self.log_file.write(log_entry)
-        self.log_file.flush()
+        self._write_log_record(formatted, data)
     
-    def filter_data(self, data: str) -> bool:
+    def _write_log_record(self, formatted: str, data: Union[str, bytes]):
         """
-        Check if data should be logged based on filters.
+        Write one record with an already formatted timestamp to the log file.
         
         Args:
-            data: Data to check
+            formatted: Formatted timestamp
+            data: Data to write, as text or as UTF-8 encoded bytes
+        """
+        if not self.log_file:
+            return
+        
+        if isinstance(data, str):
+            data = data.strip().encode('utf-8')
+        else:
+            data = data.strip()
+        record = b'%s,%s\n' % (formatted.encode('utf-8'), data)
+        
+        write_q = self._write_q
+        if write_q is not None:
+            write_q.put(record)
+            return
+        
+        self.log_file.write(record)
+        
+        if self.strict_durability:
+            self.log_file.flush()
+        else:
+            now = time.monotonic()
+            if now - self._last_flush >= self.flush_interval:
+                self.log_file.flush()
+                self._last_flush = now
+    
+    def _start_writer(self):
+        """
+        Hand log file writes to a background thread.
+        
+        Only used with batched durability; strict durability keeps writing and
+        flushing each line on the calling thread.
+        """
+        if self.strict_durability or not self.log_file or self._writer_thread is not None:
+            return
+        self._write_q = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(
+            target=self._write_log_records, args=(self._write_q, self.log_file),
+            name='serial-log-writer', daemon=True)
+        self._writer_thread.start()
+    
+    def _stop_writer(self):
+        """Stop the background writer once it has written every queued record."""
+        writer, write_q = self._writer_thread, self._write_q
+        if writer is None:
+            return
+        self._write_q = None
+        self._writer_thread = None
+        write_q.put(None)
+        writer.join()
+    
+    def _write_log_records(self, write_q: queue.SimpleQueue, log_file):
+        """
+        Write queued log records in batches until None is queued.
+        
+        Args:
+            write_q: Queue of encoded log records
+            log_file: Open binary log file
+        """
+        idle_wait = max(self.flush_interval, 0.01)
+        last_flush = time.monotonic()
+        stopping = False
+        try:
+            while not stopping:
+                try:
+                    batch = [write_q.get(timeout=idle_wait)]
+                except queue.Empty:
+                    log_file.flush()
+                    last_flush = time.monotonic()
+                    continue
+                
+                # Take whatever else is already queued, up to one batch
+                try:
+                    while len(batch) < LOG_WRITE_BATCH:
+                        batch.append(write_q.get_nowait())
+                except queue.Empty:
+                    pass
+                if None in batch:
+                    del batch[batch.index(None):]
+                    stopping = True
+                
+                log_file.writelines(batch)
+                now = time.monotonic()
+                if now - last_flush >= self.flush_interval:
+                    log_file.flush()
+                    last_flush = now
+        except Exception as e:
+            self.logger.error(f"Failed to write to log file: {e}")
+    
+    def flush_log_file(self):
+        """Flush buffered log lines to disk, e.g. while the serial port is idle."""
+        log_file = self.log_file
+        if log_file and not log_file.closed:
+            log_file.flush()
+            self._last_flush = time.monotonic()
+        if self.console_output != 'none':
+            sys.stdout.flush()
+    
+    def _compile_filter_patterns(self, patterns: List[str]) -> List[re.Pattern]:
+        """
+        Compile filter regex patterns, skipping any that are invalid.
+        
+        Args:
+            patterns: List of regex pattern strings
             
         Returns:
-            bool: True if data should be logged, False otherwise
+            List[re.Pattern]: Compiled patterns
         """
-        filters = self.config.get('filters', {})
+        compiled = []
+        for pattern in patterns:
+            try:
+                compiled.append(re.compile(pattern))
+            except re.error as e:
+                self.logger.warning(f"Invalid filter pattern '{pattern}': {e}")
+        return compiled
+    
+    def _union_filter_patterns(self, compiled: List[re.Pattern]) -> List[re.Pattern]:
+        """
+        Combine filter patterns into a single alternation so each line is searched once.
+        
+        Args:
+            compiled: List of compiled filter patterns
+            
+        Returns:
+            List[re.Pattern]: One combined pattern, or the original list if the
+            patterns cannot be safely combined
+        """
+        if len(compiled) < 2:
+            return compiled
+        # Inline flags such as (?i) would apply to every alternative
+        if any(p.flags != re.UNICODE or NUMBERED_BACKREF.search(p.pattern) for p in compiled):
+            return compiled
+        try:
+            return [re.compile('|'.join(f'(?:{p.pattern})' for p in compiled))]
+        except re.error:
+            # e.g. duplicate group names across patterns
+            return compiled
+    
+    def _bytes_filter_patterns(self, compiled: List[re.Pattern]) -> Optional[List[re.Pattern]]:
+        """
+        Compile bytes versions of filter patterns.
+        
+        Args:
+            compiled: List of compiled str filter patterns
+            
+        Returns:
+            List[re.Pattern]: Equivalent bytes patterns, or None if any pattern
+            cannot be expressed as an ASCII bytes regex
+        """
+        try:
+            return [re.compile(p.pattern.encode('ascii'), p.flags & ~re.UNICODE) for p in compiled]
+        except (UnicodeEncodeError, re.error):
+            return None
+    
+    def _passes_filters(self, data: Union[str, bytes], exclude_res: List[re.Pattern],
+                        include_res: List[re.Pattern]) -> bool:
+        """
+        Apply the length, blank-line, exclude and include filters to one line.
         
+        Args:
+            data: Line to check, as str or as ASCII bytes
+            exclude_res: Exclude patterns matching the type of data
+            include_res: Include patterns matching the type of data
+            
+        Returns:
+            bool: True if data should be logged, False otherwise
+        """
         # Check minimum/maximum length
-        min_length = filters.get('min_data_length', 0)
-        max_length = filters.get('max_data_length', float('inf'))
+        length = len(data)
+        if length < self._min_length or length > self._max_length:
+            return False
         
-        if len(data) < min_length or len(data) > max_length:
+        # Blank lines are rejected up front when a blank-line exclude is configured
+        if self._excludes_blank and (not data or data.isspace()):
             return False
         
         # Check exclude patterns
-        exclude_patterns = filters.get('exclude_patterns', [])
-        for pattern in exclude_patterns:
-            if re.search(pattern, data):
+        for pattern in exclude_res:
+            if pattern.search(data):
                 return False
         
         # Check include patterns (if any specified)
-        include_patterns = filters.get('include_patterns', [])
-        if include_patterns:
-            for pattern in include_patterns:
-                if re.search(pattern, data):
+        if include_res:
+            for pattern in include_res:
+                if pattern.search(data):
                     return True
             return False
         
         return True
     
+    def filter_data(self, data: str) -> bool:
+        """
+        Check if data should be logged based on filters.
+        
+        Args:
+            data: Data to check
+            
+        Returns:
+            bool: True if data should be logged, False otherwise
+        """
+        return self._passes_filters(data, self._exclude_res, self._include_res)
+    
+    def filter_raw_data(self, raw: bytes) -> Optional[str]:
+        """
+        Filter a raw line read from the serial port, decoding it only if accepted.
+        
+        ASCII lines are checked against the bytes patterns, where str and bytes regexes
+        agree; other lines are decoded first and checked with filter_data.
+        
+        Args:
+            raw: Raw bytes received from the serial port
+            
+        Returns:
+            str: Decoded line if it should be logged, None otherwise
+        """
+        line = self._filter_raw(raw)
+        if isinstance(line, bytes):
+            return line.decode('ascii')
+        return line
+    
+    def _filter_raw(self, raw: bytes) -> Optional[Union[str, bytes]]:
+        """
+        Filter a raw line, decoding it only when the bytes cannot stand in for the text.
+        
+        Plain lines (ASCII without information separators) are returned as the raw
+        bytes: stripping and writing them matches the decoded text, and they are
+        decoded later only if something needs the text.
+        
+        Args:
+            raw: Raw bytes received from the serial port
+            
+        Returns:
+            bytes or str: Accepted line, raw for plain lines and decoded otherwise;
+            None if the line is filtered out
+        """
+        plain = raw.isascii() and not ASCII_INFO_SEPARATORS.search(raw)
+        if plain and self._bytes_filters:
+            if self._passes_filters(raw, self._exclude_bytes_res, self._include_bytes_res):
+                return raw
+            return None
+        
+        data = raw.decode('utf-8', errors='ignore')
+        if data and self.filter_data(data):
+            return raw if plain else data
+        return None
+    
     def start_logging(self):
         """Start serial data logging."""
         if not self.connect():
@@ -199,31 +872,54 @@ class SerialLogger:
             raise Exception("Failed to setup log file")
         
         self.running = True
+        self._prepare_line_handling()
+        self._start_writer()
         self.logger.info("Starting serial data logging...")
         
+        # A reader thread blocks on the port while this thread filters, logs and parses
+        rx_queue = queue.SimpleQueue()
+        reader = threading.Thread(target=self._read_serial, args=(rx_queue,),
+                                  name='serial-reader', daemon=True)
+        reader.start()
+        
+        rx_buf = bytearray()
         try:
-            while self.running:
-                if self.serial_conn.in_waiting > 0:
-                    data = self.serial_conn.readline().decode('utf-8', errors='ignore')
-                    
-                    if data and self.filter_data(data):
-                        timestamp = datetime.now()
-                        
-                        # Write to log file
-                        self.write_to_log(data, timestamp)
-                        
-                        # Parse data if enabled
-                        if self.parse_data and self.data_parser:
-                            parsed_result = self.data_parser.parse_line(data, timestamp)
-                            if parsed_result:
-                                self.parsed_data.append(parsed_result)
-                                print(f"Parsed: {parsed_result}")
-                        
-                        # Display raw data
-                        print(f"[{timestamp.strftime('%H:%M:%S')}] {data.strip()}")
+            while True:
+                try:
+                    chunk = rx_queue.get(timeout=READER_QUEUE_WAIT_S)
+                except queue.Empty:
+                    # Nothing arriving: push buffered lines out instead of waiting
+                    # for the next write to reach the flush interval
+                    self.flush_log_file()
+                    continue
+                if chunk is None:
+                    break
+                if isinstance(chunk, Exception):
+                    raise chunk
                 
-                time.sleep(0.01)  # Small delay to prevent excessive CPU usage
+                if chunk:
+                    rx_buf += chunk
+                    end = rx_buf.rfind(b'\n') + 1
+                    if not end:
+                        continue
+                    lines = SERIAL_LINE.findall(rx_buf, 0, end)
+                    del rx_buf[:end]
+                elif rx_buf:
+                    # The port went quiet mid-line; hand over the partial line as
+                    # readline would on timeout
+                    lines = [bytes(rx_buf)]
+                    rx_buf.clear()
+                else:
+                    self.flush_log_file()
+                    continue
                 
+                for data in lines:
+                    self._handle_line(data)
+            
+            # Keep a trailing partial line if the log is still open
+            if rx_buf and self.log_file:
+                self._handle_line(bytes(rx_buf))
+        
         except KeyboardInterrupt:
             self.stop_logging()
         except Exception as e:
@@ -231,120 +927,811 @@ class SerialLogger:
             self.stop_logging()
             raise
     
-    def stop_logging(self):
-        """Stop serial data logging."""
-        self.running = False
-        self.disconnect()
-        self.close_log_file()
+    def _prepare_line_handling(self):
+        """Resolve the per-line parse and echo settings once before reading starts."""
+        self._line_parser = self.data_parser if self.parse_data else None
+        self._echo_all = self.console_output == 'all'
+    
+    def _read_serial(self, rx_queue: queue.SimpleQueue):
+        """
+        Read from the serial port until logging stops, queueing each chunk.
         
-        if self.parse_data and self.parsed_data:
-            self.logger.info(f"Logging stopped. Parsed {len(self.parsed_data)} entries.")
-        else:
-            self.logger.info("Logging stopped.")
+        An empty chunk marks a read that timed out, None marks the end of reading,
+        and a read error is queued as the exception itself.
+        
+        Args:
+            rx_queue: Queue consumed by start_logging
+        """
+        try:
+            fd = self._serial_fd()
+            if fd is not None:
+                self._read_serial_fd(fd, rx_queue)
+            # With a zero timeout read() returns at once; back off on empty reads
+            # instead of queueing them
+            non_blocking = self.serial_conn.timeout == 0
+            while self.running:
+                # Take everything the port has buffered in one read; with nothing
+                # waiting, block for one byte until the port timeout expires
+                chunk = self.serial_conn.read(max(1, self.serial_conn.in_waiting))
+                if chunk or not non_blocking:
+                    rx_queue.put(chunk)
+                else:
+                    time.sleep(SERIAL_POLL_WAIT_S)
+        except Exception as e:
+            # Errors caused by stop_logging closing the port are expected
+            if self.running:
+                rx_queue.put(e)
+        finally:
+            rx_queue.put(None)
     
-    def get_log_file(self) -> Optional[str]:
+    def _serial_fd(self) -> Optional[int]:
+        """
+        Get the file descriptor of the serial port when it can be read directly.
+        
+        Returns:
+            int: File descriptor on POSIX platforms, or None to read through pyserial
+        """
+        if os.name != 'posix':
+            return None
+        try:
+            return self.serial_conn.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+    
+    def _read_serial_fd(self, fd: int, rx_queue: queue.SimpleQueue):
+        """
+        Read from the serial port's file descriptor until logging stops.
+        
+        Waits with select and takes whatever the driver has buffered with one
+        os.read, skipping pyserial's per-read in_waiting query and read loop.
+        
+        Args:
+            fd: File descriptor of the open serial port
+            rx_queue: Queue consumed by start_logging
+        """
+        timeout = self.serial_conn.timeout
+        # Only a positive port timeout marks quiet periods for start_logging
+        mark_timeouts = timeout is not None and timeout > 0
+        # Wake up at least every READER_QUEUE_WAIT_S to notice stop_logging, but
+        # never poll faster: a zero timeout would otherwise spin
+        wait = max(timeout, READER_QUEUE_WAIT_S) if mark_timeouts else READER_QUEUE_WAIT_S
+        while self.running:
+            ready, _, _ = select.select([fd], [], [], wait)
+            if not ready:
+                if mark_timeouts:
+                    rx_queue.put(b'')
+                continue
+            chunk = os.read(fd, SERIAL_READ_SIZE)
+            if not chunk:
+                # Readable with no data: the device went away
+                raise serial.SerialException(
+                    "device reports readiness to read but returned no data")
+            rx_queue.put(chunk)
+    
+    def _handle_line(self, raw: bytes):
+        """
+        Filter, log and optionally parse one line received from the serial port.
+        
+        Args:
+            raw: Raw line, including its newline if one was received
+        """
+        # Plain ASCII lines stay bytes through filtering and logging
+        line = self._filter_raw(raw)
+        if line is None:
+            return
+        
+        log_timestamp, timestamp, clock = self._line_timestamps()
+        
+        # Write to log file
+        self._write_log_record(log_timestamp, line)
+        
+        parser = self._line_parser
+        echo = self._echo_all or self._should_echo()
+        if parser is None and not echo:
+            return
+        
+        # Text is only needed for parsing and display
+        data = line.decode('ascii') if isinstance(line, bytes) else line
+        
+        # Parse data if enabled
+        if parser is not None:
+            columns = self.parsed_columns
+            if parser.parse_line_into(columns, data, timestamp):
+                if self._echo_all:
+                    sys.stdout.write(f"Parsed: {columns.record(-1)}\n")
+                elif self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Parsed: %s", columns.record(-1))
+        
+        # Display raw data
+        if echo:
+            sys.stdout.write(f"[{clock}] {data.strip()}\n")
+    
+    def _line_timestamps(self) -> tuple:
+        """
+        Timestamp a received line for the log file, the parser and the console.
+        
+        The date and time of day are formatted once per second; lines within the
+        same second only format their microseconds.
+        
+        Returns:
+            tuple: (log timestamp, ISO timestamp, time of day)
+        """
+        second, nanoseconds = divmod(time.time_ns(), 1_000_000_000)
+        microsecond = nanoseconds // 1000
+        if second != self._clock_second:
+            local = time.localtime(second)
+            date, clock = time.strftime('%Y-%m-%d', local), time.strftime('%H:%M:%S', local)
+            log_prefix = None
+            if self._ts_iso is not None:
+                log_prefix = f'{date}{self._ts_iso[0]}{clock}'
+            self._clock_second = second
+            self._clock_text = (log_prefix, f'{date}T{clock}', clock)
+        log_prefix, iso_prefix, clock = self._clock_text
+        
+        # Match datetime.isoformat, which leaves out zero microseconds
+        iso_timestamp = f'{iso_prefix}.{microsecond:06d}' if microsecond else iso_prefix
+        if log_prefix is None:
+            timestamp = datetime.fromtimestamp(second).replace(microsecond=microsecond)
+            log_timestamp = timestamp.strftime(self._ts_fmt)
+        elif self._ts_iso[1] == 'microseconds':
+            log_timestamp = f'{log_prefix}.{microsecond:06d}'
+        else:
+            log_timestamp = log_prefix
+        return log_timestamp, iso_timestamp, clock
+    
+    def _should_echo(self) -> bool:
+        """
+        Decide whether the current line is echoed to the console.
+        
+        Returns:
+            bool: True if the line should be printed
+        """
+        if self.console_output == 'all':
+            return True
+        if self.console_output == 'sampled':
+            shown = self._console_count % self._print_every_n == 0
+            self._console_count += 1
+            return shown
+        return False
+    
+    def stop_logging(self):
+        """Stop serial data logging."""
+        self.running = False
+        self.disconnect()
+        self.close_log_file()
+        
+        parsed_count = len(self.parsed_columns)
+        if self.parse_data and parsed_count:
+            self.logger.info(f"Logging stopped. Parsed {parsed_count} entries.")
+        else:
+            self.logger.info("Logging stopped.")
+    
+    def get_log_file(self) -> Optional[str]:
+        """
+        Get the path to the current log file.
+        
+        Returns:
+            str: Path to log file, or None if no file is open
+        """
+        return str(self.log_file_path) if self.log_file_path else None
+    
+    @property
+    def parsed_data(self) -> ParsedDataView:
+        """Parsed data entries, as a read-only view of the stored columns."""
+        return ParsedDataView(self.parsed_columns)
+    
+    def iter_parsed_data(self):
+        """
+        Iterate over parsed data collected during logging.
+        
+        Entries are built from the stored columns one at a time.
+        
+        Yields:
+            Dict[str, Any]: Parsed data entry
+        """
+        return iter(ParsedDataView(self.parsed_columns))
+    
+    def get_parsed_data(self, copy: bool = False) -> Union[ParsedDataView, List[Dict[str, Any]]]:
+        """
+        Get parsed data collected during logging.
+        
+        Args:
+            copy: Return an independent list instead of a view that keeps
+                growing while logging continues
+        
+        Returns:
+            ParsedDataView or List[Dict[str, Any]]: Parsed data entries
+        """
+        view = ParsedDataView(self.parsed_columns)
+        return list(view) if copy else view
+
+
+# Static parts of the HTML report, encoded once at import
+HTML_REPORT_HEAD = b"""
+<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Serial Data Analysis Report</title>
+    <style>
+        body {
+            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
+            margin: 0;
+            padding: 20px;
+            background-color: #f5f5f5;
+            color: #333;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+            background: white;
+            border-radius: 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+            overflow: hidden;
+        }
+        .header {
+            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+            color: white;
+            padding: 30px;
+            text-align: center;
+        }
+        .header h1 {
+            margin: 0;
+            font-size: 2.5em;
+            font-weight: 300;
+        }
+        .header p {
+            margin: 10px 0 0 0;
+            opacity: 0.9;
+            font-size: 1.1em;
+        }
+        .stats {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            padding: 30px;
+            background: #f8f9fa;
+        }
+        .stat-card {
+            background: white;
+            padding: 20px;
+            border-radius: 8px;
+            text-align: center;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .stat-number {
+            font-size: 2em;
+            font-weight: bold;
+            color: #667eea;
+            margin-bottom: 5px;
+        }
+        .stat-label {
+            color: #666;
+            font-size: 0.9em;
+            text-transform: uppercase;
+            letter-spacing: 1px;
+        }
+        .patterns {
+            padding: 30px;
+        }
+        .patterns h2 {
+            color: #333;
+            border-bottom: 2px solid #667eea;
+            padding-bottom: 10px;
+            margin-bottom: 20px;
+        }
+        .pattern-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .pattern-card {
+            background: #f8f9fa;
+            border: 1px solid #e9ecef;
+            border-radius: 8px;
+            padding: 20px;
+            transition: transform 0.2s, box-shadow 0.2s;
+        }
+        .pattern-card:hover {
+            transform: translateY(-2px);
+            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
+        }
+        .pattern-name {
+            font-size: 1.2em;
+            font-weight: bold;
+            color: #667eea;
+            margin-bottom: 5px;
+        }
+        .pattern-count {
+            font-size: 1.5em;
+            color: #28a745;
+            font-weight: bold;
+        }
+        .pattern-type {
+            color: #666;
+            font-size: 0.9em;
+            margin-top: 5px;
+        }
+        .data-table {
+            margin-top: 30px;
+            overflow-x: auto;
+        }
+        .data-table table {
+            width: 100%;
+            border-collapse: collapse;
+            background: white;
+            border-radius: 8px;
+            overflow: hidden;
+            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+        }
+        .data-table th {
+            background: #667eea;
+            color: white;
+            padding: 15px;
+            text-align: left;
+            font-weight: 600;
+        }
+        .data-table td {
+            padding: 12px 15px;
+            border-bottom: 1px solid #e9ecef;
+        }
+        .data-table tr:hover {
+            background: #f8f9fa;
+        }
+        .timestamp {
+            font-family: monospace;
+            font-size: 0.9em;
+            color: #666;
+        }
+        .raw-data {
+            font-family: monospace;
+            background: #f8f9fa;
+            padding: 5px 8px;
+            border-radius: 4px;
+            font-size: 0.9em;
+            max-width: 300px;
+            overflow: hidden;
+            text-overflow: ellipsis;
+            white-space: nowrap;
+        }
+        .parsed-data {
+            font-family: monospace;
+            color: #28a745;
+        }
+        .footer {
+            background: #f8f9fa;
+            padding: 20px;
+            text-align: center;
+            color: #666;
+            border-top: 1px solid #e9ecef;
+        }
+        .no-data {
+            text-align: center;
+            padding: 40px;
+            color: #666;
+            font-style: italic;
+        }
+    </style>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>Serial Data Analysis Report</h1>
+            <p>Generated on """
+
+HTML_REPORT_STATS = """</p>
+        </div>
+        
+        <div class="stats">
+            <div class="stat-card">
+                <div class="stat-number">{total_entries}</div>
+                <div class="stat-label">Total Entries</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">{pattern_count}</div>
+                <div class="stat-label">Pattern Types</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">{type_count}</div>
+                <div class="stat-label">Data Types</div>
+            </div>
+            <div class="stat-card">
+                <div class="stat-number">{configured_count}</div>
+                <div class="stat-label">Configured Patterns</div>
+            </div>
+        </div>
+        
+        <div class="patterns">
+            <h2>Pattern Analysis</h2>
+            """
+
+HTML_REPORT_TABLE_HEAD = b"""
+        </div>
+        
+        <div class="data-table">
+            <h2>Parsed Data</h2>
+            """
+
+HTML_REPORT_FOOTER = """
+        </div>
+        
+        <div class="footer">
+            <p>Report generated by Serial Data Parser | {generated}</p>
+        </div>
+    </div>
+</body>
+</html>
+            """
+
+
+class SerialDataParser:
+    """
+    Serial data parser with configurable pattern matching.
+    
+    This class handles parsing of serial data based on regex patterns
+    defined in the configuration file.
+    """
+    
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize data parser.
+        
+        Args:
+            config: Configuration dictionary containing parsing patterns
+        """
+        self.config = config
+        self.parsing_config = config.get('data_parsing', {})
+        self.patterns = self.parsing_config.get('patterns', [])
+        
+        # 'regex_engine': 're2' matches with RE2 (linear time, no lookaround or
+        # backreferences); patterns RE2 cannot compile fall back to re
+        self.regex_engine = self.parsing_config.get('regex_engine', 're')
+        if self.regex_engine == 're2' and not RE2_AVAILABLE:
+            logging.warning("regex_engine 're2' requested but google-re2 is not installed; using re")
+            self.regex_engine = 're'
+        
+        self._compile_patterns()
+        
+        # Timestamp formatter resolved once rather than per matched line
+        self._iso = datetime.isoformat
+        
+        self._build_fused_pattern()
+        
+        # Repeated frames (heartbeats, status polls) reuse their parsed fields
+        cache_size = self.parsing_config.get('parse_cache_size', 1024)
+        if cache_size:
+            self._parse_fields = functools.lru_cache(maxsize=cache_size)(self._parse_fields)
+    
+    def _compile_patterns(self):
+        """Compile the configured patterns into self.compiled_patterns."""
+        # Compile regex patterns for efficiency
+        self.compiled_patterns = []
+        for pattern in self.patterns:
+            try:
+                compiled = re.compile(pattern['regex'])
+                anchored = is_start_anchored(compiled)
+                find = self._engine_find(pattern, compiled, anchored)
+                pattern_type = pattern.get('type', 'string')
+                extract_groups = pattern.get('extract_groups', [])
+                labels = pattern.get('labels', [])
+                self.compiled_patterns.append(CompiledPattern(
+                    name=pattern['name'],
+                    description=pattern.get('description', ''),
+                    type=pattern_type,
+                    regex=compiled,
+                    extract_groups=extract_groups,
+                    labels=labels,
+                    is_float=pattern_type == 'float',
+                    is_int=pattern_type == 'int',
+                    group_count=compiled.groups,
+                    extractor=build_extractor(extract_groups, labels, pattern_type, compiled.groups),
+                    anchored=anchored,
+                    find=find
+                ))
+                if find.__self__ is compiled:
+                    for hazard in pattern_hazards(compiled):
+                        logging.warning(f"Pattern '{pattern['name']}' {hazard}")
+            except re.error as e:
+                logging.warning(f"Invalid regex pattern '{pattern['regex']}': {e}")
+        
+        # Per-pattern matching rows: (find, pattern, group numbers, parsed data reader),
+        # with the match function unpacked so the loop does no attribute lookups
+        self._pattern_dispatch = tuple(
+            (pattern.find, pattern, pattern.extractor[0],
+             make_parsed_data_reader(*pattern.extractor))
+            for pattern in self.compiled_patterns
+        )
+    
+    def update_patterns(self, patterns: List[Dict[str, Any]]):
+        """
+        Replace the parsing patterns and drop results cached for the old ones.
+        
+        Args:
+            patterns: New list of pattern configurations
+        """
+        self.patterns = patterns
+        self._compile_patterns()
+        self._build_fused_pattern()
+        if hasattr(self._parse_fields, 'cache_clear'):
+            self._parse_fields.cache_clear()
+    
+    def _engine_find(self, pattern: Dict[str, Any], compiled: re.Pattern,
+                     anchored: bool) -> Callable[[str], Any]:
+        """
+        Select the matching function for a pattern under the configured regex engine.
+        
+        Args:
+            pattern: Pattern configuration
+            compiled: Pattern compiled with re
+            anchored: Whether the pattern is anchored at the start of the line
+            
+        Returns:
+            Callable: match() for anchored patterns, search() otherwise
+        """
+        if self.regex_engine == 're2':
+            try:
+                engine_regex = re2.compile(pattern['regex'])
+                return engine_regex.match if anchored else engine_regex.search
+            except Exception as e:
+                logging.warning(f"Pattern '{pattern['name']}' is not supported by re2, using re: {e}")
+        
+        # Anchored patterns only need to be tried at the start of the line
+        return compiled.match if anchored else compiled.search
+    
+    def _build_fused_pattern(self):
+        """
+        Combine all patterns into one scanner so each line is matched with a single regex call.
+        
+        Each pattern becomes a lookahead alternative wrapped in a capturing group:
+        (?=(^regex0))|(?=(^regex1))|...
+        Matched at position 0, the alternatives are tried in configuration order, so the
+        first configured pattern that matches still wins. As in re.Scanner, the wrapper
+        group closes last, so match.lastindex is its group number; that number indexes
+        a dispatch table holding the pattern, its groups' numbers within the match and
+        a parsed data reader specialized for those groups.
+        
+        Only used when every pattern is anchored with ^: unanchored patterns would need a
+        scanning prefix inside the lookahead, which is slower than the engine's own
+        search() with its literal-prefix optimizations.
+        """
+        self._fused = None
+        self._fused_dispatch = []
+        
+        if len(self.compiled_patterns) < 2:
+            return
+        # The fused scanner is an re pattern; keep per-pattern matching under RE2
+        if any(p.find.__self__ is not p.regex for p in self.compiled_patterns):
+            return
+        if any(p.regex.flags != re.UNICODE or NUMBERED_BACKREF.search(p.regex.pattern)
+               or not p.anchored for p in self.compiled_patterns):
+            return
+        
+        alternatives = []
+        dispatch = [None]
+        for pattern in self.compiled_patterns:
+            offset = len(dispatch)
+            alternatives.append(f'(?=({pattern.regex.pattern}))')
+            group_numbers, keys, convert = pattern.extractor
+            group_numbers = tuple(offset + number for number in group_numbers)
+            dispatch.append(
+                (pattern, group_numbers, make_parsed_data_reader(group_numbers, keys, convert)))
+            # Group numbers of the pattern's own groups never close last
+            dispatch.extend([None] * pattern.group_count)
+        
+        try:
+            self._fused = re.compile('|'.join(alternatives))
+        except re.error:
+            # e.g. duplicate group names across patterns; keep per-pattern matching
+            return
+        self._fused_dispatch = dispatch
+    
+    def _match_line(self, data: str):
+        """
+        Find the first configured pattern matching a line.
+        
+        Args:
+            data: Raw data line
+            
+        Returns:
+            tuple: (pattern, match, group numbers of the pattern's extracted groups
+            within the match, parsed data reader), or None if no pattern matches
+        """
+        if self._fused is not None:
+            match = self._fused.match(data)
+            if match is None:
+                return None
+            pattern, group_numbers, read_parsed = self._fused_dispatch[match.lastindex]
+            return pattern, match, group_numbers, read_parsed
+        
+        for find, pattern, group_numbers, read_parsed in self._pattern_dispatch:
+            match = find(data)
+            if match:
+                return pattern, match, group_numbers, read_parsed
+        return None
+    
+    def _build_result(self, pattern: CompiledPattern, match: re.Match, group_numbers: tuple,
+                      read_parsed: Callable, data: str, timestamp: str) -> Dict[str, Any]:
+        """
+        Build the parsed data entry for a matched line.
+        
+        Args:
+            pattern: Pattern that matched
+            match: Match object
+            group_numbers: Numbers of the extracted groups within the match
+            read_parsed: Parsed data reader for the pattern
+            data: Raw data line
+            timestamp: ISO formatted timestamp of the data
+            
+        Returns:
+            Dict[str, Any]: Parsed data entry
+        """
+        return {
+            'timestamp': timestamp,
+            'pattern_name': pattern.name,
+            'pattern_type': pattern.type,
+            'raw_data': data.strip(),
+            'parsed_data': read_parsed(match)
+        }
+    
+    def parse_line(self, data: str, timestamp: datetime) -> Optional[Dict[str, Any]]:
+        """
+        Parse a single line of serial data.
+        
+        Args:
+            data: Raw data line to parse
+            timestamp: Timestamp of the data
+            
+        Returns:
+            Dict[str, Any]: Parsed data entry, or None if no pattern matches
+        """
+        fields = self._parse_fields(data)
+        if fields is None:
+            return None
+        pattern_name, pattern_type, raw_data, parsed_data, _ = fields
+        # Fresh dicts on every call; callers may modify what they get back
+        return {
+            'timestamp': self._iso(timestamp),
+            'pattern_name': pattern_name,
+            'pattern_type': pattern_type,
+            'raw_data': raw_data,
+            'parsed_data': dict(parsed_data)
+        }
+    
+    def parse_line_into(self, columns: ParsedColumns, data: str,
+                        timestamp: Union[datetime, str]) -> bool:
         """
-        Get the path to the current log file.
+        Parse a single line of serial data straight into a column store.
         
+        Args:
+            columns: Column store to append the entry to
+            data: Raw data line to parse
+            timestamp: Timestamp of the data, or its ISO formatted text
+            
         Returns:
-            str: Path to log file, or None if no file is open
+            bool: True if a pattern matched and an entry was appended
         """
-        return str(self.log_file_path) if self.log_file_path else None
+        fields = self._parse_fields(data)
+        if fields is None:
+            return False
+        if not isinstance(timestamp, str):
+            timestamp = self._iso(timestamp)
+        columns.append(timestamp, *fields)
+        return True
     
-    def get_parsed_data(self) -> List[Dict[str, Any]]:
+    def _parse_fields(self, data: str) -> Optional[tuple]:
         """
-        Get parsed data collected during logging.
+        Parse the timestamp-independent fields of a line.
+        
+        Wrapped in an LRU cache per parser unless parse_cache_size is 0; the returned
+        tuple and its dict are shared between cache hits and must not be modified.
         
+        Args:
+            data: Raw data line to parse
+            
         Returns:
-            List[Dict[str, Any]]: List of parsed data entries
+            tuple: (pattern name, pattern type, raw data, parsed data, parsed data
+            labels), or None if no pattern matches
         """
-        return self.parsed_data.copy()
-
-
-class SerialDataParser:
-    """
-    Serial data parser with configurable pattern matching.
-    
-    This class handles parsing of serial data based on regex patterns
-    defined in the configuration file.
-    """
+        found = self._match_line(data)
+        if found is None:
+            return None
+        pattern, match, _, read_parsed = found
+        parsed_data = read_parsed(match)
+        return pattern.name, pattern.type, data.strip(), parsed_data, tuple(parsed_data)
     
-    def __init__(self, config: Dict[str, Any]):
+    def _scan_log_file(self, log_file_path: str):
         """
-        Initialize data parser.
+        Yield the lines of a log file whose data matches a pattern.
+        
+        The file is memory-mapped and scanned for line and field separators with
+        mmap.find, so no Python string is built for a line's timestamp unless its
+        data matches a pattern. Lines that fail to decode are logged and skipped.
         
         Args:
-            config: Configuration dictionary containing parsing patterns
+            log_file_path: Path to the log file to scan
+            
+        Yields:
+            tuple: (line number, timestamp bytes, data, (pattern, match, group numbers,
+            parsed data reader))
         """
-        self.config = config
-        self.parsing_config = config.get('data_parsing', {})
-        self.patterns = self.parsing_config.get('patterns', [])
+        match_line = self._match_line
         
-        # Compile regex patterns for efficiency
-        self.compiled_patterns = []
-        for pattern in self.patterns:
+        with open(log_file_path, 'rb') as f:
             try:
-                compiled = re.compile(pattern['regex'])
-                self.compiled_patterns.append({
-                    'name': pattern['name'],
-                    'description': pattern.get('description', ''),
-                    'type': pattern.get('type', 'string'),
-                    'regex': compiled,
-                    'extract_groups': pattern.get('extract_groups', []),
-                    'labels': pattern.get('labels', [])
-                })
-            except re.error as e:
-                logging.warning(f"Invalid regex pattern '{pattern['regex']}': {e}")
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # Empty files cannot be mapped
+                return
+            
+            with mm:
+                size = len(mm)
+                pos = 0
+                line_num = 0
+                while pos < size:
+                    line_num += 1
+                    newline = mm.find(b'\n', pos)
+                    end = size if newline < 0 else newline + 1
+                    
+                    # Split timestamp and data from log line
+                    comma = mm.find(b',', pos, end)
+                    if comma >= 0:
+                        try:
+                            raw = mm[comma + 1:end]
+                            if raw.endswith(b'\r\n'):
+                                raw = raw[:-2] + b'\n'
+                            data = raw.decode('utf-8')
+                            found = match_line(data)
+                        except Exception as e:
+                            logging.warning(f"Error parsing line {line_num}: {e}")
+                            found = None
+                        if found is not None:
+                            yield line_num, mm[pos:comma], data, found
+                    
+                    pos = end
     
-    def parse_line(self, data: str, timestamp: datetime) -> Optional[Dict[str, Any]]:
+    def _parse_log_entries(self, log_file_path: str) -> Iterator[Dict[str, Any]]:
         """
-        Parse a single line of serial data.
+        Yield parsed data entries from a log file, raising if the file cannot be read.
         
         Args:
-            data: Raw data line to parse
-            timestamp: Timestamp of the data
+            log_file_path: Path to the log file to parse
             
-        Returns:
-            Dict[str, Any]: Parsed data entry, or None if no pattern matches
+        Yields:
+            Dict[str, Any]: Parsed data entry with its line number
         """
-        for pattern in self.compiled_patterns:
-            match = pattern['regex'].search(data)
-            if match:
-                result = {
-                    'timestamp': timestamp.isoformat(),
-                    'pattern_name': pattern['name'],
-                    'pattern_type': pattern['type'],
-                    'raw_data': data.strip(),
-                    'parsed_data': {}
-                }
-                
-                # Extract groups based on configuration
-                extract_groups = pattern['extract_groups']
-                labels = pattern['labels']
-                
-                for i, group_index in enumerate(extract_groups):
-                    if group_index <= len(match.groups()):
-                        value = match.group(group_index)
-                        
-                        # Convert value based on type
-                        if pattern['type'] == 'float':
-                            try:
-                                value = float(value)
-                            except ValueError:
-                                pass
-                        elif pattern['type'] == 'int':
-                            try:
-                                value = int(value)
-                            except ValueError:
-                                pass
-                        
-                        # Use label if available, otherwise use group index
-                        key = labels[i] if i < len(labels) else f'group_{group_index}'
-                        result['parsed_data'][key] = value
-                
-                return result
+        build_result = self._build_result
+        iso = self._iso
+        fromisoformat = datetime.fromisoformat
         
-        return None
+        for line_num, raw_timestamp, data, found in self._scan_log_file(log_file_path):
+            try:
+                timestamp = iso(fromisoformat(raw_timestamp.decode('utf-8').strip()))
+                parsed_result = build_result(*found, data, timestamp)
+                parsed_result['line_number'] = line_num
+            except Exception as e:
+                logging.warning(f"Error parsing line {line_num}: {e}")
+                continue
+            yield parsed_result
+    
+    def iter_parse_log_file(self, log_file_path: str) -> Iterator[Dict[str, Any]]:
+        """
+        Parse a log file lazily, one entry at a time.
+        
+        Memory use does not grow with the size of the log. A read error is
+        logged and ends the iteration.
+        
+        Args:
+            log_file_path: Path to the log file to parse
+            
+        Yields:
+            Dict[str, Any]: Parsed data entry
+        """
+        try:
+            yield from self._parse_log_entries(log_file_path)
+        except Exception as e:
+            logging.error(f"Error reading log file: {e}")
     
     def parse_log_file(self, log_file_path: str) -> List[Dict[str, Any]]:
         """
@@ -356,30 +1743,80 @@ class SerialDataParser:
         Returns:
             List[Dict[str, Any]]: List of parsed data entries
         """
-        results = []
+        try:
+            return list(self._parse_log_entries(log_file_path))
+        except Exception as e:
+            logging.error(f"Error reading log file: {e}")
+            return []
+    
+    def parse_log_file_arrays(self, log_file_path: str) -> Dict[str, Any]:
+        """
+        Parse an entire log file into one NumPy array per extracted label.
+        
+        Matched values are collected as raw strings and converted once per column,
+        so float and int conversion runs inside NumPy rather than per value. A column
+        whose values do not all convert falls back to an object array holding the
+        same values parse_line would produce. Timestamps are not parsed.
+        
+        Args:
+            log_file_path: Path to the log file to parse
+            
+        Returns:
+            Dict[str, np.ndarray]: Arrays keyed by label (or group_N when unlabeled)
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is required for parse_log_file_arrays")
+        
+        columns = {}
         
         try:
-            with open(log_file_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    try:
-                        # Parse timestamp and data from log line
-                        if ',' in line:
-                            timestamp_str, data = line.split(',', 1)
-                            timestamp = datetime.fromisoformat(timestamp_str.strip())
-                            
-                            parsed_result = self.parse_line(data, timestamp)
-                            if parsed_result:
-                                parsed_result['line_number'] = line_num
-                                results.append(parsed_result)
-                    except Exception as e:
-                        logging.warning(f"Error parsing line {line_num}: {e}")
-                        continue
+            for _, _, _, (pattern, match, group_numbers, _) in self._scan_log_file(log_file_path):
+                kind = 'float' if pattern.is_float else 'int' if pattern.is_int else 'string'
+                keys = pattern.extractor[1]
+                for key, group_number in zip(keys, group_numbers):
+                    column = columns.get(key)
+                    if column is None:
+                        column = columns[key] = ([], [])
+                    column[0].append(match.group(group_number))
+                    column[1].append(kind)
         
         except Exception as e:
             logging.error(f"Error reading log file: {e}")
-            return []
+            return {}
+        
+        converters = {'float': float, 'int': int}
+        arrays = {}
+        for key, (values, kinds) in columns.items():
+            column_kinds = set(kinds)
+            if len(column_kinds) == 1:
+                kind = kinds[0]
+                try:
+                    if kind == 'float':
+                        arrays[key] = np.asarray(values, dtype=np.str_).astype(np.float64)
+                    elif kind == 'int':
+                        arrays[key] = np.asarray(values, dtype=np.str_).astype(np.int64)
+                    elif None not in values:
+                        arrays[key] = np.asarray(values, dtype=np.str_)
+                    else:
+                        arrays[key] = np.asarray(values, dtype=object)
+                    continue
+                except (TypeError, ValueError, OverflowError):
+                    # Unmatched optional groups or non-numeric text
+                    pass
+            
+            # Convert value by value like parse_line, keeping what does not convert
+            converted = []
+            for value, kind in zip(values, kinds):
+                convert = converters.get(kind)
+                if convert is not None:
+                    try:
+                        value = convert(value)
+                    except (TypeError, ValueError):
+                        pass
+                converted.append(value)
+            arrays[key] = np.asarray(converted, dtype=object)
         
-        return results
+        return arrays
     
     def display_summary(self, results: List[Dict[str, Any]]):
         """
@@ -414,12 +1851,16 @@ class SerialDataParser:
         if len(results) > 5:
             print(f"  ... and {len(results) - 5} more entries")
     
-    def save_results(self, results: List[Dict[str, Any]], output_file: str):
+    def save_results(self, results: Iterable[Dict[str, Any]], output_file: str):
         """
         Save parsed results to file.
         
+        Results may be a list or any iterable such as iter_parse_log_file(). JSON and
+        TXT output is written as entries arrive; CSV and HTML need every entry for
+        their header and statistics, so an iterable is collected first.
+        
         Args:
-            results: List of parsed data entries
+            results: Parsed data entries
             output_file: Output file path
         """
         output_path = Path(output_file)
@@ -427,37 +1868,27 @@ class SerialDataParser:
         
         try:
             if 'json' in output_formats or output_path.suffix == '.json':
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2)
+                with open(output_path, 'wb') as f:
+                    self._write_json(f, results)
             
             elif 'csv' in output_formats or output_path.suffix == '.csv':
+                if not isinstance(results, list):
+                    results = list(results)
                 if results:
-                    # Get all unique keys from parsed data
-                    all_keys = set()
-                    for result in results:
-                        all_keys.update(result['parsed_data'].keys())
+                    # Get all unique keys from parsed data in one pass
+                    base_fields = ['timestamp', 'pattern_name', 'pattern_type', 'raw_data']
+                    all_keys = sorted(set().union(*(result['parsed_data'].keys() for result in results)))
+                    get_base = operator.itemgetter(*base_fields)
                     
-                    with open(output_path, 'w', newline='', encoding='utf-8') as f:
+                    with open(output_path, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                         writer = csv.writer(f)
-                        
-                        # Write header
-                        header = ['timestamp', 'pattern_name', 'pattern_type', 'raw_data'] + list(all_keys)
-                        writer.writerow(header)
-                        
-                        # Write data rows
-                        for result in results:
-                            row = [
-                                result['timestamp'],
-                                result['pattern_name'],
-                                result['pattern_type'],
-                                result['raw_data']
-                            ]
-                            
-                            # Add parsed data values
-                            for key in all_keys:
-                                row.append(result['parsed_data'].get(key, ''))
-                            
-                            writer.writerow(row)
+                        writer.writerow(base_fields + all_keys)
+                        # Parsed values are looked up on their own, so a parsed key named like
+                        # a base column still gets its own column; missing keys become ''
+                        writer.writerows(
+                            (*get_base(result), *[result['parsed_data'].get(key, '') for key in all_keys])
+                            for result in results
+                        )
             
             elif 'txt' in output_formats or output_path.suffix == '.txt':
                 with open(output_path, 'w', encoding='utf-8') as f:
@@ -466,17 +1897,41 @@ class SerialDataParser:
                         f.write(f"Raw: {result['raw_data']}\n\n")
             
             elif 'html' in output_formats or output_path.suffix == '.html':
+                if not isinstance(results, list):
+                    results = list(results)
                 self._generate_html_report(output_path, results)
             
             else:
                 # Default to JSON
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(results, f, indent=2)
+                with open(output_path, 'wb') as f:
+                    self._write_json(f, results)
         
         except Exception as e:
             logging.error(f"Error saving results: {e}")
             raise
     
+    def _write_json(self, f, results: Iterable[Dict[str, Any]]):
+        """
+        Write results as an indented JSON array to a binary file.
+        
+        Lists are serialized in one call; other iterables are written entry by
+        entry in the same layout, so they never have to be held in memory.
+        
+        Args:
+            f: File opened in binary write mode
+            results: Parsed data entries
+        """
+        if isinstance(results, (list, tuple)):
+            f.write(dump_json_bytes(results))
+            return
+        
+        first = True
+        for result in results:
+            f.write(b'[\n  ' if first else b',\n  ')
+            f.write(dump_json_bytes(result).replace(b'\n', b'\n  '))
+            first = False
+        f.write(b'[]' if first else b'\n]')
+    
     def _generate_html_report(self, output_path: Path, results: List[Dict[str, Any]]):
         """
         Generate an HTML report with pattern analysis and data visualization.
@@ -503,221 +1958,23 @@ class SerialDataParser:
                 timestamps = [result['timestamp'] for result in results]
                 timestamp_range = f"{min(timestamps)} to {max(timestamps)}"
             
-            # Generate HTML content
-            html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Serial Data Analysis Report</title>
-    <style>
-        body {{
-            font-family: 'Segoe UI', Tahoma, Geneva, Verdana, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-            color: #333;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            border-radius: 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            overflow: hidden;
-        }}
-        .header {{
-            background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
-            color: white;
-            padding: 30px;
-            text-align: center;
-        }}
-        .header h1 {{
-            margin: 0;
-            font-size: 2.5em;
-            font-weight: 300;
-        }}
-        .header p {{
-            margin: 10px 0 0 0;
-            opacity: 0.9;
-            font-size: 1.1em;
-        }}
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            padding: 30px;
-            background: #f8f9fa;
-        }}
-        .stat-card {{
-            background: white;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .stat-number {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #667eea;
-            margin-bottom: 5px;
-        }}
-        .stat-label {{
-            color: #666;
-            font-size: 0.9em;
-            text-transform: uppercase;
-            letter-spacing: 1px;
-        }}
-        .patterns {{
-            padding: 30px;
-        }}
-        .patterns h2 {{
-            color: #333;
-            border-bottom: 2px solid #667eea;
-            padding-bottom: 10px;
-            margin-bottom: 20px;
-        }}
-        .pattern-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(300px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .pattern-card {{
-            background: #f8f9fa;
-            border: 1px solid #e9ecef;
-            border-radius: 8px;
-            padding: 20px;
-            transition: transform 0.2s, box-shadow 0.2s;
-        }}
-        .pattern-card:hover {{
-            transform: translateY(-2px);
-            box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-        }}
-        .pattern-name {{
-            font-size: 1.2em;
-            font-weight: bold;
-            color: #667eea;
-            margin-bottom: 5px;
-        }}
-        .pattern-count {{
-            font-size: 1.5em;
-            color: #28a745;
-            font-weight: bold;
-        }}
-        .pattern-type {{
-            color: #666;
-            font-size: 0.9em;
-            margin-top: 5px;
-        }}
-        .data-table {{
-            margin-top: 30px;
-            overflow-x: auto;
-        }}
-        .data-table table {{
-            width: 100%;
-            border-collapse: collapse;
-            background: white;
-            border-radius: 8px;
-            overflow: hidden;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .data-table th {{
-            background: #667eea;
-            color: white;
-            padding: 15px;
-            text-align: left;
-            font-weight: 600;
-        }}
-        .data-table td {{
-            padding: 12px 15px;
-            border-bottom: 1px solid #e9ecef;
-        }}
-        .data-table tr:hover {{
-            background: #f8f9fa;
-        }}
-        .timestamp {{
-            font-family: monospace;
-            font-size: 0.9em;
-            color: #666;
-        }}
-        .raw-data {{
-            font-family: monospace;
-            background: #f8f9fa;
-            padding: 5px 8px;
-            border-radius: 4px;
-            font-size: 0.9em;
-            max-width: 300px;
-            overflow: hidden;
-            text-overflow: ellipsis;
-            white-space: nowrap;
-        }}
-        .parsed-data {{
-            font-family: monospace;
-            color: #28a745;
-        }}
-        .footer {{
-            background: #f8f9fa;
-            padding: 20px;
-            text-align: center;
-            color: #666;
-            border-top: 1px solid #e9ecef;
-        }}
-        .no-data {{
-            text-align: center;
-            padding: 40px;
-            color: #666;
-            font-style: italic;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>Serial Data Analysis Report</h1>
-            <p>Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
-        
-        <div class="stats">
-            <div class="stat-card">
-                <div class="stat-number">{total_entries}</div>
-                <div class="stat-label">Total Entries</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{len(pattern_counts)}</div>
-                <div class="stat-label">Pattern Types</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{len(set(pattern_types.values()))}</div>
-                <div class="stat-label">Data Types</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-number">{len(self.patterns)}</div>
-                <div class="stat-label">Configured Patterns</div>
-            </div>
-        </div>
-        
-        <div class="patterns">
-            <h2>Pattern Analysis</h2>
-            {self._generate_pattern_analysis_html(pattern_counts, pattern_types)}
-        </div>
-        
-        <div class="data-table">
-            <h2>Parsed Data</h2>
-            {self._generate_data_table_html(results)}
-        </div>
-        
-        <div class="footer">
-            <p>Report generated by Serial Data Parser | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}</p>
-        </div>
-    </div>
-</body>
-</html>
-            """
-            
-            with open(output_path, 'w', encoding='utf-8') as f:
-                f.write(html_content)
+            # Stream the page section by section instead of building it in memory
+            generated = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            with open(output_path, 'wb') as f:
+                def write(text: str):
+                    f.write(text.encode('utf-8'))
+                
+                f.write(HTML_REPORT_HEAD)
+                write(generated)
+                write(HTML_REPORT_STATS.format(
+                    total_entries=total_entries,
+                    pattern_count=len(pattern_counts),
+                    type_count=len(set(pattern_types.values())),
+                    configured_count=len(self.patterns)))
+                self._write_pattern_analysis_html(write, pattern_counts, pattern_types)
+                f.write(HTML_REPORT_TABLE_HEAD)
+                self._write_data_table_html(write, results)
+                write(HTML_REPORT_FOOTER.format(generated=generated))
                 
         except Exception as e:
             logging.error(f"Error generating HTML report: {e}")
@@ -725,34 +1982,48 @@ class SerialDataParser:
     
     def _generate_pattern_analysis_html(self, pattern_counts: Dict[str, int], pattern_types: Dict[str, str]) -> str:
         """Generate HTML for pattern analysis section."""
+        parts = []
+        self._write_pattern_analysis_html(parts.append, pattern_counts, pattern_types)
+        return ''.join(parts)
+    
+    def _write_pattern_analysis_html(self, write, pattern_counts: Dict[str, int], pattern_types: Dict[str, str]):
+        """Write HTML for pattern analysis section through the given write callable."""
         if not pattern_counts:
-            return '<div class="no-data">No pattern data available</div>'
+            write('<div class="no-data">No pattern data available</div>')
+            return
         
-        html = '<div class="pattern-grid">'
+        total = sum(pattern_counts.values())
+        write('<div class="pattern-grid">')
         for pattern_name, count in pattern_counts.items():
             pattern_type = pattern_types.get(pattern_name, 'unknown')
-            percentage = (count / sum(pattern_counts.values())) * 100
+            percentage = (count / total) * 100
             
-            html += f'''
+            write(f'''
             <div class="pattern-card">
                 <div class="pattern-name">{pattern_name}</div>
                 <div class="pattern-count">{count}</div>
                 <div class="pattern-type">Type: {pattern_type} | {percentage:.1f}%</div>
             </div>
-            '''
+            ''')
         
-        html += '</div>'
-        return html
+        write('</div>')
     
     def _generate_data_table_html(self, results: List[Dict[str, Any]]) -> str:
         """Generate HTML for data table section."""
+        parts = []
+        self._write_data_table_html(parts.append, results)
+        return ''.join(parts)
+    
+    def _write_data_table_html(self, write, results: List[Dict[str, Any]]):
+        """Write HTML for data table section through the given write callable."""
         if not results:
-            return '<div class="no-data">No data to display</div>'
+            write('<div class="no-data">No data to display</div>')
+            return
         
         # Limit to first 100 entries for performance
         display_results = results[:100]
         
-        html = '''
+        write('''
         <table>
             <thead>
                 <tr>
@@ -764,11 +2035,11 @@ class SerialDataParser:
                 </tr>
             </thead>
             <tbody>
-        '''
+        ''')
         
         for result in display_results:
             parsed_data_str = ', '.join([f"{k}: {v}" for k, v in result['parsed_data'].items()])
-            html += f'''
+            write(f'''
             <tr>
                 <td class="timestamp">{result['timestamp']}</td>
                 <td>{result['pattern_name']}</td>
@@ -776,17 +2047,15 @@ class SerialDataParser:
                 <td class="parsed-data">{parsed_data_str}</td>
                 <td class="raw-data" title="{result['raw_data']}">{result['raw_data'][:50]}{'...' if len(result['raw_data']) > 50 else ''}</td>
             </tr>
-            '''
+            ''')
         
-        html += '''
+        write('''
             </tbody>
         </table>
-        '''
+        ''')
         
         if len(results) > 100:
-            html += f'<p style="text-align: center; color: #666; margin-top: 20px;">Showing first 100 of {len(results)} entries</p>'
-        
-        return html
+            write(f'<p style="text-align: center; color: #666; margin-top: 20px;">Showing first 100 of {len(results)} entries</p>')
 
 
 def create_sample_serial_logger_config() -> Dict[str, Any]:
@@ -811,7 +2080,11 @@ def create_sample_serial_logger_config() -> Dict[str, Any]:
             "timestamp_format": "%Y-%m-%d %H:%M:%S.%f",
             "auto_create_dirs": True,
             "use_date_hierarchy": True,
-            "date_format": "%Y/%m_%b/%m_%d"
+            "date_format": "%Y/%m_%b/%m_%d",
+            "durability": "batched",
+            "flush_interval_s": 1.0,
+            "console_output": "all",
+            "console_sample_every": 10
         },
         "data_parsing": {
             "enabled": True,
@@ -864,7 +2137,7 @@ if __name__ == "__main__":
     config = create_sample_serial_logger_config()
     
     # Save sample config
-    with open("config/serial_logger_config.json", "w") as f:
-        json.dump(config, f, indent=2)
+    with open("config/serial_logger_config.json", "wb") as f:
+        f.write(dump_json_bytes(config))
     
     print("Sample serial logger configuration created: config/serial_logger_config.json")
@@ -1,11 +1,69 @@
 import logging
+import logging.handlers
 import os
 import json
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Sequence, Union
 from pathlib import Path
 import threading
 import queue
+from collections import deque
+
+# Optional fast JSON serializer for log entry data
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Most queued entries written per batch; each log file gets one os.write per batch
+LOG_QUEUE_BATCH = 512
+
+# Default for output.log_queue_max: most entries each log file's queue holds;
+# what happens to entries logged while it is full is up to output.log_queue_policy
+LOG_QUEUE_MAX = 100_000
+
+# output.log_queue_policy values: 'drop' counts and drops entries logged while
+# their queue is full, 'block' makes the logging thread wait for room
+LOG_QUEUE_POLICIES = ('drop', 'block')
+
+# Interval at which a blocked producer checks its queue for room again
+LOG_QUEUE_BLOCK_WAIT_S = 0.001
+
+# Most entries the log thread may find queued and still let producers write
+# directly; a larger backlog means bursts, which are left to the log thread
+LOG_DIRECT_MAX_BACKLOG = 64
+
+# Log files written by the log thread, each fed by its own queue; entries of any
+# other type go to the general log
+LOG_FILE_TYPES = ('uart', 'validation', 'general')
+
+# Queued log files are appended to through raw file descriptors
+LOG_FILE_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT
+
+# UART log line: timestamp, cycle, received data and its length as the JSON data field
+UART_LOG_LINE = '{},{},uart,{},{{"data_length":{}}}\n'.format
+
+
+def dumps_log_data(data: Any) -> str:
+    """
+    Serialize log entry data as compact JSON.
+    
+    Uses orjson when installed. The stdlib fallback writes the same compact,
+    non-ASCII-escaped form, so logs read the same either way.
+    
+    :param data: Data to serialize
+    :return: JSON text
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            # e.g. integers beyond 64 bits; the stdlib encoder handles them
+            pass
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False)
 
 
 class TestLogger:
@@ -29,19 +87,61 @@ class TestLogger:
         # Create log directory
         self.log_directory.mkdir(parents=True, exist_ok=True)
         
+        # Configuration logged by start_test; the config is fully merged by now
+        self._config_banner = f"Configuration: {json.dumps(self.config, indent=2)}"
+        
         # Generate timestamp for this test session
         self.session_timestamp = datetime.now().strftime(self.timestamp_format)
         
         # Initialize loggers
         self._setup_loggers()
         
+        # Logger methods the per-cycle log calls use, bound once; the levels they
+        # check are the ones _setup_loggers just set
+        self._log_info = self.test_logger.info
+        self._log_uart = self.uart_logger.debug
+        self._log_val = self.validation_logger.log
+        self._log_err = self.error_logger.error
+        self._uart_enabled = self.uart_logger.isEnabledFor(logging.DEBUG)
+        
         # Test cycle tracking
         self.current_cycle = 0
         self.test_start_time = None
         self.cycle_data = []
-        
-        # Thread-safe logging queue
-        self.log_queue = queue.Queue()
+        # Cycle number -> entry in cycle_data, so log calls find their cycle in O(1)
+        self._cycle_index = {}
+        
+        # Running totals for get_test_summary, kept as cycles are logged
+        self._ok_cycles = 0
+        # Cycles ended by a stop request count neither as passed nor as failed
+        self._stopped_cycles = 0
+        self._uart_total = 0
+        self._validation_total = 0
+        self._error_total = 0
+        self._duration_total = timedelta()
+        self._duration_count = 0
+        
+        # Thread-safe logging queues, one per log file: deque append/popleft are
+        # atomic, and the event wakes the log thread once per batch rather than
+        # once per entry
+        self.log_queues: Dict[str, deque] = {log_type: deque() for log_type in LOG_FILE_TYPES}
+        self._log_wake = threading.Event()
+        # A slow disk must not let the queues grow without bound
+        output_config = config.get('output', {})
+        self._log_queue_max = output_config.get('log_queue_max', LOG_QUEUE_MAX)
+        self._log_queue_policy = output_config.get('log_queue_policy', 'drop')
+        if self._log_queue_policy not in LOG_QUEUE_POLICIES:
+            raise ValueError(f"output.log_queue_policy must be one of {LOG_QUEUE_POLICIES}, "
+                             f"not {self._log_queue_policy!r}")
+        # Dropped entries per log file, each counted under that file's lock
+        self._dropped_entries = {log_type: 0 for log_type in LOG_FILE_TYPES}
+        # While the log thread keeps up, producers write entries to an idle log file
+        # themselves instead of waking the thread; a file's lock covers its writes
+        self._direct_mode = True
+        self._log_locks = {log_type: threading.Lock() for log_type in LOG_FILE_TYPES}
+        # Second and formatted date and time of the last entry written, swapped as
+        # one tuple since producers and the log thread both format entries
+        self._ts_cache = (None, None)
         self.log_thread = None
         self.is_logging = True
         
@@ -50,27 +150,75 @@ class TestLogger:
     
     def _setup_loggers(self):
         """Setup different loggers for different purposes."""
+        # Common parent: holds the handler that queues every test record, and keeps
+        # test records out of any root handlers the application configured
+        self.parent_logger = logging.getLogger('test')
+        self.parent_logger.propagate = False
+        
         # Main test logger
-        self.test_logger = logging.getLogger('test_main')
+        self.test_logger = logging.getLogger('test.main')
         self.test_logger.setLevel(logging.INFO)
         
         # UART data logger
-        self.uart_logger = logging.getLogger('uart_data')
+        self.uart_logger = logging.getLogger('test.uart')
         self.uart_logger.setLevel(logging.DEBUG)
         
         # Validation logger
-        self.validation_logger = logging.getLogger('validation')
+        self.validation_logger = logging.getLogger('test.validation')
         self.validation_logger.setLevel(logging.INFO)
         
         # Error logger
-        self.error_logger = logging.getLogger('errors')
+        self.error_logger = logging.getLogger('test.errors')
         self.error_logger.setLevel(logging.ERROR)
         
+        # Handlers for all test loggers, each limited to its own logger's records
+        self._log_handlers: List[logging.Handler] = []
+        
         # Setup file handlers
         self._setup_file_handlers()
         
         # Setup console handler
         self._setup_console_handler()
+        
+        # Run the handlers on a listener thread instead of the logging threads
+        self._start_log_listener()
+    
+    def _add_log_handler(self, handler: logging.Handler, logger: logging.Logger):
+        """
+        Register a handler for one logger's records.
+        
+        :param handler: Handler to run on the listener thread
+        :param logger: Logger whose records the handler receives
+        """
+        handler.addFilter(logging.Filter(logger.name))
+        self._log_handlers.append(handler)
+    
+    def _start_log_listener(self):
+        """Queue test records on the parent logger and handle them on a listener thread."""
+        # The newest TestLogger owns the test loggers; drop what an earlier one left
+        for handler in list(self.parent_logger.handlers):
+            self.parent_logger.removeHandler(handler)
+            handler.close()
+        
+        log_records = queue.SimpleQueue()
+        self._log_queue_handler = logging.handlers.QueueHandler(log_records)
+        self.parent_logger.addHandler(self._log_queue_handler)
+        self._log_listener = logging.handlers.QueueListener(
+            log_records, *self._log_handlers, respect_handler_level=True)
+        self._log_listener.start()
+    
+    def _stop_log_listener(self):
+        """Handle the queued records, then hand later records to the handlers directly."""
+        if self._log_listener is None:
+            return
+        self._log_listener.stop()
+        self._log_listener = None
+        
+        # Records after the test ends (a repeated end_test, the CSV export) are rare
+        if self._log_queue_handler in self.parent_logger.handlers:
+            self.parent_logger.removeHandler(self._log_queue_handler)
+            for handler in self._log_handlers:
+                self.parent_logger.addHandler(handler)
     
     def _setup_file_handlers(self):
         """Setup file handlers for different log types."""
@@ -82,7 +230,7 @@ class TestLogger:
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
         test_handler.setFormatter(test_formatter)
-        self.test_logger.addHandler(test_handler)
+        self._add_log_handler(test_handler, self.test_logger)
         
         # UART data log
         uart_log_file = self.log_directory / f"uart_{self.session_timestamp}.log"
@@ -90,21 +238,32 @@ class TestLogger:
         uart_handler.setLevel(logging.DEBUG)
         uart_formatter = logging.Formatter('%(asctime)s - %(message)s')
         uart_handler.setFormatter(uart_formatter)
-        self.uart_logger.addHandler(uart_handler)
+        self._add_log_handler(uart_handler, self.uart_logger)
         
         # Validation log
         validation_log_file = self.log_directory / f"validation_{self.session_timestamp}.log"
         validation_handler = logging.FileHandler(validation_log_file, encoding='utf-8')
         validation_handler.setLevel(logging.INFO)
         validation_handler.setFormatter(test_formatter)
-        self.validation_logger.addHandler(validation_handler)
+        self._add_log_handler(validation_handler, self.validation_logger)
         
         # Error log
         error_log_file = self.log_directory / f"errors_{self.session_timestamp}.log"
         error_handler = logging.FileHandler(error_log_file, encoding='utf-8')
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(test_formatter)
-        self.error_logger.addHandler(error_handler)
+        self._add_log_handler(error_handler, self.error_logger)
+        
+        # Files written by the log thread, kept open for the whole session. Writes
+        # are unbuffered, so each batch is on disk as soon as it is written
+        self._log_fds: Dict[str, int] = {}
+        log_files = {
+            'uart': uart_log_file,
+            'validation': validation_log_file,
+            'general': self.log_directory / f"general_{self.session_timestamp}.log",
+        }
+        for log_type in LOG_FILE_TYPES:
+            self._log_fds[log_type] = os.open(log_files[log_type], LOG_FILE_FLAGS, 0o644)
     
     def _setup_console_handler(self):
         """Setup console handler for real-time output."""
@@ -115,9 +274,9 @@ class TestLogger:
         )
         console_handler.setFormatter(console_formatter)
         
-        # Add to all loggers
-        for logger in [self.test_logger, self.validation_logger, self.error_logger]:
-            logger.addHandler(console_handler)
+        # Takes records from every test logger; UART records are DEBUG and stay
+        # below the handler's level
+        self._log_handlers.append(console_handler)
     
     def _start_logging_thread(self):
         """Start background thread for processing log queue."""
@@ -126,54 +285,216 @@ class TestLogger:
     
     def _process_log_queue(self):
         """Process log queue in background thread."""
+        queues = self.log_queues
+        locks = self._log_locks
         while self.is_logging:
             try:
-                log_entry = self.log_queue.get(timeout=1.0)
-                self._write_log_entry(log_entry)
-            except queue.Empty:
-                continue
+                if not any(queues.values()):
+                    self._log_wake.wait(timeout=1.0)
+                    # Entries queued after this are signalled again
+                    self._log_wake.clear()
+                backlog = 0
+                for log_type, log_queue in queues.items():
+                    if log_queue:
+                        backlog += len(log_queue)
+                        with locks[log_type]:
+                            self._write_log_batch(log_type, self._drain_log_queue(log_queue))
+                # Queue everything during a burst; write directly again once it is over
+                self._direct_mode = backlog <= LOG_DIRECT_MAX_BACKLOG
             except Exception as e:
                 print(f"Error processing log queue: {e}")
+        
+        # Write whatever was queued before the test ended
+        for log_type, log_queue in queues.items():
+            with locks[log_type]:
+                while log_queue:
+                    self._write_log_batch(log_type, self._drain_log_queue(log_queue))
+    
+    def _queue_log_entry(self, log_type: str, timestamp: Union[datetime, int], cycle: Any,
+                         message: str, data: Optional[Dict]):
+        """
+        Write a log entry, directly or through the log thread.
+        
+        :param log_type: Entry type; 'uart' and 'validation' have their own log files,
+            and 'uart' entries are written with their message length as data
+        :param timestamp: Entry time, as a datetime or a time.time_ns() value
+        :param cycle: Test cycle number
+        :param message: Log message
+        :param data: Extra data written as JSON, if any
+        """
+        file_type = log_type if log_type in self.log_queues else 'general'
+        self._submit_log_entry(file_type, (log_type, timestamp, cycle, message, data))
+    
+    def _submit_log_entry(self, file_type: str, log_entry: tuple):
+        """
+        Write a log entry straight to an idle log file, or queue it for the log thread.
+        
+        :param file_type: Log file for the entry, one of LOG_FILE_TYPES
+        :param log_entry: (type, timestamp, cycle, message, data) tuple
+        """
+        log_queue = self.log_queues[file_type]
+        if self._direct_mode and not log_queue:
+            lock = self._log_locks[file_type]
+            # Never wait for the log thread; a busy file means the entry is queued
+            if lock.acquire(blocking=False):
+                try:
+                    # Entries queued meanwhile go first, so this one follows them
+                    if self._direct_mode and not log_queue:
+                        self._write_log_batch(file_type, (log_entry,))
+                        return
+                finally:
+                    lock.release()
+        
+        if len(log_queue) >= self._log_queue_max and not self._wait_for_log_queue(log_queue):
+            self._drop_log_entry(file_type)
+            return
+        log_queue.append(log_entry)
+        # Event.set takes a lock; skip it while the log thread is already signalled
+        if not self._log_wake.is_set():
+            self._log_wake.set()
     
-    def _write_log_entry(self, log_entry: Dict):
-        """Write log entry to appropriate file."""
+    def _wait_for_log_queue(self, log_queue: deque) -> bool:
+        """
+        Wait for room in a full log queue, if output.log_queue_policy is 'block'.
+        
+        :param log_queue: Full queue
+        :return: True once the queue has room, False if the entry is to be dropped
+        """
+        if self._log_queue_policy != 'block':
+            return False
+        while len(log_queue) >= self._log_queue_max:
+            # Nothing drains the queue once the log thread is gone
+            if not (self.is_logging and self.log_thread is not None and self.log_thread.is_alive()):
+                return False
+            self._log_wake.set()
+            time.sleep(LOG_QUEUE_BLOCK_WAIT_S)
+        return True
+    
+    def _drop_log_entry(self, file_type: str):
+        """
+        Count an entry dropped from a full log queue, warning about the first one.
+        
+        :param file_type: Log file the entry was for
+        """
+        with self._log_locks[file_type]:
+            self._dropped_entries[file_type] += 1
+            first_drop = self._dropped_entries[file_type] == 1
+        if first_drop:
+            self.test_logger.warning(
+                f"{file_type} log queue is full ({self._log_queue_max} entries); dropping "
+                f"entries until the log thread catches up")
+    
+    @staticmethod
+    def _drain_log_queue(log_queue: deque) -> List[tuple]:
+        """
+        Take the entries already waiting in a log queue, without blocking.
+        
+        :param log_queue: Queue to drain
+        :return: Batch of at most LOG_QUEUE_BATCH entries
+        """
+        batch = []
+        popleft = log_queue.popleft
         try:
-            log_type = log_entry.get('type', 'general')
-            timestamp = log_entry.get('timestamp', datetime.now())
-            message = log_entry.get('message', '')
-            data = log_entry.get('data', {})
-            
-            # Format log line
-            log_line = f"{timestamp.isoformat()},{log_entry.get('cycle', 'N/A')},{log_type},{message}"
-            
-            if data:
-                log_line += f",{json.dumps(data)}"
-            
-            log_line += "\n"
-            
-            # Write to appropriate log file
-            if log_type == 'uart':
-                uart_log_file = self.log_directory / f"uart_{self.session_timestamp}.log"
-                with open(uart_log_file, 'a', encoding='utf-8') as f:
-                    f.write(log_line)
-            elif log_type == 'validation':
-                validation_log_file = self.log_directory / f"validation_{self.session_timestamp}.log"
-                with open(validation_log_file, 'a', encoding='utf-8') as f:
-                    f.write(log_line)
-            else:
-                # General log
-                general_log_file = self.log_directory / f"general_{self.session_timestamp}.log"
-                with open(general_log_file, 'a', encoding='utf-8') as f:
-                    f.write(log_line)
-                    
+            while len(batch) < LOG_QUEUE_BATCH:
+                batch.append(popleft())
+        except IndexError:
+            pass
+        return batch
+    
+    def _write_log_batch(self, log_type: str, batch: Sequence[tuple]):
+        """
+        Write a batch of log entries to one log file with a single os.write call.
+        
+        Called with the file's lock held.
+        
+        :param log_type: Log file to write, one of LOG_FILE_TYPES
+        :param batch: Entries for that file
+        """
+        lines = []
+        for log_entry in batch:
+            try:
+                lines.append(self._format_log_entry(log_entry).encode('utf-8'))
+            except Exception as e:
+                print(f"Error writing log entry: {e}")
+        
+        try:
+            self._write_fd(self._log_fds[log_type], b''.join(lines))
         except Exception as e:
             print(f"Error writing log entry: {e}")
     
+    @staticmethod
+    def _write_fd(fd: int, data: bytes):
+        """
+        Write all of a buffer to a file descriptor.
+        
+        :param fd: Open file descriptor
+        :param data: Bytes to write
+        """
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    
+    def _close_log_files(self):
+        """Close the queued log files."""
+        # Later entries are queued; wait out direct writes already under way
+        self._direct_mode = False
+        fds, self._log_fds = self._log_fds, {}
+        for log_type, fd in fds.items():
+            try:
+                with self._log_locks[log_type]:
+                    os.close(fd)
+            except Exception as e:
+                print(f"Error closing log file: {e}")
+    
+    def _format_log_entry(self, log_entry: tuple) -> str:
+        """
+        Format a queued log entry as one log file line.
+        
+        :param log_entry: Queued (type, timestamp, cycle, message, data) tuple
+        :return: Log line, including its newline
+        """
+        log_type, timestamp, cycle, message, data = log_entry
+        
+        if isinstance(timestamp, datetime):
+            timestamp = timestamp.isoformat()
+        else:
+            timestamp = self._format_timestamp_ns(timestamp)
+        
+        if log_type == 'uart':
+            return UART_LOG_LINE(timestamp, cycle, message, len(message))
+        
+        # Format log line
+        log_line = f"{timestamp},{cycle},{log_type},{message}"
+        
+        if data:
+            log_line += f",{dumps_log_data(data)}"
+        
+        return log_line + "\n"
+    
+    def _format_timestamp_ns(self, timestamp_ns: int) -> str:
+        """
+        Format a time.time_ns() value like datetime.isoformat on local time.
+        
+        The date and time of day are formatted once per second; entries within the
+        same second only format their microseconds.
+        
+        :param timestamp_ns: Nanoseconds since the epoch
+        :return: ISO formatted timestamp
+        """
+        second, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+        cached_second, prefix = self._ts_cache
+        if second != cached_second:
+            prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(second))
+            self._ts_cache = (second, prefix)
+        microsecond = nanoseconds // 1000
+        # datetime.isoformat leaves out zero microseconds
+        return f'{prefix}.{microsecond:06d}' if microsecond else prefix
+    
     def start_test(self):
         """Mark the start of a test session."""
         self.test_start_time = datetime.now()
         self.test_logger.info(f"Test session started: {self.test_name}")
-        self.test_logger.info(f"Configuration: {json.dumps(self.config, indent=2)}")
+        self._log_info(self._config_banner)
     
     def end_test(self):
         """Mark the end of a test session."""
@@ -183,8 +504,15 @@ class TestLogger:
         
         # Stop logging thread
         self.is_logging = False
+        self._log_wake.set()
         if self.log_thread:
             self.log_thread.join(timeout=2.0)
+        
+        # Leave the files to the log thread if it is still writing
+        if not (self.log_thread and self.log_thread.is_alive()):
+            self._close_log_files()
+        
+        self._stop_log_listener()
     
     def start_cycle(self, cycle_number: int):
         """Mark the start of a test cycle."""
@@ -201,132 +529,131 @@ class TestLogger:
         }
         
         self.cycle_data.append(cycle_info)
-        self.test_logger.info(f"Starting cycle {cycle_number}")
+        # A repeated cycle number keeps resolving to its first entry
+        self._cycle_index.setdefault(cycle_number, cycle_info)
+        self._log_info("Starting cycle %s", cycle_number)
         
         # Queue log entry
-        self.log_queue.put({
-            'type': 'cycle_start',
-            'timestamp': cycle_start_time,
-            'cycle': cycle_number,
-            'message': f"Cycle {cycle_number} started",
-            'data': {'cycle_number': cycle_number}
-        })
+        self._queue_log_entry('cycle_start', cycle_start_time, cycle_number,
+                              f"Cycle {cycle_number} started", {'cycle_number': cycle_number})
     
-    def end_cycle(self, cycle_number: int, success: bool = True):
-        """Mark the end of a test cycle."""
+    def end_cycle(self, cycle_number: int, success: bool = True, stopped: bool = False):
+        """
+        Mark the end of a test cycle.
+        
+        :param cycle_number: Cycle number
+        :param success: Whether the cycle passed
+        :param stopped: Whether a stop request ended the cycle before it finished;
+            such cycles are left out of the pass/fail counts
+        """
         cycle_end_time = datetime.now()
         
         # Find current cycle data
-        current_cycle_data = None
-        for cycle in self.cycle_data:
-            if cycle['cycle_number'] == cycle_number:
-                current_cycle_data = cycle
-                break
+        current_cycle_data = self._cycle_index.get(cycle_number)
+        duration = None
         
         if current_cycle_data:
+            # A cycle ended twice replaces its earlier result in the totals
+            previous_duration = current_cycle_data.get('duration')
+            if previous_duration:
+                self._duration_total -= previous_duration
+                self._duration_count -= 1
+            self._ok_cycles += bool(success) - bool(current_cycle_data.get('success', False))
+            self._stopped_cycles += bool(stopped) - bool(current_cycle_data.get('stopped', False))
+            
+            duration = cycle_end_time - current_cycle_data['start_time']
             current_cycle_data['end_time'] = cycle_end_time
             current_cycle_data['success'] = success
-            current_cycle_data['duration'] = cycle_end_time - current_cycle_data['start_time']
+            current_cycle_data['stopped'] = stopped
+            current_cycle_data['duration'] = duration
+            if duration:
+                self._duration_total += duration
+                self._duration_count += 1
         
-        status = "PASSED" if success else "FAILED"
-        self.test_logger.info(f"Cycle {cycle_number} {status}")
+        status = "STOPPED" if stopped else "PASSED" if success else "FAILED"
+        self._log_info("Cycle %s %s", cycle_number, status)
         
         # Queue log entry
-        self.log_queue.put({
-            'type': 'cycle_end',
-            'timestamp': cycle_end_time,
-            'cycle': cycle_number,
-            'message': f"Cycle {cycle_number} {status}",
-            'data': {
-                'cycle_number': cycle_number,
-                'success': success,
-                'duration': str(current_cycle_data['duration']) if current_cycle_data else None
-            }
-        })
+        entry_data = {
+            'cycle_number': cycle_number,
+            'success': success,
+            'duration': str(duration) if current_cycle_data else None
+        }
+        if stopped:
+            entry_data['stopped'] = True
+        self._queue_log_entry('cycle_end', cycle_end_time, cycle_number,
+                              f"Cycle {cycle_number} {status}", entry_data)
     
     def log_uart_data(self, data: str, cycle_number: int = None):
         """Log UART data."""
         cycle = cycle_number or self.current_cycle
         
         # Update cycle data
-        for cycle_data in self.cycle_data:
-            if cycle_data['cycle_number'] == cycle:
-                cycle_data['uart_data_count'] += 1
-                break
-        
-        self.uart_logger.debug(f"Cycle {cycle}: {data}")
-        
-        # Queue log entry
-        self.log_queue.put({
-            'type': 'uart',
-            'timestamp': datetime.now(),
-            'cycle': cycle,
-            'message': data,
-            'data': {'data_length': len(data)}
-        })
+        cycle_data = self._cycle_index.get(cycle)
+        if cycle_data is not None:
+            cycle_data['uart_data_count'] += 1
+            self._uart_total += 1
+        
+        # Every received line passes through here; skip the record entirely when
+        # the UART logger was set up without debug output
+        if self._uart_enabled:
+            self._log_uart("Cycle %s: %s", cycle, data)
+        
+        # Log entry; the data length is added when the line is formatted
+        self._submit_log_entry('uart', ('uart', time.time_ns(), cycle, data, None))
     
     def log_validation_result(self, result, cycle_number: int = None):
         """Log validation result."""
         cycle = cycle_number or self.current_cycle
         
         # Update cycle data
-        for cycle_data in self.cycle_data:
-            if cycle_data['cycle_number'] == cycle:
-                cycle_data['validations'].append({
-                    'pattern_name': result.pattern_name,
-                    'success': result.success,
-                    'timestamp': result.match_time,
-                    'error_message': result.error_message
-                })
-                break
+        cycle_data = self._cycle_index.get(cycle)
+        if cycle_data is not None:
+            self._validation_total += 1
+            cycle_data['validations'].append({
+                'pattern_name': result.pattern_name,
+                'success': result.success,
+                'timestamp': result.match_time,
+                'error_message': result.error_message
+            })
         
         level = logging.INFO if result.success else logging.WARNING
-        self.validation_logger.log(level, f"Cycle {cycle}: {result.pattern_name} - {'PASS' if result.success else 'FAIL'}")
+        self._log_val(level, "Cycle %s: %s - %s", cycle, result.pattern_name,
+                                   'PASS' if result.success else 'FAIL')
         
         if result.error_message:
-            self.error_logger.error(f"Cycle {cycle}: {result.pattern_name} - {result.error_message}")
+            self._log_err("Cycle %s: %s - %s", cycle, result.pattern_name, result.error_message)
         
         # Queue log entry
-        self.log_queue.put({
-            'type': 'validation',
-            'timestamp': result.match_time or datetime.now(),
-            'cycle': cycle,
-            'message': f"{result.pattern_name}: {'PASS' if result.success else 'FAIL'}",
-            'data': {
-                'pattern_name': result.pattern_name,
-                'success': result.success,
-                'error_message': result.error_message,
-                'extracted_values': result.extracted_values
-            }
-        })
+        self._queue_log_entry('validation', result.match_time or time.time_ns(), cycle,
+                              f"{result.pattern_name}: {'PASS' if result.success else 'FAIL'}", {
+                                  'pattern_name': result.pattern_name,
+                                  'success': result.success,
+                                  'error_message': result.error_message,
+                                  'extracted_values': result.extracted_values
+                              })
     
     def log_error(self, error_message: str, cycle_number: int = None, exception: Exception = None):
         """Log error message."""
         cycle = cycle_number or self.current_cycle
         
         # Update cycle data
-        for cycle_data in self.cycle_data:
-            if cycle_data['cycle_number'] == cycle:
-                cycle_data['errors'].append({
-                    'message': error_message,
-                    'timestamp': datetime.now(),
-                    'exception': str(exception) if exception else None
-                })
-                break
-        
-        self.error_logger.error(f"Cycle {cycle}: {error_message}")
+        cycle_data = self._cycle_index.get(cycle)
+        if cycle_data is not None:
+            self._error_total += 1
+            cycle_data['errors'].append({
+                'message': error_message,
+                'timestamp': datetime.now(),
+                'exception': str(exception) if exception else None
+            })
+        
+        self._log_err("Cycle %s: %s", cycle, error_message)
         if exception:
             self.error_logger.exception(f"Exception details: {exception}")
         
         # Queue log entry
-        self.log_queue.put({
-            'type': 'error',
-            'timestamp': datetime.now(),
-            'cycle': cycle,
-            'message': error_message,
-            'data': {
-                'exception': str(exception) if exception else None
-            }
+        self._queue_log_entry('error', time.time_ns(), cycle, error_message, {
+            'exception': str(exception) if exception else None
         })
     
     def log_event(self, event_message: str, cycle_number: int = None, data: Dict = None):
@@ -334,25 +661,18 @@ class TestLogger:
         cycle = cycle_number or self.current_cycle
         
         # Update cycle data
-        for cycle_data in self.cycle_data:
-            if cycle_data['cycle_number'] == cycle:
-                cycle_data['events'].append({
-                    'message': event_message,
-                    'timestamp': datetime.now(),
-                    'data': data or {}
-                })
-                break
+        cycle_data = self._cycle_index.get(cycle)
+        if cycle_data is not None:
+            cycle_data['events'].append({
+                'message': event_message,
+                'timestamp': datetime.now(),
+                'data': data or {}
+            })
         
-        self.test_logger.info(f"Cycle {cycle}: {event_message}")
+        self._log_info("Cycle %s: %s", cycle, event_message)
         
         # Queue log entry
-        self.log_queue.put({
-            'type': 'event',
-            'timestamp': datetime.now(),
-            'cycle': cycle,
-            'message': event_message,
-            'data': data or {}
-        })
+        self._queue_log_entry('event', time.time_ns(), cycle, event_message, data or {})
     
     def get_test_summary(self) -> Dict:
         """Get comprehensive test summary."""
@@ -360,16 +680,18 @@ class TestLogger:
             return {'error': 'No test cycles completed'}
         
         total_cycles = len(self.cycle_data)
-        successful_cycles = sum(1 for cycle in self.cycle_data if cycle.get('success', False))
-        failed_cycles = total_cycles - successful_cycles
+        successful_cycles = self._ok_cycles
+        stopped_cycles = self._stopped_cycles
+        failed_cycles = total_cycles - successful_cycles - stopped_cycles
+        counted_cycles = successful_cycles + failed_cycles
         
-        total_uart_data = sum(cycle.get('uart_data_count', 0) for cycle in self.cycle_data)
-        total_validations = sum(len(cycle.get('validations', [])) for cycle in self.cycle_data)
-        total_errors = sum(len(cycle.get('errors', [])) for cycle in self.cycle_data)
+        total_uart_data = self._uart_total
+        total_validations = self._validation_total
+        total_errors = self._error_total
         
         # Calculate average cycle duration
-        durations = [cycle.get('duration') for cycle in self.cycle_data if cycle.get('duration')]
-        avg_duration = sum(durations, datetime.now() - datetime.now()) / len(durations) if durations else None
+        avg_duration = (self._duration_total / self._duration_count
+                        if self._duration_count else None)
         
         return {
             'test_name': self.test_name,
@@ -379,14 +701,59 @@ class TestLogger:
             'total_cycles': total_cycles,
             'successful_cycles': successful_cycles,
             'failed_cycles': failed_cycles,
-            'success_rate': successful_cycles / total_cycles if total_cycles > 0 else 0,
+            'stopped_cycles': stopped_cycles,
+            'success_rate': successful_cycles / counted_cycles if counted_cycles > 0 else 0,
             'total_uart_data_points': total_uart_data,
             'total_validations': total_validations,
             'total_errors': total_errors,
             'average_cycle_duration': str(avg_duration) if avg_duration else None,
+            'dropped_log_entries': sum(self._dropped_entries.values()),
             'cycle_details': self.cycle_data
         }
     
+    def _iter_csv_rows(self):
+        """
+        Yield the CSV export rows for all recorded cycles.
+        
+        :return: Iterator of (timestamp, cycle, type, message, data) tuples
+        """
+        for cycle in self.cycle_data:
+            cycle_number = cycle['cycle_number']
+            
+            # Cycle start
+            yield (cycle['start_time'].isoformat(), cycle_number, 'cycle_start',
+                   f"Cycle {cycle_number} started",
+                   dumps_log_data({'cycle_number': cycle_number}))
+            
+            # Events
+            for event in cycle.get('events', []):
+                yield (event['timestamp'].isoformat(), cycle_number, 'event',
+                       event['message'], dumps_log_data(event['data']))
+            
+            # Validations
+            for validation in cycle.get('validations', []):
+                yield (validation['timestamp'].isoformat(), cycle_number, 'validation',
+                       f"{validation['pattern_name']}: {'PASS' if validation['success'] else 'FAIL'}",
+                       dumps_log_data({
+                           'pattern_name': validation['pattern_name'],
+                           'success': validation['success'],
+                           'error_message': validation['error_message']
+                       }))
+            
+            # Errors
+            for error in cycle.get('errors', []):
+                yield (error['timestamp'].isoformat(), cycle_number, 'error',
+                       error['message'], dumps_log_data({'exception': error['exception']}))
+            
+            # Cycle end
+            if 'end_time' in cycle:
+                yield (cycle['end_time'].isoformat(), cycle_number, 'cycle_end',
+                       f"Cycle {cycle_number} {'PASSED' if cycle.get('success') else 'FAILED'}",
+                       dumps_log_data({
+                           'success': cycle.get('success', False),
+                           'duration': str(cycle.get('duration', ''))
+                       }))
+    
     def export_logs_to_csv(self, filename: str = None):
         """Export all logs to CSV format."""
         if not filename:
@@ -396,68 +763,9 @@ class TestLogger:
         
         try:
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                fieldnames = ['timestamp', 'cycle', 'type', 'message', 'data']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                
-                writer.writeheader()
-                
-                # Write cycle data
-                for cycle in self.cycle_data:
-                    # Cycle start
-                    writer.writerow({
-                        'timestamp': cycle['start_time'].isoformat(),
-                        'cycle': cycle['cycle_number'],
-                        'type': 'cycle_start',
-                        'message': f"Cycle {cycle['cycle_number']} started",
-                        'data': json.dumps({'cycle_number': cycle['cycle_number']})
-                    })
-                    
-                    # Events
-                    for event in cycle.get('events', []):
-                        writer.writerow({
-                            'timestamp': event['timestamp'].isoformat(),
-                            'cycle': cycle['cycle_number'],
-                            'type': 'event',
-                            'message': event['message'],
-                            'data': json.dumps(event['data'])
-                        })
-                    
-                    # Validations
-                    for validation in cycle.get('validations', []):
-                        writer.writerow({
-                            'timestamp': validation['timestamp'].isoformat(),
-                            'cycle': cycle['cycle_number'],
-                            'type': 'validation',
-                            'message': f"{validation['pattern_name']}: {'PASS' if validation['success'] else 'FAIL'}",
-                            'data': json.dumps({
-                                'pattern_name': validation['pattern_name'],
-                                'success': validation['success'],
-                                'error_message': validation['error_message']
-                            })
-                        })
-                    
-                    # Errors
-                    for error in cycle.get('errors', []):
-                        writer.writerow({
-                            'timestamp': error['timestamp'].isoformat(),
-                            'cycle': cycle['cycle_number'],
-                            'type': 'error',
-                            'message': error['message'],
-                            'data': json.dumps({'exception': error['exception']})
-                        })
-                    
-                    # Cycle end
-                    if 'end_time' in cycle:
-                        writer.writerow({
-                            'timestamp': cycle['end_time'].isoformat(),
-                            'cycle': cycle['cycle_number'],
-                            'type': 'cycle_end',
-                            'message': f"Cycle {cycle['cycle_number']} {'PASSED' if cycle.get('success') else 'FAILED'}",
-                            'data': json.dumps({
-                                'success': cycle.get('success', False),
-                                'duration': str(cycle.get('duration', ''))
-                            })
-                        })
+                writer = csv.writer(csvfile)
+                writer.writerow(['timestamp', 'cycle', 'type', 'message', 'data'])
+                writer.writerows(self._iter_csv_rows())
             
             self.test_logger.info(f"Logs exported to CSV: {filename}")
             return str(filename)
@@ -25,11 +25,21 @@ Author: Automated Test Framework
 Version: 1.0.0
 """
 
+import functools
+import os
+import re
+import selectors
+import sys
 import time
 import json
+import threading
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional, Any
+import logging.handlers
+import queue
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Any, Pattern
 from pathlib import Path
 
 # Core framework imports
@@ -37,10 +47,59 @@ from libs.power_supply import PowerSupplyFactory
 from libs.uart_handler import UARTHandler, UARTDataLogger
 from libs.pattern_validator import PatternValidator, ValidationResult
 from libs.test_logger import TestLogger
-from libs.report_generator import ReportGenerator
+from libs.report_generator import ReportGenerator, report_json_default
 from libs.test_template_loader import TestTemplateLoader
 from libs.comprehensive_logger import ComprehensiveLogger
 
+# Optional fast JSON serializer for the cycle result log
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+@functools.lru_cache(maxsize=16)
+def _read_config_bytes(config_file: str, mtime_ns: int, size: int) -> bytes:
+    """
+    Read a configuration file, cached by path, modification time and size.
+    
+    :param config_file: Path to configuration JSON file
+    :param mtime_ns: File modification time, so an edited file is read again
+    :param size: File size, for edits within the timestamp resolution
+    :return: File contents
+    """
+    with open(config_file, 'rb') as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_uart_regex(regex: str) -> Pattern:
+    """
+    Compile a UART pattern regex, once for all tests that use it.
+    
+    :param regex: Regular expression from a UART pattern configuration
+    :return: Compiled pattern
+    :raises re.error: If the regex is invalid
+    """
+    return re.compile(regex)
+
+
+def dumps_cycle_result(cycle_result: Dict) -> bytes:
+    """
+    Serialize a cycle result as one compact line of UTF-8 JSON.
+    
+    :param cycle_result: Cycle result dictionary from run_single_cycle
+    :return: Encoded JSON, without a trailing newline
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(cycle_result, default=report_json_default)
+        except TypeError:
+            pass
+    return json.dumps(cycle_result, default=report_json_default, ensure_ascii=False,
+                      separators=(',', ':')).encode('utf-8')
+
 
 class PowerCycleTestRunner:
     """
@@ -116,19 +175,35 @@ class PowerCycleTestRunner:
         self.test_logger = None
         self.report_generator = None
         self.template_loader = None
+        # Template names, listed once when the templates are loaded
+        self._available_templates: List[str] = []
         self.comprehensive_logger = None
+        # Cycle result log, one JSON line per cycle as it ends
+        self._cycle_sink = None
+        # Workers waiting for patterns on different UART streams, created on first use
+        self._scan_pool = None
         
         # Test state
         self.is_running = False
+        # Set by stop() to end a running test at its next wait
+        self._stop_event = threading.Event()
         self.current_cycle = 0
         self.current_test_index = 0
         self.test_results = []
+        # Test configurations with their templates applied, resolved once per
+        # loaded template set and shared by the interactive display and run_test
+        self._resolved_tests: List[Dict] = []
+        # UART patterns of each resolved test, prepared along with the resolution
+        self._test_patterns: List[List[Dict]] = []
         
     def _load_config(self) -> Dict:
         """Load configuration from JSON file."""
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
+            # Runners created for the same unchanged file share one read; each gets
+            # its own parsed dict, since initialize_components updates it
+            stat = os.stat(self.config_file)
+            raw_config = _read_config_bytes(self.config_file, stat.st_mtime_ns, stat.st_size)
+            config = json.loads(raw_config)
             return config
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
@@ -139,15 +214,48 @@ class PowerCycleTestRunner:
         """Setup logging configuration."""
         log_config = self.config.get('output', {})
         log_level = log_config.get('log_level', 'INFO')
+        self._log_listener = None
         
-        logging.basicConfig(
-            level=getattr(logging, log_level.upper()),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler(f"test_runner_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log")
-            ]
-        )
+        # Like basicConfig, keep a logging setup the application already made
+        root_logger = logging.getLogger()
+        if root_logger.handlers:
+            return
+        
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        self._log_handlers = [
+            logging.StreamHandler(),
+            logging.FileHandler(f"test_runner_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log",
+                                delay=True)
+        ]
+        for handler in self._log_handlers:
+            handler.setFormatter(formatter)
+        
+        # Records are only queued on the test thread; the listener thread formats
+        # and writes them
+        log_records = queue.SimpleQueue()
+        self._log_queue_handler = logging.handlers.QueueHandler(log_records)
+        root_logger.addHandler(self._log_queue_handler)
+        root_logger.setLevel(getattr(logging, log_level.upper()))
+        self._log_listener = logging.handlers.QueueListener(log_records, *self._log_handlers)
+        self._log_listener.start()
+    
+    def _stop_log_listener(self):
+        """Write out the queued log records and log directly from then on."""
+        if self._log_listener is None:
+            return
+        self._log_listener.stop()
+        self._log_listener = None
+        
+        # Another logging setup (ComprehensiveLogger) may have replaced the root
+        # handlers since; then the runner's handlers are no longer wanted
+        root_logger = logging.getLogger()
+        if self._log_queue_handler in root_logger.handlers:
+            root_logger.removeHandler(self._log_queue_handler)
+            for handler in self._log_handlers:
+                root_logger.addHandler(handler)
+        else:
+            for handler in self._log_handlers:
+                handler.close()
     
     def initialize_components(self) -> bool:
         """
@@ -171,6 +279,10 @@ class PowerCycleTestRunner:
             self.uart_handlers = []
             self.uart_loggers = []
             
+            # All UART data logs of this session share a directory and timestamp
+            uart_log_dir = Path(self.config.get('output', {}).get('log_directory', 'logs'))
+            uart_log_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            
             for i, uart_config in enumerate(uart_loggers_config):
                 # Convert new config format to old format
                 old_format_config = {
@@ -191,8 +303,7 @@ class PowerCycleTestRunner:
                 self.uart_handlers.append(uart_handler)
                 
                 # Initialize UART data logger
-                log_dir = self.config.get('output', {}).get('log_directory', 'logs')
-                uart_log_file = Path(log_dir) / f"uart_data_{i}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
+                uart_log_file = uart_log_dir / f"uart_data_{i}_{uart_log_timestamp}.log"
                 uart_logger = UARTDataLogger(uart_handler, str(uart_log_file))
                 self.uart_loggers.append(uart_logger)
             
@@ -203,6 +314,10 @@ class PowerCycleTestRunner:
             
             # Initialize template loader first to get output config
             self.template_loader = TestTemplateLoader()
+            self._available_templates = list(self.template_loader.get_available_templates())
+            # Tests resolved against previously loaded templates are out of date
+            self._resolved_tests = []
+            self._test_patterns = []
             
             # Merge template output config with main config
             if self.template_loader and hasattr(self.template_loader, 'templates'):
@@ -221,11 +336,18 @@ class PowerCycleTestRunner:
             Path(log_dir).mkdir(parents=True, exist_ok=True)
             Path(report_dir).mkdir(parents=True, exist_ok=True)
             
+            # Cycle results reach disk as each cycle ends, so an interrupted run keeps them
+            cycle_log_file = Path(log_dir) / f"cycles_{datetime.now().strftime('%Y%m%d_%H%M%S')}.ndjson"
+            self._cycle_sink = open(cycle_log_file, 'ab')
+            
             # Initialize comprehensive logger
             self.comprehensive_logger = ComprehensiveLogger(log_dir, log_level)
             self.comprehensive_logger.log_system_info()
             self.comprehensive_logger.log_configuration(self.config)
             
+            # Initialize pattern validator
+            self.pattern_validator = PatternValidator()
+            
             # Initialize test logger
             self.test_logger = TestLogger(self.config)
             
@@ -247,6 +369,8 @@ class PowerCycleTestRunner:
             # Cleanup all UART handlers
             for uart_handler in getattr(self, 'uart_handlers', []):
                 uart_handler.disconnect()
+            for uart_logger in getattr(self, 'uart_loggers', []):
+                uart_logger.close()
             
             if self.power_supply:
                 self.power_supply.close()
@@ -254,55 +378,205 @@ class PowerCycleTestRunner:
             if self.test_logger:
                 self.test_logger.end_test()
             
+            if self._cycle_sink:
+                self._cycle_sink.close()
+                self._cycle_sink = None
+            
+            if self._scan_pool:
+                self._scan_pool.shutdown()
+                self._scan_pool = None
+            
             self.logger.info("Components cleaned up")
             
         except Exception as e:
             self.logger.error(f"Error during cleanup: {e}")
+        
+        self._stop_log_listener()
+    
+    def stop(self):
+        """Stop a running test; the cycle in progress ends at its next wait."""
+        self._stop_event.set()
+    
+    def _interruptible_sleep(self, seconds: float) -> bool:
+        """
+        Wait for a number of seconds unless the test is stopped first.
+        
+        :param seconds: Time to wait
+        :return: True if the full time passed, False if the test was stopped
+        """
+        return not self._stop_event.wait(seconds)
+    
+    def refresh_templates(self) -> List[str]:
+        """
+        Reload the test templates file.
+        
+        Tests are resolved again against the reloaded templates when next needed.
+        
+        :return: Names of the available templates
+        """
+        if self.template_loader:
+            self.template_loader = TestTemplateLoader(self.template_loader.template_file)
+            self._available_templates = list(self.template_loader.get_available_templates())
+            self._resolved_tests = []
+            self._test_patterns = []
+        return self._available_templates
+    
+    def _resolve_tests(self) -> List[Dict]:
+        """
+        Resolve the templates of all configured tests.
+        
+        :return: Resolved test configurations, in configuration order
+        """
+        tests = self.config.get('tests', [])
+        if self.template_loader:
+            # Tests that cannot be resolved are logged and kept as configured
+            return self.template_loader.resolve_test_configs(tests)
+        return list(tests)
+    
+    def _ensure_tests_resolved(self) -> List[Dict]:
+        """
+        Resolve the configured tests and prepare their UART patterns, unless done
+        since the templates were last loaded.
+        
+        :return: Resolved test configurations, in configuration order
+        """
+        if not self._resolved_tests:
+            self._resolved_tests = self._resolve_tests()
+            self._test_patterns = [self._prepare_uart_patterns(t) for t in self._resolved_tests]
+        return self._resolved_tests
     
     def get_current_test_config(self) -> Dict:
         """Get the current test configuration with template resolution."""
-        tests = self.config.get('tests', [])
-        if self.current_test_index < len(tests):
-            test_config = tests[self.current_test_index]
-            
-            # Resolve template if template loader is available
-            if self.template_loader:
-                try:
-                    return self.template_loader.resolve_test_config(test_config)
-                except Exception as e:
-                    self.logger.error(f"Error resolving test template: {e}")
-                    return test_config
-            
-            return test_config
+        # run_test resolves the tests up front; this covers calls made before it
+        self._ensure_tests_resolved()
+        
+        if self.current_test_index < len(self._resolved_tests):
+            return self._resolved_tests[self.current_test_index]
         return {}
     
-    def power_cycle_device(self, cycle_number: int) -> bool:
+    def _prepare_uart_patterns(self, test_config: Dict) -> List[Dict]:
+        """
+        Compile the UART pattern regexes of a resolved test configuration.
+        
+        :param test_config: Resolved test configuration
+        :return: Copies of its uart_patterns entries, with the compiled regex
+            under '_compiled' (None if the regex is invalid), the expected
+            values under '_expected_by_length' and a valid 'stream' index;
+            invalid regexes also get the old validator format under '_old_fmt'
+        """
+        # Stream indexes are only checked against the UART loggers once they exist
+        stream_count = len(self.uart_handlers) if hasattr(self, 'uart_handlers') else None
+        prepared_patterns = []
+        for i, pattern_config in enumerate(test_config.get('uart_patterns', [])):
+            # Copies: templates share their pattern entries between tests
+            prepared = dict(pattern_config)
+            prepared['stream'] = self._validate_stream(pattern_config, stream_count)
+            try:
+                prepared['_compiled'] = _compile_uart_regex(pattern_config.get('regex', ''))
+            except re.error as e:
+                self.logger.error(f"Invalid UART pattern regex {pattern_config.get('regex')!r}: {e}")
+                prepared['_compiled'] = None
+                # Old format for the pattern validator, which reports the regex error
+                prepared['_old_fmt'] = {
+                    'name': f"pattern_{i}",
+                    'pattern': pattern_config.get('regex', ''),
+                    'pattern_type': 'regex',
+                    'timeout': 10.0,
+                    'required': True,
+                    'expected': pattern_config.get('expected', [])
+                }
+            prepared['_expected_by_length'] = self._group_expected_values(
+                pattern_config.get('expected', []))
+            prepared_patterns.append(prepared)
+        return prepared_patterns
+    
+    def _validate_stream(self, pattern_config: Dict, stream_count: Optional[int]) -> int:
+        """
+        Check a UART pattern's 'stream' index, logging a configuration error if invalid.
+        
+        :param pattern_config: UART pattern configuration
+        :param stream_count: Number of configured UART loggers, None if not yet known
+        :return: The pattern's stream index, or 0 (the first UART logger) if invalid
+        """
+        stream = pattern_config.get('stream', 0)
+        if isinstance(stream, int) and not isinstance(stream, bool) and stream >= 0 and (
+                stream_count is None or stream < max(stream_count, 1)):
+            return stream
+        
+        expected = ("an integer index" if stream_count is None
+                    else f"an index into the {stream_count} configured UART loggers")
+        self.logger.error(
+            f"Invalid stream {stream!r} for UART pattern {pattern_config.get('regex')!r}: "
+            f"expected {expected}; matching it against the first one")
+        return 0
+    
+    @staticmethod
+    def _group_expected_values(expected_values: List) -> List[tuple]:
+        """
+        Group a pattern's expected values for set lookups.
+        
+        An expected list matches when the extracted groups start with its values,
+        and a single expected value matches the first group; values compare as
+        strings.
+        
+        :param expected_values: Expected values from the pattern configuration
+        :return: (length, set of string tuples of that length) pairs
+        """
+        expected_by_length = {}
+        for expected_set in expected_values:
+            if not isinstance(expected_set, list):
+                expected_set = [expected_set]
+            expected_by_length.setdefault(len(expected_set), set()).add(
+                tuple(str(value) for value in expected_set))
+        return [(length, frozenset(expected)) for length, expected in sorted(expected_by_length.items())]
+    
+    @staticmethod
+    def _matches_expected(extracted_groups: List, expected_by_length: List[tuple]) -> bool:
+        """
+        Check extracted groups against a pattern's grouped expected values.
+        
+        :param extracted_groups: Groups extracted from the matching line
+        :param expected_by_length: Expected values from _group_expected_values
+        :return: True if the groups start with any of the expected values
+        """
+        return any(
+            len(extracted_groups) >= length and
+            tuple(str(group) for group in extracted_groups[:length]) in expected
+            for length, expected in expected_by_length
+        )
+    
+    def power_cycle_device(self, cycle_number: int, current_test: Optional[Dict] = None) -> bool:
         """
         Perform a complete power cycle on the device.
         
         :param cycle_number: Current cycle number for logging
+        :param current_test: Test configuration of the cycle, the current test's by default
         :return: True if power cycle completed successfully
         """
         try:
-            # Get current test configuration
-            current_test = self.get_current_test_config()
+            if current_test is None:
+                current_test = self.get_current_test_config()
             power_on_duration = current_test.get('on_time', 5.0)
             power_off_duration = current_test.get('off_time', 3.0)
             
-            self.logger.info(f"Starting power cycle {cycle_number}")
+            self.logger.info("Starting power cycle %s", cycle_number)
             self.test_logger.log_event(f"Power cycle {cycle_number} started", cycle_number)
             
             # Turn power off
             self.power_supply.output_off()
             self.test_logger.log_event("Power turned OFF", cycle_number)
-            time.sleep(power_off_duration)
+            if not self._interruptible_sleep(power_off_duration):
+                self.logger.warning("Power cycle %s stopped", cycle_number)
+                return False
             
             # Turn power on
             self.power_supply.output_on()
             self.test_logger.log_event("Power turned ON", cycle_number)
-            time.sleep(power_on_duration)
+            if not self._interruptible_sleep(power_on_duration):
+                self.logger.warning("Power cycle %s stopped", cycle_number)
+                return False
             
-            self.logger.info(f"Power cycle {cycle_number} completed")
+            self.logger.info("Power cycle %s completed", cycle_number)
             self.test_logger.log_event(f"Power cycle {cycle_number} completed", cycle_number)
             return True
             
@@ -311,42 +585,40 @@ class PowerCycleTestRunner:
             self.test_logger.log_error(f"Power cycle failed: {e}", cycle_number, e)
             return False
     
-    def validate_patterns(self, cycle_number: int) -> List[ValidationResult]:
+    def validate_patterns(self, cycle_number: int, current_test: Optional[Dict] = None,
+                          settle_until: Optional[float] = None) -> List[ValidationResult]:
         """
         Validate UART patterns for the current cycle.
         
         :param cycle_number: Current cycle number
+        :param current_test: Test configuration of the cycle, the current test's by default
+        :param settle_until: time.monotonic() value until which the device is still
+            stabilizing; waits for patterns do not time out before it
         :return: List of validation results
         """
-        current_test = self.get_current_test_config()
-        uart_patterns = current_test.get('uart_patterns', [])
+        uart_patterns = self._current_uart_patterns(current_test)
         results = []
+        timeout = 10.0  # Default timeout
         
         try:
-            self.logger.info(f"Starting pattern validation for cycle {cycle_number}")
+            self.logger.info("Starting pattern validation for cycle %s", cycle_number)
+            
+            # Patterns on other UART streams are waited for concurrently
+            scanned_results = self._scan_streams_concurrently(uart_patterns, timeout, settle_until)
             
             for i, pattern_config in enumerate(uart_patterns):
                 pattern_name = f"pattern_{i}"
-                regex_pattern = pattern_config.get('regex', '')
                 expected_values = pattern_config.get('expected', [])
-                timeout = 10.0  # Default timeout
-                
-                self.logger.info(f"Waiting for pattern: {pattern_name}")
-                
-                # Convert new format to old format for validation
-                old_format_pattern = {
-                    'name': pattern_name,
-                    'pattern': regex_pattern,
-                    'pattern_type': 'regex',
-                    'timeout': timeout,
-                    'required': True,
-                    'expected': expected_values
-                }
                 
-                # Wait for pattern in UART stream
-                result = self.pattern_validator.wait_for_pattern_in_stream(
-                    self.uart_handler, old_format_pattern, timeout
-                )
+                if scanned_results is not None:
+                    result = scanned_results[i]
+                else:
+                    self.logger.info("Waiting for pattern: %s", pattern_name)
+                    
+                    # Wait for pattern in UART stream
+                    result = self._wait_for_pattern(self._stream_handler(pattern_config),
+                                                    pattern_name, pattern_config, timeout,
+                                                    settle_until)
                 
                 if result:
                     # Check if the extracted values match expected values
@@ -354,19 +626,8 @@ class PowerCycleTestRunner:
                         extracted_groups = result.extracted_values.get('groups', [])
                         if extracted_groups:
                             # Compare extracted values with expected
-                            match_found = False
-                            for expected_set in expected_values:
-                                if isinstance(expected_set, list):
-                                    if len(extracted_groups) >= len(expected_set):
-                                        if all(str(extracted_groups[j]) == str(expected_set[j]) for j in range(len(expected_set))):
-                                            match_found = True
-                                            break
-                                else:
-                                    if str(extracted_groups[0]) == str(expected_set):
-                                        match_found = True
-                                        break
-                            
-                            if not match_found:
+                            if not self._matches_expected(extracted_groups,
+                                                          pattern_config['_expected_by_length']):
                                 result.success = False
                                 result.error_message = f"Extracted values {extracted_groups} do not match expected {expected_values}"
                     
@@ -374,9 +635,9 @@ class PowerCycleTestRunner:
                     self.test_logger.log_validation_result(result, cycle_number)
                     
                     if result.success:
-                        self.logger.info(f"Pattern '{pattern_name}' validated successfully")
+                        self.logger.info("Pattern '%s' validated successfully", pattern_name)
                     else:
-                        self.logger.warning(f"Pattern '{pattern_name}' validation failed")
+                        self.logger.warning("Pattern '%s' validation failed", pattern_name)
                 else:
                     # Create timeout result
                     timeout_result = ValidationResult(
@@ -395,6 +656,129 @@ class PowerCycleTestRunner:
             self.test_logger.log_error(f"Pattern validation failed: {e}", cycle_number, e)
             return results
     
+    def _current_uart_patterns(self, current_test: Optional[Dict] = None) -> List[Dict]:
+        """
+        Get the prepared UART patterns of the current test.
+        
+        :param current_test: Current test configuration, prepared when the tests
+            were not resolved up front; looked up if not given
+        :return: Prepared UART patterns
+        """
+        if self.current_test_index < len(self._test_patterns):
+            return self._test_patterns[self.current_test_index]
+        return self._prepare_uart_patterns(current_test or self.get_current_test_config())
+    
+    def _stream_handler(self, pattern_config: Dict) -> UARTHandler:
+        """
+        Get the UART handler whose stream a pattern is matched against.
+        
+        :param pattern_config: UART pattern configuration; its optional 'stream' is
+            an index into the configured UART loggers, the first one by default
+        :return: UART handler for that stream
+        """
+        stream = pattern_config.get('stream', 0)
+        return self.uart_handlers[stream] if stream else self.uart_handler
+    
+    def _wait_for_pattern(self, uart_handler: UARTHandler, pattern_name: str,
+                          pattern_config: Dict, timeout: float,
+                          settle_until: Optional[float] = None) -> Optional[ValidationResult]:
+        """
+        Wait for a prepared UART pattern in a handler's stream.
+        
+        :param uart_handler: UART handler to read lines from
+        :param pattern_name: Pattern name for the result
+        :param pattern_config: Prepared pattern from _prepare_uart_patterns
+        :param timeout: Maximum time to wait once the device has stabilized
+        :param settle_until: time.monotonic() value the device stabilizes at, if later
+        :return: Validation result of the first matching line, or a timeout result
+        """
+        if settle_until is not None:
+            # The wait starts while the device is still stabilizing; its timeout
+            # only counts from the end of that time
+            timeout = round(timeout + max(0.0, settle_until - time.monotonic()), 3)
+        
+        compiled_pattern = pattern_config['_compiled']
+        if compiled_pattern is not None:
+            return self.pattern_validator.wait_for_regex_in_stream(
+                uart_handler, pattern_name, compiled_pattern, timeout, self._stop_event
+            )
+        
+        return self.pattern_validator.wait_for_pattern_in_stream(
+            uart_handler, pattern_config['_old_fmt'], timeout, self._stop_event
+        )
+    
+    def _scan_stream(self, uart_handler: UARTHandler, indexed_patterns: List[tuple],
+                     timeout: float,
+                     settle_until: Optional[float] = None) -> Dict[int, Optional[ValidationResult]]:
+        """
+        Wait for a stream's patterns one after another, in configuration order.
+        
+        :param uart_handler: UART handler of the stream
+        :param indexed_patterns: (pattern index, prepared pattern) pairs
+        :param timeout: Maximum time to wait for each pattern
+        :param settle_until: time.monotonic() value the device stabilizes at, if later
+        :return: Validation result of each pattern, by pattern index
+        """
+        return {i: self._wait_for_pattern(uart_handler, f"pattern_{i}", pattern_config,
+                                          timeout, settle_until)
+                for i, pattern_config in indexed_patterns}
+    
+    def _scan_streams_concurrently(self, uart_patterns: List[Dict], timeout: float,
+                                   settle_until: Optional[float] = None
+                                   ) -> Optional[Dict[int, Optional[ValidationResult]]]:
+        """
+        Wait for patterns on several UART streams at once, one worker per stream.
+        
+        Each stream's lines are read by a single worker, so patterns on the same
+        stream are still matched in order and never take each other's lines.
+        
+        :param uart_patterns: Prepared patterns of the current test
+        :param timeout: Maximum time to wait for each pattern
+        :param settle_until: time.monotonic() value the device stabilizes at, if later
+        :return: Validation result of each pattern by index, or None when all
+            patterns use one stream and are waited for in the caller
+        """
+        streams = defaultdict(list)
+        for i, pattern_config in enumerate(uart_patterns):
+            streams[pattern_config.get('stream', 0)].append((i, pattern_config))
+        if len(streams) < 2:
+            return None
+        
+        if self._scan_pool is None:
+            self._scan_pool = ThreadPoolExecutor(max_workers=len(self.uart_handlers),
+                                                 thread_name_prefix='uart_scan')
+        self.logger.info("Waiting for patterns on %s UART streams", len(streams))
+        futures = [self._scan_pool.submit(self._scan_stream, self.uart_handlers[stream],
+                                          indexed_patterns, timeout, settle_until)
+                   for stream, indexed_patterns in streams.items()]
+        
+        scanned_results = {}
+        for future in futures:
+            scanned_results.update(future.result())
+        return scanned_results
+    
+    def _pattern_stream_handlers(self, current_test: Optional[Dict] = None) -> List[UARTHandler]:
+        """Get the primary UART handler and those of the streams the current test's patterns use."""
+        handlers = [self.uart_handler]
+        for pattern_config in self._current_uart_patterns(current_test):
+            uart_handler = self._stream_handler(pattern_config)
+            if uart_handler not in handlers:
+                handlers.append(uart_handler)
+        return handlers
+    
+    @staticmethod
+    def _elapsed_since(start_ns: int) -> timedelta:
+        """
+        Time elapsed since a time.monotonic_ns() reading.
+        
+        Durations come from the monotonic clock, so wall clock adjustments during
+        a test do not skew them; end times are the start time plus the duration.
+        
+        :param start_ns: Earlier time.monotonic_ns() value
+        :return: Elapsed time
+        """
+        return timedelta(microseconds=(time.monotonic_ns() - start_ns) // 1000)
+    
     def run_single_cycle(self, cycle_number: int) -> Dict:
         """
         Run a single test cycle.
@@ -403,50 +787,57 @@ class PowerCycleTestRunner:
         :return: Cycle result dictionary
         """
         cycle_start_time = datetime.now()
+        cycle_start_ns = time.monotonic_ns()
         cycle_result = {
             'cycle_number': cycle_number,
             'start_time': cycle_start_time,
             'power_cycle_success': False,
             'validation_results': [],
             'success': False,
+            'stopped': False,
             'errors': []
         }
         
         try:
-            self.logger.info(f"Starting test cycle {cycle_number}")
+            self.logger.info("Starting test cycle %s", cycle_number)
             self.test_logger.start_cycle(cycle_number)
             self.uart_logger.set_cycle_number(cycle_number)
             
+            # Look the test up once, so the whole cycle runs with the same configuration
+            current_test = self.get_current_test_config()
+            
             # Perform power cycle
-            power_success = self.power_cycle_device(cycle_number)
+            power_success = self.power_cycle_device(cycle_number, current_test)
             cycle_result['power_cycle_success'] = power_success
             
             if not power_success:
+                if self._stop_event.is_set():
+                    return self._end_stopped_cycle(cycle_result, cycle_start_ns)
                 cycle_result['errors'].append("Power cycle failed")
                 return cycle_result
             
             # Start UART logging
-            if not self.uart_handler.start_logging():
+            uart_handlers = self._pattern_stream_handlers(current_test)
+            if not all([uart_handler.start_logging() for uart_handler in uart_handlers]):
                 cycle_result['errors'].append("Failed to start UART logging")
                 return cycle_result
             
-            # Wait for device to stabilize
-            current_test = self.get_current_test_config()
+            # Validate patterns while the device stabilizes: lines received meanwhile
+            # wait in the UART queue, and no pattern times out before it is done
             cycle_delay = current_test.get('cycle_delay', 2.0)
-            time.sleep(cycle_delay)
-            
-            # Validate patterns
-            validation_results = self.validate_patterns(cycle_number)
+            validation_results = self.validate_patterns(cycle_number, current_test,
+                                                        time.monotonic() + cycle_delay)
             cycle_result['validation_results'] = validation_results
             
             # Stop UART logging
-            self.uart_handler.stop_logging()
+            for uart_handler in uart_handlers:
+                uart_handler.stop_logging()
             
-            # Determine cycle success
-            current_test = self.get_current_test_config()
-            uart_patterns = current_test.get('uart_patterns', [])
+            # stop() ends the pattern waits early; their results do not count
+            if self._stop_event.is_set():
+                return self._end_stopped_cycle(cycle_result, cycle_start_ns)
             
-            # All patterns are required by default in new format
+            # Determine cycle success; all patterns are required by default in new format
             required_success = all(r.success for r in validation_results) if validation_results else True
             
             cycle_result['success'] = power_success and required_success
@@ -455,26 +846,81 @@ class PowerCycleTestRunner:
                 failed_patterns = [r.pattern_name for r in validation_results if not r.success]
                 cycle_result['errors'].append(f"Required patterns failed: {failed_patterns}")
             
-            cycle_end_time = datetime.now()
-            cycle_result['end_time'] = cycle_end_time
-            cycle_result['duration'] = cycle_end_time - cycle_start_time
+            cycle_result['duration'] = self._elapsed_since(cycle_start_ns)
+            cycle_result['end_time'] = cycle_start_time + cycle_result['duration']
             
             self.test_logger.end_cycle(cycle_number, cycle_result['success'])
             
-            self.logger.info(f"Cycle {cycle_number} completed: {'PASS' if cycle_result['success'] else 'FAIL'}")
+            self.logger.info("Cycle %s completed: %s", cycle_number, 'PASS' if cycle_result['success'] else 'FAIL')
             return cycle_result
             
         except Exception as e:
             self.logger.error(f"Cycle {cycle_number} failed with exception: {e}")
             cycle_result['errors'].append(str(e))
-            cycle_result['end_time'] = datetime.now()
-            cycle_result['duration'] = cycle_result['end_time'] - cycle_start_time
+            cycle_result['duration'] = self._elapsed_since(cycle_start_ns)
+            cycle_result['end_time'] = cycle_start_time + cycle_result['duration']
             
             self.test_logger.log_error(f"Cycle failed: {e}", cycle_number, e)
             self.test_logger.end_cycle(cycle_number, False)
             
             return cycle_result
     
+    def _end_stopped_cycle(self, cycle_result: Dict, cycle_start_ns: int) -> Dict:
+        """
+        Finish a cycle that stop() ended before it completed.
+        
+        The cycle is flagged as stopped rather than failed, so the reports do not
+        count an interrupted cycle as a hardware failure.
+        
+        :param cycle_result: Cycle result dictionary of the stopped cycle
+        :param cycle_start_ns: time.monotonic_ns() value at the start of the cycle
+        :return: The cycle result dictionary
+        """
+        cycle_number = cycle_result['cycle_number']
+        cycle_result['stopped'] = True
+        cycle_result['errors'].append("Test stopped")
+        cycle_result['duration'] = self._elapsed_since(cycle_start_ns)
+        cycle_result['end_time'] = cycle_result['start_time'] + cycle_result['duration']
+        
+        self.test_logger.end_cycle(cycle_number, False, stopped=True)
+        self.logger.info("Cycle %s stopped", cycle_number)
+        return cycle_result
+    
+    @staticmethod
+    def _cycle_counts(cycle_results: List[Dict]) -> Dict:
+        """
+        Count passed, failed and stopped cycles for a test summary.
+        
+        :param cycle_results: Cycle result dictionaries
+        :return: Summary counts; stopped cycles are left out of the success rate
+        """
+        successful_cycles = sum(1 for r in cycle_results if r['success'])
+        stopped_cycles = sum(1 for r in cycle_results if r.get('stopped'))
+        failed_cycles = len(cycle_results) - successful_cycles - stopped_cycles
+        counted_cycles = successful_cycles + failed_cycles
+        return {
+            'total_cycles': len(cycle_results),
+            'successful_cycles': successful_cycles,
+            'failed_cycles': failed_cycles,
+            'stopped_cycles': stopped_cycles,
+            'success_rate': successful_cycles / counted_cycles if counted_cycles else 0
+        }
+    
+    def _record_cycle_result(self, cycle_result: Dict):
+        """
+        Keep a cycle result for the reports and append it to the cycle result log.
+        
+        :param cycle_result: Finished cycle result dictionary
+        """
+        self.test_results.append(cycle_result)
+        
+        if self._cycle_sink:
+            try:
+                self._cycle_sink.write(dumps_cycle_result(cycle_result) + b'\n')
+                self._cycle_sink.flush()
+            except Exception as e:
+                self.logger.error(f"Failed to write cycle result: {e}")
+    
     def run_test(self) -> Dict:
         """
         Run the complete test suite.
@@ -486,7 +932,9 @@ class PowerCycleTestRunner:
             return {}
         
         self.is_running = True
+        self._stop_event.clear()
         test_start_time = datetime.now()
+        test_start_ns = time.monotonic_ns()
         
         try:
             self.logger.info("Starting automated power cycle and UART validation test")
@@ -500,18 +948,8 @@ class PowerCycleTestRunner:
             
             self.logger.info(f"Running {len(tests)} test(s)")
             
-            # Resolve all test configurations
-            resolved_tests = []
-            for test_config in tests:
-                try:
-                    if self.template_loader:
-                        resolved_config = self.template_loader.resolve_test_config(test_config)
-                        resolved_tests.append(resolved_config)
-                    else:
-                        resolved_tests.append(test_config)
-                except Exception as e:
-                    self.logger.error(f"Error resolving test template: {e}")
-                    resolved_tests.append(test_config)
+            # Resolve all test configurations, unless the interactive display already did
+            resolved_tests = self._ensure_tests_resolved()
             
             self.logger.info(f"Running {len(resolved_tests)} test(s)")
             
@@ -527,41 +965,46 @@ class PowerCycleTestRunner:
                 for cycle_num in range(1, total_cycles + 1):
                     self.current_cycle = cycle_num
                     
-                    self.logger.info(f"Running cycle {cycle_num}/{total_cycles}")
+                    self.logger.info("Running cycle %s/%s", cycle_num, total_cycles)
                     cycle_result = self.run_single_cycle(cycle_num)
                     cycle_result['test_name'] = test_name
                     cycle_result['test_index'] = test_index
-                    self.test_results.append(cycle_result)
+                    self._record_cycle_result(cycle_result)
                     
                     # Log cycle result
-                    status = "PASSED" if cycle_result['success'] else "FAILED"
-                    self.logger.info(f"Cycle {cycle_num} {status}")
+                    status = ("STOPPED" if cycle_result.get('stopped')
+                              else "PASSED" if cycle_result['success'] else "FAILED")
+                    self.logger.info("Cycle %s %s", cycle_num, status)
                     
                     # Add delay between cycles if specified
                     if cycle_num < total_cycles:
                         cycle_delay = test_config.get('cycle_delay', 2.0)
                         if cycle_delay > 0:
-                            time.sleep(cycle_delay)
+                            self._interruptible_sleep(cycle_delay)
+                    
+                    if self._stop_event.is_set():
+                        break
+                
+                if self._stop_event.is_set():
+                    self.logger.warning("Test stopped; reporting the cycles completed so far")
+                    break
             
             # Generate test summary
-            test_end_time = datetime.now()
-            test_duration = test_end_time - test_start_time
+            test_duration = self._elapsed_since(test_start_ns)
+            test_end_time = test_start_time + test_duration
             
-            successful_cycles = sum(1 for r in self.test_results if r['success'])
-            failed_cycles = len(self.test_results) - successful_cycles
+            # Copy each logger's UART data once; every report below shares it
+            uart_log_snapshots = [logger.get_log_data() for logger in self.uart_loggers]
             
             test_summary = {
                 'test_name': 'Multi-Test Suite',
-                'session_timestamp': datetime.now().strftime('%Y-%m-%d_%H-%M-%S'),
+                'session_timestamp': test_end_time.strftime('%Y-%m-%d_%H-%M-%S'),
                 'test_start_time': test_start_time.isoformat(),
                 'test_end_time': test_end_time.isoformat(),
                 'test_duration': str(test_duration),
                 'total_tests': len(tests),
-                'total_cycles': len(self.test_results),
-                'successful_cycles': successful_cycles,
-                'failed_cycles': failed_cycles,
-                'success_rate': successful_cycles / len(self.test_results) if self.test_results else 0,
-                'total_uart_data_points': sum(len(logger.get_log_data()) for logger in self.uart_loggers),
+                **self._cycle_counts(self.test_results),
+                'total_uart_data_points': sum(len(log_data) for log_data in uart_log_snapshots),
                 'total_validations': sum(len(r['validation_results']) for r in self.test_results),
                 'total_errors': sum(len(r['errors']) for r in self.test_results),
                 'cycle_details': self.test_results,
@@ -575,81 +1018,55 @@ class PowerCycleTestRunner:
             all_report_files = {}
             
             # Group results by test
-            test_results_by_test = {}
+            test_results_by_test = defaultdict(list)
             for result in self.test_results:
-                test_name = result.get('test_name', 'Unknown')
-                if test_name not in test_results_by_test:
-                    test_results_by_test[test_name] = []
-                test_results_by_test[test_name].append(result)
+                test_results_by_test[result.get('test_name', 'Unknown')].append(result)
+            
+            # Resolved test configurations by name; the first of a repeated name wins
+            resolved_by_name = {}
+            for test in resolved_tests:
+                resolved_by_name.setdefault(test.get('name'), test)
+            
+            # Report generator for each output format
+            report_generators = {
+                'json': self.report_generator.generate_json_report,
+                'csv': self.report_generator.generate_csv_report,
+                'text': self.report_generator.generate_text_report,
+                'html': self.report_generator.generate_html_report,
+                'comprehensive': self.report_generator.generate_comprehensive_report
+            }
             
             # Generate reports for each test
             for test_name, test_cycle_results in test_results_by_test.items():
                 # Find the resolved test configuration to get output format
-                test_config = None
-                for test in resolved_tests:
-                    if test.get('name') == test_name:
-                        test_config = test
-                        break
+                test_config = resolved_by_name.get(test_name)
                 
                 output_format = test_config.get('output_format', 'json') if test_config else 'json'
                 
                 # Create test-specific summary
                 test_summary_specific = test_summary.copy()
                 test_summary_specific['test_name'] = test_name
-                test_summary_specific['total_cycles'] = len(test_cycle_results)
-                test_summary_specific['successful_cycles'] = sum(1 for r in test_cycle_results if r['success'])
-                test_summary_specific['failed_cycles'] = len(test_cycle_results) - test_summary_specific['successful_cycles']
-                test_summary_specific['success_rate'] = test_summary_specific['successful_cycles'] / len(test_cycle_results) if test_cycle_results else 0
+                test_summary_specific.update(self._cycle_counts(test_cycle_results))
                 test_summary_specific['cycle_details'] = test_cycle_results
                 
-                # Generate reports based on output format
-                if output_format.lower() == 'json':
-                    report_files = self.report_generator.generate_json_report(
-                        test_summary_specific, 
-                        test_cycle_results,
-                        [logger.get_log_data() for logger in self.uart_loggers]
-                    )
-                    if report_files:
-                        all_report_files[f"{test_name}_json"] = report_files
-                elif output_format.lower() == 'csv':
-                    report_files = self.report_generator.generate_csv_report(
-                        test_summary_specific, 
-                        test_cycle_results,
-                        [logger.get_log_data() for logger in self.uart_loggers]
-                    )
-                    if report_files:
-                        all_report_files[f"{test_name}_csv"] = report_files
-                elif output_format.lower() == 'text':
-                    report_files = self.report_generator.generate_text_report(
-                        test_summary_specific, 
-                        test_cycle_results,
-                        [logger.get_log_data() for logger in self.uart_loggers]
-                    )
-                    if report_files:
-                        all_report_files[f"{test_name}_text"] = report_files
-                elif output_format.lower() == 'html':
-                    report_files = self.report_generator.generate_html_report(
-                        test_summary_specific, 
-                        test_cycle_results,
-                        [logger.get_log_data() for logger in self.uart_loggers]
-                    )
-                    if report_files:
-                        all_report_files[f"{test_name}_html"] = report_files
-                else:
-                    # Default to comprehensive report
-                    report_files = self.report_generator.generate_comprehensive_report(
-                        test_summary_specific, 
-                        test_cycle_results,
-                        [logger.get_log_data() for logger in self.uart_loggers]
-                    )
-                    if report_files:
-                        all_report_files[f"{test_name}_comprehensive"] = report_files
+                # Generate reports based on output format; anything else gets the
+                # comprehensive report
+                report_format = output_format.lower()
+                if report_format not in report_generators:
+                    report_format = 'comprehensive'
+                report_files = report_generators[report_format](
+                    test_summary_specific, 
+                    test_cycle_results,
+                    uart_log_snapshots
+                )
+                if report_files:
+                    all_report_files[f"{test_name}_{report_format}"] = report_files
             
             # Also generate overall comprehensive report
             comprehensive_report_files = self.report_generator.generate_comprehensive_report(
                 test_summary, 
                 self.test_results,
-                [logger.get_log_data() for logger in self.uart_loggers]
+                uart_log_snapshots
             )
             if comprehensive_report_files:
                 all_report_files['overall_comprehensive'] = comprehensive_report_files
@@ -668,8 +1085,40 @@ class PowerCycleTestRunner:
             self.is_running = False
             self.test_logger.end_test()
     
-    def run_interactive_test(self):
-        """Run test in interactive mode with user prompts."""
+    def _prompt_yn(self, prompt: str, timeout: Optional[float] = None) -> bool:
+        """
+        Ask the user a yes/no question on the console.
+        
+        :param prompt: Question to print
+        :param timeout: Seconds to wait for an answer before taking it as no;
+            None waits indefinitely. Only applies on POSIX platforms, where stdin
+            can be polled; elsewhere the prompt waits for the answer.
+        :return: True if the user answered 'y'
+        """
+        if timeout is not None and os.name == 'posix':
+            print(prompt, end='', flush=True)
+            try:
+                with selectors.DefaultSelector() as selector:
+                    selector.register(sys.stdin, selectors.EVENT_READ)
+                    answered = bool(selector.select(timeout))
+            except (ValueError, OSError):
+                # stdin cannot be polled (e.g. replaced by a non-file stream)
+                answered = True
+            
+            if not answered:
+                print(f"\nNo answer within {timeout}s.")
+                return False
+            prompt = ""
+        
+        return input(prompt).lower().strip() == 'y'
+    
+    def run_interactive_test(self, prompt_timeout: Optional[float] = None):
+        """
+        Run test in interactive mode with user prompts.
+        
+        :param prompt_timeout: Seconds to wait for the start confirmation before
+            cancelling; None waits indefinitely
+        """
         print("=" * 60)
         print("Automated Power Cycle and UART Validation Framework")
         print("=" * 60)
@@ -684,18 +1133,8 @@ class PowerCycleTestRunner:
             print(f"\nTest Configuration:")
             print(f"  Number of Tests: {len(tests)}")
             
-            # Resolve test configurations for display
-            resolved_tests = []
-            for test_config in tests:
-                try:
-                    if self.template_loader:
-                        resolved_config = self.template_loader.resolve_test_config(test_config)
-                        resolved_tests.append(resolved_config)
-                    else:
-                        resolved_tests.append(test_config)
-                except Exception as e:
-                    print(f"  Warning: Error resolving test template: {e}")
-                    resolved_tests.append(test_config)
+            # Resolve test configurations for display; run_test reuses them
+            resolved_tests = self._ensure_tests_resolved()
             
             for i, test in enumerate(resolved_tests):
                 print(f"\nTest {i+1}: {test.get('name', 'N/A')}")
@@ -721,14 +1160,13 @@ class PowerCycleTestRunner:
             
             # Display available templates if template loader is available
             if self.template_loader:
-                available_templates = self.template_loader.get_available_templates()
+                available_templates = self._available_templates
                 print(f"\nAvailable Test Templates ({len(available_templates)}):")
                 for template in available_templates:
                     print(f"  - {template}")
             
             # Confirm test start
-            response = input(f"\nStart test? (y/n): ").lower().strip()
-            if response != 'y':
+            if not self._prompt_yn("\nStart test? (y/n): ", prompt_timeout):
                 print("Test cancelled by user.")
                 return
             
@@ -77,6 +77,48 @@ class TestTemplateLoader:
         self.logger.debug(f"Resolved test '{template_name}': {resolved_config}")
         return resolved_config
     
+    def resolve_test_configs(self, test_configs: List[Dict]) -> List[Dict]:
+        """
+        Resolve several test configurations, applying each template only once.
+        
+        A configuration that cannot be resolved is logged and returned as given.
+        
+        :param test_configs: Test configuration dictionaries
+        :return: Resolved test configurations, in the given order
+        """
+        # Defaults with each template applied, by template name
+        template_bases = {}
+        resolved_configs = []
+        
+        for test_config in test_configs:
+            template_name = test_config.get('name')
+            try:
+                if not template_name:
+                    raise ValueError("Test configuration must have a 'name' field")
+                
+                base_config = template_bases.get(template_name)
+                if base_config is None:
+                    template = self.templates.get(template_name)
+                    if not template:
+                        raise ValueError(f"Test template '{template_name}' not found")
+                    base_config = self.defaults.copy()
+                    base_config.update(template)
+                    template_bases[template_name] = base_config
+                
+                # Apply test-specific overrides, keeping the template name
+                resolved_config = base_config.copy()
+                resolved_config.update(test_config)
+                resolved_config['name'] = template_name
+                resolved_configs.append(resolved_config)
+                
+            except Exception as e:
+                self.logger.error(f"Error resolving test template: {e}")
+                resolved_configs.append(test_config)
+        
+        self.logger.debug("Resolved %d test configurations from %d templates",
+                          len(resolved_configs), len(template_bases))
+        return resolved_configs
+    
     def get_available_templates(self) -> List[str]:
         """
         Get list of available test template names.
@@ -1,4 +1,6 @@
 import serial
+import os
+import select
 import time
 import threading
 import queue
@@ -7,6 +9,13 @@ from datetime import datetime
 import logging
 
 
+# Most bytes taken from the serial port's file descriptor per read
+UART_READ_SIZE = 64 * 1024
+
+# How long a read waits for data, so the logging thread notices stop_logging
+UART_READ_WAIT_S = 0.1
+
+
 class UARTHandler:
     """
     Handles UART communication for logging and pattern detection.
@@ -86,39 +95,77 @@ class UARTHandler:
     
     def _log_data(self):
         """Internal method for continuous data logging."""
-        buffer = ""
+        buffer = b""
+        fd = self._serial_fd()
         
         while self.is_logging:
             try:
-                if self.serial_conn.in_waiting > 0:
-                    data = self.serial_conn.read(self.serial_conn.in_waiting).decode('utf-8', errors='ignore')
-                    buffer += data
+                chunk = self._read_available(fd)
+                if b'\n' not in chunk:
+                    buffer += chunk
+                    continue
+                
+                # Split off every complete line at once; the rest waits for its newline
+                *lines, buffer = (buffer + chunk).split(b'\n')
+                data = chunk.decode('utf-8', errors='ignore')
+                timestamp = datetime.now()
+                
+                for line in lines:
+                    line = line.decode('utf-8', errors='ignore').strip()
                     
-                    # Process complete lines
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
-                        line = line.strip()
+                    if line:
+                        log_entry = {
+                            'timestamp': timestamp,
+                            'data': line,
+                            'raw_data': data
+                        }
                         
-                        if line:
-                            timestamp = datetime.now()
-                            log_entry = {
-                                'timestamp': timestamp,
-                                'data': line,
-                                'raw_data': data
-                            }
-                            
-                            # Add to queue for processing
-                            self.data_queue.put(log_entry)
-                            
-                            # Check patterns
-                            self._check_patterns(line, timestamp)
-                            
-                time.sleep(0.01)  # Small delay to prevent excessive CPU usage
+                        # Add to queue for processing
+                        self.data_queue.put(log_entry)
+                        
+                        # Check patterns
+                        self._check_patterns(line, timestamp)
                 
             except Exception as e:
                 self.logger.error(f"Error in UART logging thread: {e}")
                 break
     
+    def _serial_fd(self) -> Optional[int]:
+        """
+        Get the file descriptor of the serial port when it can be read directly.
+        
+        :return: File descriptor on POSIX platforms, or None to read through pyserial
+        """
+        if os.name != 'posix':
+            return None
+        try:
+            return self.serial_conn.fileno()
+        except (AttributeError, OSError, ValueError):
+            return None
+    
+    def _read_available(self, fd: Optional[int]) -> bytes:
+        """
+        Read the bytes received so far, waiting briefly for some to arrive.
+        
+        :param fd: File descriptor from _serial_fd, or None to poll through pyserial
+        :return: Received bytes, empty if none arrived
+        """
+        if fd is not None:
+            # One select and one os.read take everything the driver has buffered
+            ready, _, _ = select.select([fd], [], [], UART_READ_WAIT_S)
+            if not ready:
+                return b''
+            data = os.read(fd, UART_READ_SIZE)
+            if not data:
+                # Readable with no data: the device went away
+                raise serial.SerialException("device reports readiness to read but returned no data")
+            return data
+        
+        if self.serial_conn.in_waiting > 0:
+            return self.serial_conn.read(self.serial_conn.in_waiting)
+        time.sleep(0.01)  # Small delay to prevent excessive CPU usage
+        return b''
+    
     def _check_patterns(self, data: str, timestamp: datetime):
         """Check data against registered patterns."""
         for callback in self.pattern_callbacks:
@@ -232,6 +279,8 @@ class UARTDataLogger:
         self.log_file = log_file
         self.logger = logging.getLogger(__name__ + ".DataLogger")
         self.log_data = []
+        # Log file stream, opened with the first line and kept open until close()
+        self._log_stream = None
         
         # Register callback for data logging
         self.uart_handler.register_pattern_callback(self._log_data_callback)
@@ -249,11 +298,19 @@ class UARTDataLogger:
         # Write to file if specified
         if self.log_file:
             try:
-                with open(self.log_file, 'a', encoding='utf-8') as f:
-                    f.write(f"{timestamp.isoformat()},{log_entry['cycle_number']},{data}\n")
+                if self._log_stream is None:
+                    # Line buffered: each line still reaches the file as it is logged
+                    self._log_stream = open(self.log_file, 'a', encoding='utf-8', buffering=1)
+                self._log_stream.write(f"{timestamp.isoformat()},{log_entry['cycle_number']},{data}\n")
             except Exception as e:
                 self.logger.error(f"Failed to write to log file: {e}")
     
+    def close(self):
+        """Close the log file; a later line opens it again."""
+        if self._log_stream is not None:
+            self._log_stream.close()
+            self._log_stream = None
+    
     def set_cycle_number(self, cycle_number: int):
         """Set current cycle number for logging."""
         self.current_cycle = cycle_number
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Test Script for Test Runner UART Pattern Preparation
+This script checks the UART patterns the runner prepares when it resolves its
+tests: shared compiled regexes, stream indexes, expected-value matching and the
+pattern timeout while the device stabilizes.
+"""
+
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add the libs directory to the path
+sys.path.append(str(Path(__file__).parent.parent / "libs"))
+
+from libs.test_runner import PowerCycleTestRunner
+
+PATTERNS = [
+    {"regex": r"BOOT v(\d+)\.(\d+)", "expected": [["1", "2"], 3]},
+    {"regex": r"READY", "stream": 1},
+    {"regex": r"BAD ("},
+]
+
+
+def make_runner(config_dir, tests):
+    """Create a runner for a configuration file holding the given tests."""
+    config_file = os.path.join(config_dir, "config.json")
+    with open(config_file, "w", encoding="utf-8") as f:
+        json.dump({"tests": tests, "output": {"log_directory": config_dir}}, f)
+    # With a logging setup in place the runner adds no log file of its own
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=logging.WARNING)
+    return PowerCycleTestRunner(config_file)
+
+
+def reference_matches(extracted_groups, expected_values):
+    """Match extracted groups against expected values with the original nested loop."""
+    for expected_set in expected_values:
+        if isinstance(expected_set, list):
+            if len(extracted_groups) >= len(expected_set):
+                if all(str(extracted_groups[j]) == str(expected_set[j]) for j in range(len(expected_set))):
+                    return True
+        else:
+            if str(extracted_groups[0]) == str(expected_set):
+                return True
+    return False
+
+
+def test_prepared_patterns_share_compiled_regexes():
+    """Tests using the same regex share its compiled pattern; the configuration is left as it is."""
+    print("\n=== Prepared Pattern Test ===")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        tests = [{"name": "first", "uart_patterns": PATTERNS},
+                 {"name": "second", "uart_patterns": PATTERNS[:1]}]
+        runner = make_runner(config_dir, tests)
+        runner._ensure_tests_resolved()
+
+        first, second = runner._test_patterns
+        assert first[0]["_compiled"] is second[0]["_compiled"]
+        assert first[0]["_compiled"].search("BOOT v1.2").groups() == ("1", "2")
+        assert first[0]["_expected_by_length"] == [(1, frozenset({("3",)})),
+                                                   (2, frozenset({("1", "2")}))]
+        # The invalid regex is left to the pattern validator to report
+        assert first[2]["_compiled"] is None
+        assert first[2]["_old_fmt"]["pattern"] == r"BAD ("
+        assert all("_compiled" not in pattern for pattern in runner.config["tests"][0]["uart_patterns"])
+        print("✅ Compiled regexes shared and configuration left unchanged")
+
+
+def test_stream_indexes_are_checked():
+    """Stream indexes past the UART loggers, or not integers, fall back to the first logger."""
+    print("\n=== Pattern Stream Test ===")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        patterns = [{"regex": "A", "stream": 1}, {"regex": "B", "stream": 2},
+                    {"regex": "C", "stream": "1"}, {"regex": "D", "stream": True},
+                    {"regex": "E", "stream": -1}, {"regex": "F"}]
+        runner = make_runner(config_dir, [{"name": "streams", "uart_patterns": patterns}])
+        runner.uart_handlers = [object(), object()]
+        runner._ensure_tests_resolved()
+
+        streams = [pattern["stream"] for pattern in runner._test_patterns[0]]
+        assert streams == [1, 0, 0, 0, 0, 0], streams
+        print(f"✅ Stream indexes checked: {streams}")
+
+
+def test_expected_matching_matches_nested_loop():
+    """Grouped expected-value lookups give the same results as the original nested loop."""
+    print("\n=== Expected Value Test ===")
+
+    rng = random.Random(1234)
+    values = ["1", "2", "10", 1, 2, 10, "x", 1.5, "1.5"]
+    checked = 0
+    for _ in range(5000):
+        expected_values = [
+            [rng.choice(values) for _ in range(rng.randint(0, 3))] if rng.random() < 0.7
+            else rng.choice(values)
+            for _ in range(rng.randint(1, 4))
+        ]
+        extracted_groups = [rng.choice(values) for _ in range(rng.randint(1, 4))]
+        expected_by_length = PowerCycleTestRunner._group_expected_values(expected_values)
+        actual = PowerCycleTestRunner._matches_expected(extracted_groups, expected_by_length)
+        expected = reference_matches(extracted_groups, expected_values)
+        assert actual == expected, f"{extracted_groups} vs {expected_values}: {actual} != {expected}"
+        checked += 1
+    print(f"✅ {checked} random cases matched alike")
+
+
+class RecordingValidator:
+    """Pattern validator stand-in that records the timeouts it is given."""
+
+    def __init__(self):
+        self.timeouts = []
+
+    def wait_for_regex_in_stream(self, uart_handler, pattern_name, compiled_pattern, timeout,
+                                 stop_event=None):
+        self.timeouts.append(timeout)
+        return None
+
+
+def test_settle_time_extends_pattern_timeout():
+    """A pattern wait that starts while the device stabilizes gets the rest of that time added."""
+    print("\n=== Settle Time Test ===")
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        runner = make_runner(config_dir, [{"name": "settle", "uart_patterns": PATTERNS[:1]}])
+        runner._ensure_tests_resolved()
+        runner.pattern_validator = RecordingValidator()
+        pattern_config = runner._test_patterns[0][0]
+
+        runner._wait_for_pattern(None, "pattern_0", pattern_config, 2.0, time.monotonic() + 1.0)
+        runner._wait_for_pattern(None, "pattern_0", pattern_config, 2.0, time.monotonic() - 1.0)
+        runner._wait_for_pattern(None, "pattern_0", pattern_config, 2.0)
+
+        settling, settled, no_settle = runner.pattern_validator.timeouts
+        assert 2.9 <= settling <= 3.0, settling
+        assert settled == 2.0 and no_settle == 2.0, (settled, no_settle)
+        print(f"✅ Timeouts {settling}, {settled} and {no_settle} seconds")
+
+
+if __name__ == "__main__":
+    print("Test Runner UART Pattern Test Suite")
+    print("=" * 50)
+
+    test_prepared_patterns_share_compiled_regexes()
+    test_stream_indexes_are_checked()
+    test_expected_matching_matches_nested_loop()
+    test_settle_time_extends_pattern_timeout()
+    print("\n🎉 All tests completed successfully!")
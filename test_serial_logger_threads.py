@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Test Script for the Serial Logger Fast Paths
+This script checks the fused pattern scanner against plain per-pattern matching,
+and the background log writer and file descriptor reader threads.
+"""
+
+import os
+import re
+import sys
+import random
+import tempfile
+import threading
+import time
+from pathlib import Path
+from datetime import datetime
+
+# Add the libs directory to the path
+sys.path.append(str(Path(__file__).parent.parent / "libs"))
+
+from libs.serial_logger import SerialDataParser, SerialLogger
+
+# Anchored patterns, so the parser fuses them into one scanner; several have
+# optional groups that are None when they do not take part in the match
+FUSED_PATTERNS = [
+    {"name": "voltage", "regex": r"^V(\d)=(\d+\.\d+)(?:V|(mV))?", "type": "float",
+     "extract_groups": [2, 3], "labels": ["voltage", "unit"]},
+    {"name": "status", "regex": r"^STATUS:\s*(\w+)(?:,\s*code=(\d+))?", "type": "string",
+     "extract_groups": [1, 2], "labels": ["state", "code"]},
+    {"name": "counter", "regex": r"^CNT (\d+)(?: of (\d+))?", "type": "int",
+     "extract_groups": [1], "labels": ["count"]},
+    {"name": "pair", "regex": r"^(?P<key>[a-z]+)=(?P<value>[a-z0-9]*)(;)?", "type": "string",
+     "extract_groups": [1, 2, 3, 9]},
+    {"name": "error", "regex": r"^(?:ERR|ERROR) (\d+)(?:: (.*))?", "type": "error",
+     "extract_groups": [1, 2], "labels": ["error_code", "message"]},
+    {"name": "any_status", "regex": r"^STATUS", "type": "string", "extract_groups": []},
+]
+
+SAMPLE_LINES = [
+    "V1=3.30V", "V2=12.000mV", "V3=5.0", "V3=5.0 extra",
+    "STATUS: OK", "STATUS: FAIL, code=42", "STATUS:", "STATUS:  ",
+    "CNT 17", "CNT 17 of 20", "CNT x",
+    "abc=def;", "abc=", "key=value tail",
+    "ERR 5", "ERROR 12: brown-out detected", "ERR x",
+    "", "no match here", "  V1=3.30V",
+]
+
+
+def reference_parse(patterns, data):
+    """
+    Parse a line the plain way: re.search each pattern in configuration order.
+
+    As in the original parser, converting an optional float or int group that did
+    not take part in the match raises TypeError.
+    """
+    for pattern in patterns:
+        match = re.search(pattern["regex"], data)
+        if match:
+            parsed_data = {}
+            labels = pattern.get("labels", [])
+            for i, group_index in enumerate(pattern.get("extract_groups", [])):
+                if group_index <= len(match.groups()):
+                    value = match.group(group_index)
+                    if pattern["type"] in ("float", "int"):
+                        try:
+                            value = (float if pattern["type"] == "float" else int)(value)
+                        except ValueError:
+                            pass
+                    key = labels[i] if i < len(labels) else f"group_{group_index}"
+                    parsed_data[key] = value
+            return pattern["name"], pattern["type"], data.strip(), parsed_data
+    return None
+
+
+def random_lines(count):
+    """Generate lines built from fragments of the sample lines."""
+    rng = random.Random(1234)
+    fragments = SAMPLE_LINES + ["V", "=", "1", "0.5", "mV", ",", " code=", "of 3", ";", ":", " "]
+    return ["".join(rng.choice(fragments) for _ in range(rng.randint(1, 4))) for _ in range(count)]
+
+
+def test_fused_scanner_matches_per_pattern_search():
+    """The fused scanner finds the same pattern and groups as per-pattern re.search."""
+    print("\n=== Fused Scanner Test ===")
+
+    for cache_size in (0, 1024):
+        config = {"data_parsing": {"patterns": FUSED_PATTERNS, "parse_cache_size": cache_size}}
+        parser = SerialDataParser(config)
+        assert parser._fused is not None, "anchored patterns should be fused into one scanner"
+
+        timestamp = datetime.now()
+        lines = SAMPLE_LINES + random_lines(2000)
+        for line in lines:
+            try:
+                expected = reference_parse(FUSED_PATTERNS, line)
+            except TypeError:
+                try:
+                    parser.parse_line(line, timestamp)
+                except TypeError:
+                    continue
+                raise AssertionError(f"{line!r} should fail to convert a missing group")
+
+            result = parser.parse_line(line, timestamp)
+            if expected is None:
+                assert result is None, f"{line!r} should not match, got {result}"
+                continue
+
+            assert result is not None, f"{line!r} should match {expected[0]}"
+            actual = (result["pattern_name"], result["pattern_type"], result["raw_data"],
+                      result["parsed_data"])
+            assert actual == expected, f"{line!r}: {actual} != {expected}"
+
+        print(f"✅ {len(lines)} lines matched alike (parse_cache_size={cache_size})")
+
+
+def test_writer_thread_flushes_on_stop():
+    """stop_logging writes every record the background writer still has queued."""
+    print("\n=== Log Writer Test ===")
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        config = {
+            "serial": {"port": "unused", "baud": 115200},
+            # A long flush interval leaves flushing to stop_logging
+            "logging": {"log_directory": log_dir, "durability": "batched",
+                        "flush_interval_s": 60.0, "console_output": "none"},
+        }
+        serial_logger = SerialLogger(config)
+        assert serial_logger.setup_log_file()
+        serial_logger._start_writer()
+        assert serial_logger._writer_thread is not None, "batched durability should start the writer"
+
+        records = [f"line {i:05d}" for i in range(5000)]
+        for i, record in enumerate(records):
+            serial_logger._write_log_record(f"ts{i}", record)
+        log_file_path = serial_logger.get_log_file()
+        serial_logger.stop_logging()
+
+        assert serial_logger._writer_thread is None
+        with open(log_file_path, "r", encoding="utf-8") as f:
+            written = f.read().splitlines()
+        assert written == [f"ts{i},{record}" for i, record in enumerate(records)]
+        print(f"✅ {len(written)} records written before the log file closed")
+
+
+def test_fd_reader_joins_line_split_across_reads():
+    """A line that arrives in two reads of the serial port is logged and parsed whole."""
+    print("\n=== Serial fd Reader Test ===")
+
+    if os.name != "posix":
+        print("Skipped: the fd reader is only used on POSIX platforms")
+        return
+    import pty
+
+    master, slave = pty.openpty()
+    try:
+        with tempfile.TemporaryDirectory() as log_dir:
+            config = {
+                "serial": {"port": os.ttyname(slave), "baud": 115200, "timeout": 0.05},
+                "logging": {"log_directory": log_dir, "durability": "batched",
+                            "console_output": "none"},
+                "data_parsing": {"patterns": [
+                    {"name": "line", "regex": r"^(\w+) (\w+)", "type": "string",
+                     "extract_groups": [1, 2], "labels": ["first", "second"]},
+                ]},
+            }
+            serial_logger = SerialLogger(config, parse_data=True)
+            errors = []
+
+            def run():
+                try:
+                    serial_logger.start_logging()
+                except Exception as e:
+                    errors.append(e)
+
+            reader = threading.Thread(target=run, daemon=True)
+            reader.start()
+
+            # The first line arrives in two reads, with a pause between them
+            # shorter than the port timeout
+            time.sleep(0.3)
+            os.write(master, b"hello wo")
+            time.sleep(0.02)
+            os.write(master, b"rld\r\nsecond line\n")
+
+            deadline = time.monotonic() + 5.0
+            while len(serial_logger.parsed_columns) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            # The port was read through its file descriptor, not through pyserial
+            assert isinstance(serial_logger._serial_fd(), int)
+            log_file_path = serial_logger.get_log_file()
+            serial_logger.stop_logging()
+            reader.join(timeout=5.0)
+
+            assert not errors, errors
+            parsed = [entry["parsed_data"] for entry in serial_logger.get_parsed_data(copy=True)]
+            assert parsed == [{"first": "hello", "second": "world"},
+                              {"first": "second", "second": "line"}], parsed
+
+            with open(log_file_path, "r", encoding="utf-8") as f:
+                logged = [line.split(",", 1)[1] for line in f.read().splitlines()]
+            assert logged == ["hello world", "second line"], logged
+            print("✅ Split line reassembled, logged and parsed")
+    finally:
+        os.close(master)
+        os.close(slave)
+
+
+if __name__ == "__main__":
+    print("Serial Logger Fast Path Test Suite")
+    print("=" * 50)
+
+    test_fused_scanner_matches_per_pattern_search()
+    test_writer_thread_flushes_on_stop()
+    test_fd_reader_joins_line_split_across_reads()
+    print("\n🎉 All tests completed successfully!")
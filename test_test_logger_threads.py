@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Test Script for the Test Logger Log Thread
+This script checks that log entries written by several threads at once reach the
+log files in order, what happens when a log queue is full, and that records
+logged after the test ends are still written.
+"""
+
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+# Add the libs directory to the path
+sys.path.append(str(Path(__file__).parent.parent / "libs"))
+
+from libs.test_logger import TestLogger
+
+PRODUCERS = 4
+ENTRIES_PER_PRODUCER = 5000
+
+
+def make_test_logger(log_dir, **output):
+    """Create a TestLogger writing to log_dir, with a cycle started."""
+    output["log_directory"] = log_dir
+    test_logger = TestLogger({"output": output}, "threads")
+    test_logger.start_test()
+    test_logger.start_cycle(1)
+    return test_logger
+
+
+def logged_uart_data(log_dir):
+    """UART data in the log thread's lines of the UART log, in file order."""
+    data = []
+    for log_file in Path(log_dir).glob("uart_*.log"):
+        with open(log_file, "r", encoding="utf-8") as f:
+            for line in f:
+                # timestamp,cycle,uart,data,{"data_length":n}
+                fields = line.rstrip("\n").split(",", 3)
+                if len(fields) == 4 and fields[2] == "uart":
+                    data.append(fields[3].rsplit(",", 1)[0])
+    return data
+
+
+def read_log_file(log_dir, prefix):
+    """Text of the log file whose name starts with prefix."""
+    log_files = list(Path(log_dir).glob(f"{prefix}_*.log"))
+    assert len(log_files) == 1, log_files
+    return log_files[0].read_text(encoding="utf-8")
+
+
+def produce(test_logger, producer, count):
+    """Log count UART lines tagged with the producer number."""
+    for i in range(count):
+        test_logger.log_uart_data(f"p{producer}-{i:05d}", 1)
+
+
+def run_producers(test_logger, count):
+    """Log count UART lines from each of several threads at once."""
+    threads = [threading.Thread(target=produce, args=(test_logger, producer, count))
+               for producer in range(PRODUCERS)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+
+def test_producers_keep_their_order():
+    """Every entry of every producer is written once, in the order it was logged."""
+    print("\n=== Multi-Producer Order Test ===")
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        test_logger = make_test_logger(log_dir)
+        run_producers(test_logger, ENTRIES_PER_PRODUCER)
+        test_logger.end_cycle(1)
+        summary = test_logger.get_test_summary()
+        test_logger.end_test()
+
+        assert summary["dropped_log_entries"] == 0
+        logged = logged_uart_data(log_dir)
+        assert len(logged) == PRODUCERS * ENTRIES_PER_PRODUCER, len(logged)
+        for producer in range(PRODUCERS):
+            tag = f"p{producer}-"
+            own = [data for data in logged if data.startswith(tag)]
+            assert own == [f"{tag}{i:05d}" for i in range(ENTRIES_PER_PRODUCER)], \
+                f"producer {producer} entries out of order or missing"
+        print(f"✅ {len(logged)} entries from {PRODUCERS} threads written in order")
+
+
+def fill_blocked_queue(test_logger, extra):
+    """
+    Log more UART lines than the queue holds while the log file is busy.
+
+    Holding the UART log's lock keeps both direct writes and the log thread
+    away from the file, so the queue fills up.
+
+    :return: The producer thread, still running, and the number of lines it logs
+    """
+    queue_max = test_logger._log_queue_max
+    count = queue_max + extra
+    lock = test_logger._log_locks["uart"]
+    with lock:
+        producer = threading.Thread(target=produce, args=(test_logger, 0, count))
+        producer.start()
+        deadline = time.monotonic() + 5.0
+        while len(test_logger.log_queues["uart"]) < queue_max and time.monotonic() < deadline:
+            time.sleep(0.001)
+        assert len(test_logger.log_queues["uart"]) == queue_max
+        # The producer is now waiting, either for room or to count a drop
+        time.sleep(0.05)
+        assert producer.is_alive()
+    return producer, count
+
+
+def test_full_queue_drops_and_counts():
+    """With the drop policy, entries logged into a full queue are counted and warned about once."""
+    print("\n=== Full Queue Drop Test ===")
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        test_logger = make_test_logger(log_dir, log_queue_max=50, log_queue_policy="drop")
+        producer, count = fill_blocked_queue(test_logger, extra=200)
+        producer.join(timeout=5.0)
+        test_logger.end_cycle(1)
+        dropped = test_logger.get_test_summary()["dropped_log_entries"]
+        test_logger.end_test()
+
+        logged = logged_uart_data(log_dir)
+        assert dropped >= 1, "the entry logged into the full queue should be dropped"
+        assert len(logged) + dropped == count, (len(logged), dropped, count)
+        # Whatever was kept is still in order
+        assert logged == sorted(logged)
+        warnings = read_log_file(log_dir, "threads").count("uart log queue is full")
+        assert warnings == 1, f"expected one warning about the full queue, got {warnings}"
+        print(f"✅ {dropped} of {count} entries dropped, counted and warned about once")
+
+
+def test_full_queue_blocks():
+    """With the block policy, a full queue makes the producer wait and nothing is lost."""
+    print("\n=== Full Queue Block Test ===")
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        test_logger = make_test_logger(log_dir, log_queue_max=50, log_queue_policy="block")
+        producer, count = fill_blocked_queue(test_logger, extra=200)
+        producer.join(timeout=5.0)
+        assert not producer.is_alive()
+        test_logger.end_cycle(1)
+        dropped = test_logger.get_test_summary()["dropped_log_entries"]
+        test_logger.end_test()
+
+        assert dropped == 0
+        assert logged_uart_data(log_dir) == [f"p0-{i:05d}" for i in range(count)]
+        print(f"✅ All {count} entries written after waiting for room")
+
+
+def test_unknown_queue_policy_is_rejected():
+    """An unknown output.log_queue_policy is a configuration error."""
+    print("\n=== Queue Policy Config Test ===")
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        try:
+            TestLogger({"output": {"log_directory": log_dir, "log_queue_policy": "oldest"}})
+        except ValueError as e:
+            print(f"✅ Rejected: {e}")
+        else:
+            raise AssertionError("log_queue_policy 'oldest' should be rejected")
+
+
+def test_records_after_end_test_are_written():
+    """Records logged after end_test go straight to the log files, once each."""
+    print("\n=== Log Listener Handoff Test ===")
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        test_logger = make_test_logger(log_dir)
+        test_logger.test_logger.info("before the end")
+        test_logger.end_cycle(1)
+        test_logger.end_test()
+        test_logger.test_logger.info("after the end")
+        # A repeated end_test must not attach the handlers a second time
+        test_logger.end_test()
+        test_logger.test_logger.info("after the second end")
+        for handler in test_logger._log_handlers:
+            handler.flush()
+
+        text = read_log_file(log_dir, "threads")
+        for message in ("before the end", "after the end", "after the second end"):
+            assert text.count(message) == 1, f"{message!r} logged {text.count(message)} times"
+        print("✅ Records before and after end_test written once each")
+
+
+if __name__ == "__main__":
+    print("Test Logger Log Thread Test Suite")
+    print("=" * 50)
+
+    test_producers_keep_their_order()
+    test_full_queue_drops_and_counts()
+    test_full_queue_blocks()
+    test_unknown_queue_policy_is_rejected()
+    test_records_after_end_test_are_written()
+    print("\n🎉 All tests completed successfully!")